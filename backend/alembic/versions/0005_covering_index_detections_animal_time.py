@@ -0,0 +1,47 @@
+"""Covering index for per-animal detection reads
+
+Revision ID: b7e4c1d9a2f3
+Revises: a1b2c3d4e5f6
+Create Date: 2026-02-20 10:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "b7e4c1d9a2f3"
+down_revision: Union[str, None] = "a1b2c3d4e5f6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # (animal_id, timestamp DESC) INCLUDE (confidence, class_id)
+    # → "recent detections of animal X" becomes an index-only scan.
+    op.drop_index("ix_detections_animal_time", table_name="detections")
+    op.create_index(
+        "ix_detections_animal_time",
+        "detections",
+        ["animal_id", sa.text('"timestamp" DESC')],
+        postgresql_include=["confidence", "class_id"],
+    )
+
+    # Index-only scans skip the heap only for pages marked all-visible.
+    # detections is append-only, so vacuum on inserts (PG13+) and analyze
+    # often enough to keep the visibility map and planner stats fresh.
+    op.execute(
+        "ALTER TABLE detections SET ("
+        "autovacuum_vacuum_insert_scale_factor = 0.02, "
+        "autovacuum_vacuum_scale_factor = 0.05, "
+        "autovacuum_analyze_scale_factor = 0.02)"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE detections RESET ("
+        "autovacuum_vacuum_insert_scale_factor, "
+        "autovacuum_vacuum_scale_factor, "
+        "autovacuum_analyze_scale_factor)"
+    )
+    op.drop_index("ix_detections_animal_time", table_name="detections")
+    op.create_index("ix_detections_animal_time", "detections", ["animal_id", "timestamp"])
@@ -0,0 +1,41 @@
+"""Trim per-insert index maintenance on detections
+
+Revision ID: c3f8a0e6d514
+Revises: b7e4c1d9a2f3
+Create Date: 2026-02-20 11:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = "c3f8a0e6d514"
+down_revision: Union[str, None] = "b7e4c1d9a2f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Prefixes of ix_detections_animal_time / ix_detections_camera_time
+    op.drop_index("ix_detections_animal_id",  table_name="detections")
+    op.drop_index("ix_detections_camera_id",  table_name="detections")
+    # Low-selectivity, not used by any query path
+    op.drop_index("ix_detections_confidence", table_name="detections")
+    # No query filters by class_id; build it on demand for offline analytics
+    op.drop_index("ix_detections_class_time", table_name="detections")
+
+    # Rows arrive in timestamp order → BRIN instead of a B-tree
+    op.drop_index("ix_detections_timestamp",  table_name="detections")
+    op.create_index(
+        "ix_detections_timestamp",
+        "detections",
+        ["timestamp"],
+        postgresql_using="brin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_detections_timestamp",    table_name="detections")
+    op.create_index("ix_detections_timestamp",   "detections", ["timestamp"])
+    op.create_index("ix_detections_class_time",  "detections", ["class_id",  "timestamp"])
+    op.create_index("ix_detections_confidence",  "detections", ["confidence"])
+    op.create_index("ix_detections_camera_id",   "detections", ["camera_id"])
+    op.create_index("ix_detections_animal_id",   "detections", ["animal_id"])
@@ -0,0 +1,49 @@
+"""Descending covering index for per-camera detection reads
+
+Revision ID: e5a9d2b7c041
+Revises: c3f8a0e6d514
+Create Date: 2026-02-21 09:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "e5a9d2b7c041"
+down_revision: Union[str, None] = "c3f8a0e6d514"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # (camera_id, timestamp DESC) INCLUDE (confidence)
+    # → get_recent(camera_id, min_confidence) / count_in_range(camera_id)
+    #   become index-only scans without a sort step.
+    # CONCURRENTLY: detections is write-hot, don't block inserts.
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_detections_camera_time",
+            table_name="detections",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_detections_camera_time",
+            "detections",
+            ["camera_id", sa.text('"timestamp" DESC')],
+            postgresql_include=["confidence"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_detections_camera_time",
+            table_name="detections",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_detections_camera_time",
+            "detections",
+            ["camera_id", "timestamp"],
+            postgresql_concurrently=True,
+        )
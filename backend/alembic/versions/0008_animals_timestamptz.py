@@ -0,0 +1,37 @@
+"""Store animal date columns as TIMESTAMPTZ
+
+Revision ID: f2c6b8e1a937
+Revises: e5a9d2b7c041
+Create Date: 2026-02-21 10:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "f2c6b8e1a937"
+down_revision: Union[str, None] = "e5a9d2b7c041"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Naive columns from the initial migration; values were always written as UTC
+_COLUMNS = ("birth_date", "acquisition_date", "first_detected_at", "last_detected_at")
+
+
+def upgrade() -> None:
+    for name in _COLUMNS:
+        op.alter_column(
+            "animals",
+            name,
+            type_=sa.DateTime(timezone=True),
+            postgresql_using=f"{name} AT TIME ZONE 'UTC'",
+        )
+
+
+def downgrade() -> None:
+    for name in _COLUMNS:
+        op.alter_column(
+            "animals",
+            name,
+            type_=sa.DateTime(),
+            postgresql_using=f"{name} AT TIME ZONE 'UTC'",
+        )
@@ -0,0 +1,42 @@
+"""Split detections.bbox JSON into four REAL columns
+
+Revision ID: a8d3f5c2e719
+Revises: f2c6b8e1a937
+Create Date: 2026-02-21 11:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "a8d3f5c2e719"
+down_revision: Union[str, None] = "f2c6b8e1a937"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_PARTS = (("bbox_x", "x"), ("bbox_y", "y"), ("bbox_w", "w"), ("bbox_h", "h"))
+
+
+def upgrade() -> None:
+    for column, _ in _PARTS:
+        op.add_column("detections", sa.Column(column, sa.REAL(), nullable=True))
+
+    op.execute(
+        "UPDATE detections SET "
+        + ", ".join(f"{column} = (bbox->>'{key}')::real" for column, key in _PARTS)
+    )
+
+    for column, _ in _PARTS:
+        op.alter_column("detections", column, nullable=False)
+    op.drop_column("detections", "bbox")
+
+
+def downgrade() -> None:
+    op.add_column("detections", sa.Column("bbox", sa.JSON(), nullable=True))
+    op.execute(
+        "UPDATE detections SET bbox = json_build_object("
+        + ", ".join(f"'{key}', {column}" for column, key in _PARTS)
+        + ")"
+    )
+    op.alter_column("detections", "bbox", nullable=False)
+    for column, _ in reversed(_PARTS):
+        op.drop_column("detections", column)
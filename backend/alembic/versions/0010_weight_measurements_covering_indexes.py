@@ -0,0 +1,63 @@
+"""Covering and partial indexes for weight measurement reads
+
+Revision ID: b4e7c9a1d352
+Revises: a8d3f5c2e719
+Create Date: 2026-02-22 09:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "b4e7c9a1d352"
+down_revision: Union[str, None] = "a8d3f5c2e719"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # (animal_id, timestamp DESC) INCLUDE (estimated_weight_kg, confidence_score)
+    # → get_by_animal / count_by_animal / get_latest_by_animal / get_weight_stats
+    #   become index-only scans without a sort step.
+    # (timestamp DESC) WHERE confidence_score >= 0.7
+    # → get_recent_global reads the newest rows straight off a small index.
+    # CONCURRENTLY: weight_measurements is write-hot, don't block inserts.
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_weight_measurements_animal_time",
+            table_name="weight_measurements",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_weight_measurements_animal_time",
+            "weight_measurements",
+            ["animal_id", sa.text('"timestamp" DESC')],
+            postgresql_include=["estimated_weight_kg", "confidence_score"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_weight_measurements_recent_confident",
+            "weight_measurements",
+            [sa.text('"timestamp" DESC')],
+            postgresql_where=sa.text("confidence_score >= 0.7"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_weight_measurements_recent_confident",
+            table_name="weight_measurements",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_weight_measurements_animal_time",
+            table_name="weight_measurements",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_weight_measurements_animal_time",
+            "weight_measurements",
+            ["animal_id", "timestamp"],
+            postgresql_concurrently=True,
+        )
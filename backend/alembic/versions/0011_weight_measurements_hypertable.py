@@ -0,0 +1,70 @@
+"""Turn weight_measurements into a TimescaleDB hypertable
+
+Revision ID: c9d1e4f7a286
+Revises: b4e7c9a1d352
+Create Date: 2026-02-22 10:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "c9d1e4f7a286"
+down_revision: Union[str, None] = "b4e7c9a1d352"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _timescale_available() -> bool:
+    bind = op.get_bind()
+    return bool(
+        bind.execute(
+            sa.text(
+                "SELECT 1 FROM pg_available_extensions WHERE name = 'timescaledb'"
+            )
+        ).scalar()
+    )
+
+
+def upgrade() -> None:
+    # 7-day chunks → every "timestamp >= :cutoff" query only touches the
+    # chunks in range (chunk exclusion), and old chunks can later be
+    # compressed / dropped wholesale. Indexes (incl. 0010's) are
+    # replicated per chunk by TimescaleDB.
+    #
+    # Plain PostgreSQL servers without the extension keep the flat table.
+    if not _timescale_available():
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS timescaledb")
+
+    # Hypertables require the time column in every unique constraint
+    op.execute("ALTER TABLE weight_measurements DROP CONSTRAINT weight_measurements_pkey")
+    op.execute('ALTER TABLE weight_measurements ADD PRIMARY KEY (id, "timestamp")')
+
+    op.execute(
+        "SELECT create_hypertable("
+        "'weight_measurements', 'timestamp', "
+        "chunk_time_interval => INTERVAL '7 days', "
+        "migrate_data => true)"
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    is_hypertable = bind.execute(
+        sa.text(
+            "SELECT 1 FROM pg_extension WHERE extname = 'timescaledb'"
+        )
+    ).scalar() and bind.execute(
+        sa.text(
+            "SELECT 1 FROM timescaledb_information.hypertables "
+            "WHERE hypertable_name = 'weight_measurements'"
+        )
+    ).scalar()
+
+    if is_hypertable:
+        # A hypertable cannot be converted back in place; restore from a
+        # dump taken before the upgrade instead.
+        raise NotImplementedError(
+            "weight_measurements is a hypertable; downgrade is not supported"
+        )
@@ -0,0 +1,92 @@
+"""Store weight / confidence as fixed-point integers
+
+Revision ID: d2a6f8b3c417
+Revises: c9d1e4f7a286
+Create Date: 2026-02-22 11:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "d2a6f8b3c417"
+down_revision: Union[str, None] = "c9d1e4f7a286"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # float8 kg → int4 grams, float8 0..1 → int2 basis points (1/10000).
+    # 16 → 6 bytes per row for the two hottest columns; the model maps them
+    # back to float attributes (QuantizedFloat), so the API is unchanged.
+    op.drop_constraint("check_confidence_range", "weight_measurements", type_="check")
+    op.drop_constraint("check_weight_positive", "weight_measurements", type_="check")
+    # Predicate is on the old float column → rebuilt below
+    op.drop_index("ix_weight_measurements_recent_confident", table_name="weight_measurements")
+
+    op.execute(
+        "ALTER TABLE weight_measurements "
+        "ALTER COLUMN estimated_weight_kg TYPE integer "
+        "USING round(estimated_weight_kg * 1000)::integer, "
+        "ALTER COLUMN confidence_score TYPE smallint "
+        "USING round(confidence_score * 10000)::smallint"
+    )
+    op.alter_column("weight_measurements", "estimated_weight_kg", new_column_name="weight_g")
+    op.alter_column("weight_measurements", "confidence_score", new_column_name="confidence_i")
+    op.execute(
+        "ALTER INDEX ix_weight_measurements_confidence_score "
+        "RENAME TO ix_weight_measurements_confidence_i"
+    )
+
+    op.create_check_constraint(
+        "check_confidence_range",
+        "weight_measurements",
+        "confidence_i >= 0 AND confidence_i <= 10000",
+    )
+    op.create_check_constraint(
+        "check_weight_positive",
+        "weight_measurements",
+        "weight_g > 0",
+    )
+    op.create_index(
+        "ix_weight_measurements_recent_confident",
+        "weight_measurements",
+        [sa.text('"timestamp" DESC')],
+        postgresql_where=sa.text("confidence_i >= 7000"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_weight_measurements_recent_confident", table_name="weight_measurements")
+    op.drop_constraint("check_weight_positive", "weight_measurements", type_="check")
+    op.drop_constraint("check_confidence_range", "weight_measurements", type_="check")
+
+    op.execute(
+        "ALTER INDEX ix_weight_measurements_confidence_i "
+        "RENAME TO ix_weight_measurements_confidence_score"
+    )
+    op.alter_column("weight_measurements", "confidence_i", new_column_name="confidence_score")
+    op.alter_column("weight_measurements", "weight_g", new_column_name="estimated_weight_kg")
+    op.execute(
+        "ALTER TABLE weight_measurements "
+        "ALTER COLUMN estimated_weight_kg TYPE double precision "
+        "USING estimated_weight_kg / 1000.0, "
+        "ALTER COLUMN confidence_score TYPE double precision "
+        "USING confidence_score / 10000.0"
+    )
+
+    op.create_check_constraint(
+        "check_weight_positive",
+        "weight_measurements",
+        "estimated_weight_kg > 0",
+    )
+    op.create_check_constraint(
+        "check_confidence_range",
+        "weight_measurements",
+        "confidence_score >= 0.0 AND confidence_score <= 1.0",
+    )
+    op.create_index(
+        "ix_weight_measurements_recent_confident",
+        "weight_measurements",
+        [sa.text('"timestamp" DESC')],
+        postgresql_where=sa.text("confidence_score >= 0.7"),
+    )
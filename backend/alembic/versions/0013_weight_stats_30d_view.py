@@ -0,0 +1,47 @@
+"""Materialized 30-day per-animal weight stats
+
+Revision ID: e8b3c5d1f692
+Revises: d2a6f8b3c417
+Create Date: 2026-02-22 12:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = "e8b3c5d1f692"
+down_revision: Union[str, None] = "d2a6f8b3c417"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Dashboard default of get_weight_stats (days=30, min_confidence=0.7),
+    # precomputed per animal. Refreshed CONCURRENTLY by the app every
+    # few minutes (WeightStatsViewRefresher); the unique index is required
+    # for that.
+    op.execute("""
+        CREATE MATERIALIZED VIEW wm_stats_30d AS
+        SELECT animal_id,
+               count(*)                                       AS total,
+               avg(weight_g)                                  AS avg_weight,
+               min(weight_g)                                  AS min_weight,
+               max(weight_g)                                  AS max_weight,
+               avg(confidence_i)                              AS avg_confidence,
+               (array_agg(weight_g ORDER BY "timestamp" ASC))[1]  AS first_weight,
+               (array_agg(weight_g ORDER BY "timestamp" DESC))[1] AS last_weight,
+               now()                                          AS refreshed_at
+          FROM weight_measurements
+         WHERE "timestamp" >= now() - interval '30 days'
+           AND confidence_i >= 7000
+         GROUP BY animal_id
+        WITH DATA
+    """)
+    op.create_index(
+        "ux_wm_stats_30d_animal",
+        "wm_stats_30d",
+        ["animal_id"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS wm_stats_30d")
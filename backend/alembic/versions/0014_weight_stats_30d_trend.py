@@ -0,0 +1,60 @@
+"""Add regression slope and median to wm_stats_30d
+
+Revision ID: f4c7a9e2b518
+Revises: e8b3c5d1f692
+Create Date: 2026-02-22 13:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = "f4c7a9e2b518"
+down_revision: Union[str, None] = "e8b3c5d1f692"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_VIEW = """
+    CREATE MATERIALIZED VIEW wm_stats_30d AS
+    SELECT animal_id,
+           count(*)                                       AS total,
+           avg(weight_g)                                  AS avg_weight,
+           min(weight_g)                                  AS min_weight,
+           max(weight_g)                                  AS max_weight,
+           avg(confidence_i)                              AS avg_confidence,
+           (array_agg(weight_g ORDER BY "timestamp" ASC))[1]  AS first_weight,
+           (array_agg(weight_g ORDER BY "timestamp" DESC))[1] AS last_weight,
+           {extra}
+           now()                                          AS refreshed_at
+      FROM weight_measurements
+     WHERE "timestamp" >= now() - interval '30 days'
+       AND confidence_i >= 7000
+     GROUP BY animal_id
+    WITH DATA
+"""
+
+# Least-squares slope in grams/day and the median weight in grams
+_TREND_COLUMNS = """
+           regr_slope(weight_g, extract(epoch FROM "timestamp")) * 86400
+                                                          AS slope_per_day,
+           percentile_cont(0.5) WITHIN GROUP (ORDER BY weight_g)
+                                                          AS median_weight,
+"""
+
+
+def _recreate(extra: str) -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS wm_stats_30d")
+    op.execute(_VIEW.format(extra=extra))
+    op.create_index(
+        "ux_wm_stats_30d_animal",
+        "wm_stats_30d",
+        ["animal_id"],
+        unique=True,
+    )
+
+
+def upgrade() -> None:
+    _recreate(_TREND_COLUMNS)
+
+
+def downgrade() -> None:
+    _recreate("")
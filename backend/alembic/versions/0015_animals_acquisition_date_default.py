@@ -0,0 +1,23 @@
+"""Server-side default for animals.acquisition_date
+
+Revision ID: a5d9e1c3b724
+Revises: f4c7a9e2b518
+Create Date: 2026-02-23 09:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "a5d9e1c3b724"
+down_revision: Union[str, None] = "f4c7a9e2b518"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Omitted on INSERT → filled by the DB clock (one clock for all replicas)
+    op.alter_column("animals", "acquisition_date", server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    op.alter_column("animals", "acquisition_date", server_default=None)
@@ -6,14 +6,18 @@ It handles HTTP-specific concerns (request/response, status codes)
 and delegates business logic to the service layer.
 """
 
-from typing import Optional
-from fastapi import APIRouter, Depends, status, Query
+from typing import Any, AsyncIterator, Callable, Optional, TypeVar
+from fastapi import APIRouter, Depends, status, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.services.animal import AnimalService
 from app.schemas.animal import (
     AnimalCreate,
+    AnimalBulkCreate,
     AnimalUpdate,
     AnimalResponse,
     AnimalListResponse,
@@ -26,6 +30,51 @@ router = APIRouter(
 )
 
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def _json_body(model: type[ModelT]) -> Callable[[Request], Any]:
+    """
+    Dependency: validate the raw request body with ``model_validate_json``.
+    
+    FastAPI's own body handling json-decodes into a dict and then
+    validates that dict; pydantic-core parses and validates the bytes in
+    one pass instead. Errors are re-raised as RequestValidationError, so
+    clients get the usual 422 ``{"detail": [...]}`` with ``body`` locs.
+    """
+    async def dependency(request: Request) -> ModelT:
+        try:
+            return model.model_validate_json(await request.body())
+        except ValidationError as exc:
+            raise RequestValidationError(
+                [
+                    {**error, "loc": ("body", *error["loc"])}
+                    for error in exc.errors(include_url=False)
+                ]
+            ) from None
+    
+    return dependency
+
+
+# Nested definitions ($defs) of the _json_body() models. openapi_extra can
+# only touch the operation, so main.py merges these into
+# components/schemas (see _openapi there).
+BODY_SCHEMA_DEFS: dict[str, dict] = {}
+
+
+def _json_body_openapi(model: type[BaseModel]) -> dict:
+    """openapi_extra documenting a body read by _json_body()."""
+    schema = model.model_json_schema(ref_template="#/components/schemas/{model}")
+    # Referenced as #/components/schemas/<name> — register, don't drop
+    BODY_SCHEMA_DEFS.update(schema.pop("$defs", {}))
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": schema}},
+        },
+    }
+
+
 # Dependency: Get service instance
 def get_animal_service(
     db: AsyncSession = Depends(get_db)
@@ -57,9 +106,10 @@ def get_animal_service(
         400: {"description": "Tag ID already exists or validation error"},
         422: {"description": "Invalid request data"},
     },
+    openapi_extra=_json_body_openapi(AnimalCreate),
 )
 async def create_animal(
-    animal_data: AnimalCreate,
+    animal_data: AnimalCreate = Depends(_json_body(AnimalCreate)),
     service: AnimalService = Depends(get_animal_service),
 ) -> AnimalResponse:
     """
@@ -70,6 +120,81 @@ async def create_animal(
     return await service.create_animal(animal_data)
 
 
+@router.post(
+    "/bulk",
+    response_model=list[AnimalResponse],
+    status_code=status.HTTP_201_CREATED,
+    summary="Create many animals",
+    description="""
+    Create up to 1000 animals in one request (one multi-row INSERT).
+    
+    Same rules as `POST /animals/`. All-or-nothing: if any tag ID is
+    repeated or already exists, nothing is created and the conflicting
+    tag IDs are listed in the error details.
+    """,
+    responses={
+        201: {"description": "Animals created successfully"},
+        400: {"description": "Tag ID already exists or validation error"},
+        422: {"description": "Invalid request data"},
+    },
+    openapi_extra=_json_body_openapi(AnimalBulkCreate),
+)
+async def create_animals(
+    animals_data: AnimalBulkCreate = Depends(_json_body(AnimalBulkCreate)),
+    service: AnimalService = Depends(get_animal_service),
+) -> list[AnimalResponse]:
+    """
+    Create many animals at once.
+    
+    Returns the created animals in request order.
+    """
+    return await service.create_animals(animals_data)
+
+
+@router.get(
+    "/export",
+    summary="Export animals",
+    description="""
+    Stream every animal as newline-delimited JSON (one object per line).
+    
+    **Filtering:**
+    - `species`: Filter by species (cattle, sheep, goat, horse, other)
+    - `status`: Filter by status (active, quarantine, sick, sold, deceased, transferred)
+    
+    Not paginated — rows are read through a server-side cursor, so large
+    exports do not load the whole table into memory.
+    """,
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "NDJSON stream of animals",
+            "content": {"application/x-ndjson": {}},
+        },
+    },
+)
+async def export_animals(
+    species: Optional[str] = Query(
+        default=None,
+        description="Filter by species (e.g., 'cattle', 'sheep')",
+    ),
+    status: Optional[str] = Query(
+        default=None,
+        description="Filter by status (e.g., 'active', 'sold')",
+    ),
+    service: AnimalService = Depends(get_animal_service),
+) -> StreamingResponse:
+    """
+    Export animals as NDJSON.
+    
+    Route is declared before `/{animal_id}` so "export" is not parsed as an ID.
+    """
+    async def ndjson() -> AsyncIterator[str]:
+        async for animal in service.export_animals(species=species, status=status):
+            yield animal.model_dump_json() + "\n"
+    
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
 @router.get(
     "/{animal_id}",
     response_model=AnimalResponse,
@@ -107,6 +232,8 @@ async def get_animal(
     **Pagination:**
     - `skip`: Number of records to skip (default: 0)
     - `limit`: Maximum records to return (default: 10, max: 100)
+    - `after_id`: Cursor from the previous page's `next_cursor`
+      (recommended for deep pages; `skip` is ignored when set)
     """,
     responses={
         200: {"description": "List of animals"},
@@ -132,18 +259,30 @@ async def list_animals(
         default=None,
         description="Filter by status (e.g., 'active', 'sold')",
     ),
+    after_id: Optional[int] = Query(
+        default=None,
+        ge=0,
+        description="Keyset cursor: return animals with id > after_id",
+    ),
     service: AnimalService = Depends(get_animal_service),
-) -> AnimalListResponse:
+) -> Response:
     """
     Get paginated list of animals.
     
-    Returns list with pagination metadata.
+    Returns list with pagination metadata. The body is serialized straight
+    from the already-built response model (pydantic-core, no re-validation
+    through response_model); response_model stays for the OpenAPI schema.
     """
-    return await service.get_animals(
+    result = await service.get_animals(
         skip=skip,
         limit=limit,
         species=species,
         status=status,
+        after_id=after_id,
+    )
+    return Response(
+        content=result.model_dump_json(),
+        media_type="application/json",
     )
 
 
@@ -169,10 +308,11 @@ async def list_animals(
         404: {"description": "Animal not found"},
         422: {"description": "Invalid request data"},
     },
+    openapi_extra=_json_body_openapi(AnimalUpdate),
 )
 async def update_animal(
     animal_id: int,
-    update_data: AnimalUpdate,
+    update_data: AnimalUpdate = Depends(_json_body(AnimalUpdate)),
     service: AnimalService = Depends(get_animal_service),
 ) -> AnimalResponse:
     """
@@ -6,17 +6,20 @@ Provides real-time object detection using YOLOv11.
 
 import base64
 import io
-from typing import Annotated
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Query
+from datetime import datetime
+from typing import Annotated, AsyncIterator, Optional
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from PIL import Image
 import numpy as np
 import logging
 
+from app.core.database import get_db
 from app.services.ai.yolo_service import get_yolo_service, YoloService
+from app.services.detection import DetectionService
 from app.schemas.detection import (
     InferenceResultResponse,
-    DetectionResponse,
-    BoundingBoxResponse,
     ModelInfoResponse,
 )
 from app.config import settings
@@ -29,6 +32,17 @@ router = APIRouter(
 )
 
 
+def get_detection_service(
+    db: AsyncSession = Depends(get_db),
+) -> DetectionService:
+    """
+    Dependency injection for DetectionService.
+    
+    Creates a new service instance for each request with the database session.
+    """
+    return DetectionService(db)
+
+
 def image_to_numpy(image: Image.Image) -> np.ndarray:
     """
     Convert PIL Image to numpy array (BGR format for YOLO).
@@ -82,7 +96,7 @@ async def detect_from_upload(
         description="Comma-separated class IDs (e.g., '19' for cow)",
     ),
     yolo_service: YoloService = Depends(get_yolo_service),
-) -> InferenceResultResponse:
+) -> Response:
     """
     Detect objects in uploaded image file.
     
@@ -119,40 +133,26 @@ async def detect_from_upload(
             frame=frame,
             confidence_threshold=confidence_threshold,
             target_classes=classes,
+            include_abs_box=True,  # Part of the API response (extra_data)
         )
         
         logger.info(
-            f"Detection completed: {result.detection_count} objects found "
-            f"in {result.inference_time_ms:.2f}ms"
+            "Detection completed: %s objects found in %.2fms",
+            result.detection_count,
+            result.inference_time_ms,
         )
         
-        # Convert to response schema
-        detections = [
-            DetectionResponse(
-                class_id=d.class_id,
-                class_name=d.class_name,
-                confidence=d.confidence,
-                bounding_box=BoundingBoxResponse(**d.bounding_box.to_dict()),
-                timestamp=d.timestamp,
-                has_mask=d.mask is not None,
-                extra_data=d.extra_data or {},
-            )
-            for d in result.detections
-        ]
-        
-        return InferenceResultResponse(
-            detections=detections,
-            detection_count=result.detection_count,
-            inference_time_ms=result.inference_time_ms,
-            model_name=result.model_name,
-            frame_shape=result.frame_shape,
-            timestamp=result.timestamp,
+        # Serialize the trusted model output directly (InferenceResultResponse
+        # layout) — no Pydantic models, no jsonable_encoder
+        return Response(
+            content=result.to_json(),
+            media_type="application/json",
         )
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Detection failed: {e}", exc_info=True)
+        logger.error("Detection failed: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"Detection failed: {str(e)}",
@@ -174,7 +174,7 @@ async def detect_from_base64(
     confidence_threshold: float = 0.5,
     target_classes: list[int] | None = None,
     yolo_service: YoloService = Depends(get_yolo_service),
-) -> InferenceResultResponse:
+) -> Response:
     """
     Detect objects in base64-encoded image.
     
@@ -199,35 +199,20 @@ async def detect_from_base64(
             frame=frame,
             confidence_threshold=confidence_threshold,
             target_classes=target_classes,
+            include_abs_box=True,
         )
         
-        # Convert to response schema
-        detections = [
-            DetectionResponse(
-                class_id=d.class_id,
-                class_name=d.class_name,
-                confidence=d.confidence,
-                bounding_box=BoundingBoxResponse(**d.bounding_box.to_dict()),
-                timestamp=d.timestamp,
-                has_mask=d.mask is not None,
-                extra_data=d.extra_data or {},
-            )
-            for d in result.detections
-        ]
-        
-        return InferenceResultResponse(
-            detections=detections,
-            detection_count=result.detection_count,
-            inference_time_ms=result.inference_time_ms,
-            model_name=result.model_name,
-            frame_shape=result.frame_shape,
-            timestamp=result.timestamp,
+        # Serialize the trusted model output directly (InferenceResultResponse
+        # layout) — no Pydantic models, no jsonable_encoder
+        return Response(
+            content=result.to_json(),
+            media_type="application/json",
         )
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Detection failed: {e}", exc_info=True)
+        logger.error("Detection failed: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"Detection failed: {str(e)}",
@@ -269,4 +254,48 @@ async def ai_health_check(
         "status": "healthy" if yolo_service.is_loaded else "unhealthy",
         "model_loaded": yolo_service.is_loaded,
         "model_name": yolo_service.model_name,
-    }
\ No newline at end of file
+    }
+
+
+@router.get(
+    "/export",
+    summary="Export stored detections",
+    description="""
+    Stream stored detection events as newline-delimited JSON, newest first.
+    
+    **Filtering:**
+    - `camera_id`: Only this camera
+    - `min_confidence`: Minimum YOLO confidence
+    - `start` / `end`: Time window (inclusive)
+    
+    Not paginated — rows are read through a server-side cursor, so large
+    exports do not load the whole result into memory.
+    """,
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "NDJSON stream of detections",
+            "content": {"application/x-ndjson": {}},
+        },
+    },
+)
+async def export_detections(
+    camera_id: Optional[str] = Query(default=None, description="Filter by camera"),
+    min_confidence: float = Query(default=0.0, ge=0.0, le=1.0),
+    start: Optional[datetime] = Query(default=None, description="Window start (UTC)"),
+    end: Optional[datetime] = Query(default=None, description="Window end (UTC)"),
+    service: DetectionService = Depends(get_detection_service),
+) -> StreamingResponse:
+    """
+    Export detections as NDJSON.
+    """
+    async def ndjson() -> AsyncIterator[str]:
+        async for detection in service.export_detections(
+            camera_id=camera_id,
+            min_confidence=min_confidence,
+            start=start,
+            end=end,
+        ):
+            yield detection.model_dump_json() + "\n"
+    
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
@@ -68,7 +68,7 @@ async def websocket_endpoint(websocket: WebSocket):
             data = await websocket.receive_text()
             
             # Handle client messages (future feature: filters, etc.)
-            logger.debug(f"Received from client: {data}")
+            logger.debug("Received from client: %s", data)
             
             # Echo or handle specific commands
             # For now, we just keep the connection open
@@ -80,7 +80,7 @@ async def websocket_endpoint(websocket: WebSocket):
         
     except Exception as e:
         # Unexpected error
-        logger.error(f"WebSocket error: {e}", exc_info=True)
+        logger.error("WebSocket error: %s", e, exc_info=True)
         await manager.disconnect(websocket)
 
 
@@ -100,7 +100,7 @@ async def start_pipeline(
         }
         
     except Exception as e:
-        logger.error(f"Failed to start pipeline: {e}", exc_info=True)
+        logger.error("Failed to start pipeline: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to start pipeline: {str(e)}"
@@ -142,7 +142,7 @@ async def stop_pipeline() -> dict:
         }
         
     except Exception as e:
-        logger.error(f"Failed to stop pipeline: {e}", exc_info=True)
+        logger.error("Failed to stop pipeline: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to stop pipeline: {str(e)}"
@@ -4,14 +4,17 @@ API endpoints for Weight Measurement resources.
 Handles CRUD operations and statistics for weight measurements.
 """
 
+from datetime import datetime
 from typing import Optional
-from fastapi import APIRouter, Depends, status, Query, Path
+from fastapi import APIRouter, Depends, status, Query, Path, Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging # Loglarni ko'rish uchun qo'shildi
 
 from app.core.database import get_db
 from app.services.weight_measurement import WeightMeasurementService
 from app.api.v1.websocket import get_ws_manager
+from app.repositories.weight_measurement_writer import get_weight_writer
 from app.schemas.weight_measurement import (
     WeightMeasurementCreate,
     WeightMeasurementResponse,
@@ -22,6 +25,9 @@ from app.schemas.weight_measurement import (
 # Logger sozlash
 logger = logging.getLogger(__name__)
 
+# List payloads are serialized in pydantic-core directly (no jsonable_encoder)
+_MEASUREMENT_LIST = TypeAdapter(list[WeightMeasurementResponse])
+
 router = APIRouter(
     prefix="/weights",
     tags=["weights"],
@@ -42,7 +48,13 @@ def get_weight_service(
         # WebSocket not initialized (e.g., during tests)
         ws_manager = None
     
-    return WeightMeasurementService(db, ws_manager)
+    try:
+        writer = get_weight_writer()
+    except RuntimeError:
+        # Writer not started (e.g., during tests) → direct INSERT
+        writer = None
+    
+    return WeightMeasurementService(db, ws_manager, writer)
 
 
 @router.post(
@@ -83,6 +95,8 @@ async def create_measurement(
     # 2. --- YANGI QISM: Majburiy Broadcast (Arxitekturani buzmasdan) ---
     try:
         ws_manager = get_ws_manager()
+        if not ws_manager.active_connections:
+            return result  # Ulangan klient yo'q → payload tayyorlash shart emas
         
         # Frontend kutayotgan aniq formatda ma'lumot tayyorlaymiz
         broadcast_data = {
@@ -91,16 +105,16 @@ async def create_measurement(
             "estimated_weight_kg": result.estimated_weight_kg,
             "confidence_score": result.confidence_score,
             "camera_id": result.camera_id,
-            "timestamp": result.timestamp.isoformat() if result.timestamp else None
+            "timestamp": result.timestamp,  # orjson encodes datetime itself
         }
         
         # Barchaga yuborish
         await ws_manager.broadcast(broadcast_data)
-        logger.info(f"📡 Broadcast sent for Animal {broadcast_data['animal_tag_id']}")
+        logger.info("📡 Broadcast sent for Animal %s", broadcast_data['animal_tag_id'])
         
     except Exception as e:
         # Agar WebSocket ishlamasa ham, API 201 qaytarishi kerak (muhim!)
-        logger.error(f"⚠️ WebSocket broadcast failed inside endpoint: {e}")
+        logger.error("⚠️ WebSocket broadcast failed inside endpoint: %s", e)
     # -------------------------------------------------------------------
 
     return result
@@ -135,13 +149,27 @@ async def get_measurement(
     - `days`: Only return measurements from the last N days
     
     **Pagination:**
-    - `skip`: Number of records to skip
+    - `before`: Keyset cursor — pass the previous page's `next_cursor`
+    - `before_id`: Pass the previous page's `next_cursor_id` with `before`
+      (rows sharing the cursor timestamp are not skipped)
+    - `skip`: Number of records to skip (legacy; ignored with `before`)
     - `limit`: Maximum records to return (max 1000)
+    - `include_total`: Also return the exact total (slower on long histories)
     """,
 )
 async def get_animal_measurements(
     animal_id: int = Path(..., gt=0),
     skip: int = Query(default=0, ge=0),
+    before: Optional[datetime] = Query(
+        default=None,
+        description="Return measurements older than this (next_cursor)",
+    ),
+    before_id: Optional[int] = Query(
+        default=None,
+        gt=0,
+        description="Tiebreaker for `before` (next_cursor_id)",
+    ),
+    include_total: bool = Query(default=False),
     limit: int = Query(default=100, ge=1, le=1000),
     min_confidence: Optional[float] = Query(
         default=None,
@@ -156,18 +184,25 @@ async def get_animal_measurements(
         description="Only get measurements from last N days",
     ),
     service: WeightMeasurementService = Depends(get_weight_service),
-) -> WeightMeasurementListResponse:
+) -> Response:
     """
     Get weight measurements for a specific animal.
     
     Returns paginated list with time-series data.
     """
-    return await service.get_animal_measurements(
+    result = await service.get_animal_measurements(
         animal_id=animal_id,
         skip=skip,
         limit=limit,
         min_confidence=min_confidence,
         days=days,
+        before=before,
+        before_id=before_id,
+        include_total=include_total,
+    )
+    return Response(
+        content=result.model_dump_json(),
+        media_type="application/json",
     )
 
 
@@ -242,13 +277,17 @@ async def get_recent_measurements(
         description="Minimum confidence threshold",
     ),
     service: WeightMeasurementService = Depends(get_weight_service),
-) -> list[WeightMeasurementResponse]:
+) -> Response:
     """
     Get recent measurements across all animals.
     
     Returns newest measurements first.
     """
-    return await service.get_recent_measurements(
+    items = await service.get_recent_measurements(
         limit=limit,
         min_confidence=min_confidence,
+    )
+    return Response(
+        content=_MEASUREMENT_LIST.dump_json(items),
+        media_type="application/json",
     )
\ No newline at end of file
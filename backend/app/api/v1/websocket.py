@@ -7,23 +7,18 @@ with broadcasting capabilities for live farm monitoring.
 
 from typing import Set
 from fastapi import WebSocket, WebSocketDisconnect
-import json
+import orjson
 import logging
 import asyncio
 
 logger = logging.getLogger(__name__)
 
-# --- MANA SHUNI QO'SHING (Importlardan keyin) ---
-class DateTimeEncoder(json.JSONEncoder):
-    """
-    Vaqtni (datetime) JSON tushunadigan formatga (ISO string) o'girib beradi.
-    """
-    def default(self, obj):
-        from datetime import datetime
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        return super().default(obj)
-# -----------------------------------------------
+# orjson datetime'ni o'zi ISO string qiladi; naive → UTC, "+00:00" → "Z"
+_JSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC
+
+# A client that can't take a frame within this many seconds is dropped —
+# one stalled socket must not hold up every broadcast behind it
+_SEND_TIMEOUT = 2.0
 
 
 class ConnectionManager:
@@ -71,8 +66,8 @@ class ConnectionManager:
             self._total_connections += 1
         
         logger.info(
-            f"WebSocket connected. "
-            f"Active connections: {len(self.active_connections)}"
+            "WebSocket connected. Active connections: %s",
+            len(self.active_connections),
         )
         
         # Send welcome message
@@ -99,8 +94,8 @@ class ConnectionManager:
                 self._total_disconnections += 1
         
         logger.info(
-            f"WebSocket disconnected. "
-            f"Active connections: {len(self.active_connections)}"
+            "WebSocket disconnected. Active connections: %s",
+            len(self.active_connections),
         )
     
     async def broadcast(self, message: dict) -> None:
@@ -123,46 +118,63 @@ class ConnectionManager:
             "data": message,
         }
         
-        # Convert to JSON once (with DateTimeEncoder)
+        # Convert to JSON once for all clients (orjson, datetime-aware).
+        # Sent as a text frame: the frontend JSON.parse()s event.data.
         try:
-            json_message = json.dumps(broadcast_message, cls=DateTimeEncoder)
-        except TypeError as e:
-            logger.error(f"JSON serialization failed: {e}")
+            json_message = orjson.dumps(
+                broadcast_message, option=_JSON_OPTIONS
+            ).decode()
+        except TypeError as e:  # orjson.JSONEncodeError is a TypeError
+            logger.error("JSON serialization failed: %s", e)
             return
         
-        # Track failed connections
-        failed_connections = set()
-        
-        # Broadcast to all connections
+        # Broadcast to all connections concurrently. The lock still
+        # serializes whole broadcasts, so each client gets them in order.
         async with self._lock:
-            for connection in self.active_connections:
-                try:
-                    await connection.send_text(json_message)
-                    self._total_messages_sent += 1
-                    
-                except WebSocketDisconnect:
-                    # Connection lost
-                    failed_connections.add(connection)
-                    logger.warning("Connection lost during broadcast")
-                    
-                except Exception as e:
-                    # Other errors
-                    failed_connections.add(connection)
-                    logger.error(f"Error broadcasting to connection: {e}")
+            connections = list(self.active_connections)
+            sent = await asyncio.gather(
+                *(self._send_text(c, json_message) for c in connections)
+            )
+            failed_connections = {
+                c for c, ok in zip(connections, sent) if not ok
+            }
+            self._total_messages_sent += len(connections) - len(failed_connections)
             
             # Remove failed connections
             if failed_connections:
                 self.active_connections -= failed_connections
                 logger.info(
-                    f"Removed {len(failed_connections)} failed connections. "
-                    f"Active: {len(self.active_connections)}"
+                    "Removed %s failed connections. Active: %s",
+                    len(failed_connections),
+                    len(self.active_connections),
                 )
         
         logger.debug(
-            f"Broadcasted to {len(self.active_connections)} clients "
-            f"({len(failed_connections)} failed)"
+            "Broadcasted to %s clients (%s failed)",
+            len(self.active_connections),
+            len(failed_connections),
         )
     
+    async def _send_text(self, websocket: WebSocket, message: str) -> bool:
+        """Send one text frame; False if the client is gone or too slow."""
+        try:
+            async with asyncio.timeout(_SEND_TIMEOUT):
+                await websocket.send_text(message)
+            return True
+            
+        except WebSocketDisconnect:
+            # Connection lost
+            logger.warning("Connection lost during broadcast")
+            
+        except TimeoutError:
+            logger.warning("Client too slow, dropping (send > %ss)", _SEND_TIMEOUT)
+            
+        except Exception as e:
+            # Other errors
+            logger.error("Error broadcasting to connection: %s", e)
+        
+        return False
+    
     async def _send_personal(
         self,
         websocket: WebSocket,
@@ -180,7 +192,7 @@ class ConnectionManager:
             self._total_messages_sent += 1
             
         except Exception as e:
-            logger.error(f"Failed to send personal message: {e}")
+            logger.error("Failed to send personal message: %s", e)
     
     async def send_heartbeat(self) -> None:
         """
@@ -267,7 +279,7 @@ async def shutdown_ws_manager() -> None:
         try:
             await connection.close()
         except Exception as e:
-            logger.error(f"Error closing WebSocket: {e}")
+            logger.error("Error closing WebSocket: %s", e)
     
     # Clear connections
     ws_manager.active_connections.clear()
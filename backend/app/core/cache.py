@@ -0,0 +1,49 @@
+"""
+In-process caches shared by repositories and services.
+
+No external cache server: each worker process keeps its own entries, and
+every entry expires after a short TTL, so a write made through another
+worker becomes visible within one TTL at most.
+"""
+
+from collections import OrderedDict
+from typing import Any, Hashable
+import time
+
+
+class TTLCache:
+    """
+    Small in-process LRU with per-entry expiry.
+
+    Args:
+        ttl:      Seconds an entry stays valid
+        max_size: Least recently used entries are evicted beyond this
+    """
+
+    MISS = object()
+
+    def __init__(self, ttl: float, max_size: int = 4096) -> None:
+        self._ttl = ttl
+        self._max_size = max_size
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        """Cached value, or TTLCache.MISS if absent/expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return self.MISS
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return self.MISS
+        self._data.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self._ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self._max_size:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        self._data.pop(key, None)
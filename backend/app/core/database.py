@@ -235,14 +235,18 @@ This module handles:
 - Dependency injection for FastAPI routes
 """
 
-from typing import AsyncGenerator
+from itertools import islice
+from typing import Any, AsyncGenerator, Callable, Iterable, Sequence
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     AsyncSession,
     async_sessionmaker,
 )
-from sqlalchemy import text
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 import logging
+import orjson
 
 from app.config import settings
 
@@ -264,11 +268,28 @@ if DB_URL.startswith("postgresql://"):
 engine = create_async_engine(
     DB_URL,  # <--- DIQQAT: Bu yerda to'g'irlangan DB_URL ishlatilishi shart!
     echo=False,          # Loglarni o'chiramiz (Tezlik uchun)
+    poolclass=AsyncAdaptedQueuePool,  # asyncpg uchun to'g'ri hovuz (aniq ko'rsatamiz)
     pool_size=20,        # Asosiy hovuz: 20 ta doimiy ulanish
     max_overflow=40,     # Zaxira hovuz: Yuklama oshganda yana 40 ta ochadi
     pool_timeout=30,     # Bo'sh joy chiqishini 30 sekund kutadi
     pool_recycle=1800,   # Har 30 daqiqada ulanishni yangilaydi (uzilib qolmasligi uchun)
     pool_pre_ping=True,  # Har safar so'rovdan oldin "Aloqa bormi?" deb tekshiradi
+    # JSON ustunlar (raw_ai_data) uchun stdlib json o'rniga orjson (C, tezroq)
+    json_serializer=lambda v: orjson.dumps(v).decode(),
+    json_deserializer=orjson.loads,
+    # Kompilyatsiya qilingan SQL keshi (default 500) — repozitoriy so'rov
+    # shakllari + lambda_stmt'lar uchun yetarli joy
+    query_cache_size=1200,
+    connect_args={
+        "server_settings": {
+            # Server tomonda TCP keepalive — NAT/LB o'lik ulanishlarni tezroq sezadi
+            "tcp_keepalives_idle": "60",
+            # Qisqa OLTP so'rovlarda JIT kompilyatsiya foydadan ko'ra qimmat
+            "jit": "off",
+        },
+        # Har bir ulanishdagi asyncpg prepared statement keshi (default 100)
+        "prepared_statement_cache_size": 1024,
+    },
 )
 
 # -------------------------------------------------------------------
@@ -290,6 +311,10 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency for FastAPI routes to get database session.
     Har bir so'rov uchun yangi sessiya ochadi va ish bitgach yopadi.
+
+    Sessiya faqat shu so'rovniki — parallel task'larga uzatilmaydi
+    (bitta AsyncSession = bitta ulanish). Ulanish hovuzdan faqat birinchi
+    so'rov bajarilganda olinadi va ``async with`` chiqishida qaytariladi.
     """
     async with AsyncSessionLocal() as session:
         try:
@@ -300,13 +325,45 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             # Agar xato chiqsa, orqaga qaytaradi (Rollback)
             await session.rollback()
             raise
-        finally:
-            # Har qanday holatda ham sessiyani yopish shart
-            await session.close()
+        # Yopish (close) ni ``async with`` o'zi bajaradi
+
+
+# -------------------------------------------------------------------
+# 5. COMMIT'DAN KEYINGI CALLBACK'LAR
+# -------------------------------------------------------------------
+# Kesh invalidatsiyasi commit'dan OLDIN qilinsa, commit'gacha kelgan
+# parallel o'qish eski qatorni yana keshlab qo'yadi. Shuning uchun
+# callback'lar sessiya commit bo'lganda ishlaydi, rollback'da tashlanadi.
+
+_AFTER_COMMIT_KEY = "after_commit_callbacks"
+
+
+def on_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """
+    Run ``callback`` once the session's current transaction commits.
+
+    Dropped if the transaction rolls back. Callbacks must be cheap and
+    synchronous (they run inside the commit).
+    """
+    session.sync_session.info.setdefault(_AFTER_COMMIT_KEY, []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit(session: Session) -> None:
+    for callback in session.info.pop(_AFTER_COMMIT_KEY, ()):
+        try:
+            callback()
+        except Exception as exc:
+            logger.error("after_commit callback failed: %s", exc)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_after_commit(session: Session) -> None:
+    session.info.pop(_AFTER_COMMIT_KEY, None)
 
 
 # -------------------------------------------------------------------
-# 5. YORDAMCHI FUNKSIYALAR
+# 6. YORDAMCHI FUNKSIYALAR
 # -------------------------------------------------------------------
 
 async def check_db_connection() -> bool:
@@ -319,13 +376,61 @@ async def check_db_connection() -> bool:
             await session.execute(text("SELECT 1"))
         return True
     except Exception as e:
-        logger.error(f"Database connection failed: {e}")
+        logger.error("Database connection failed: %s", e)
         return False
 
+def get_pool_stats() -> dict:
+    """
+    Ulanishlar hovuzi holati (pool_size / max_overflow ni sozlash uchun).
+    """
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "status": pool.status(),
+    }
+
+
 async def close_db() -> None:
     """
     Dastur o'chayotganda barcha ulanishlarni uzish.
     """
     logger.info("Closing database connections...")
     await engine.dispose()
-    logger.info("Database connections closed.")
\ No newline at end of file
+    logger.info("Database connections closed.")
+
+
+async def copy_records(
+    session: AsyncSession,
+    table_name: str,
+    columns: Sequence[str],
+    records: Iterable[tuple[Any, ...]],
+    chunk_size: int = 10_000,
+) -> int:
+    """
+    Bulk-load rows with asyncpg's binary COPY protocol.
+
+    Runs on the session's own connection, so the rows are part of the
+    session's transaction (committed/rolled back with it). Records are
+    sent in chunks to bound memory. JSON columns must already be
+    serialized to ``str``.
+
+    Returns:
+        Number of rows copied
+    """
+    conn = await session.connection()
+    raw = await conn.get_raw_connection()
+    driver = raw.driver_connection
+
+    total = 0
+    iterator = iter(records)
+    while chunk := list(islice(iterator, chunk_size)):
+        await driver.copy_records_to_table(
+            table_name,
+            records=chunk,
+            columns=list(columns),
+        )
+        total += len(chunk)
+    return total
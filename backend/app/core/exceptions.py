@@ -5,7 +5,13 @@ These exceptions represent domain-specific errors and are caught
 by FastAPI exception handlers to return proper HTTP responses.
 """
 
-from typing import Any, Optional
+import functools
+import inspect
+import logging
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+import asyncpg
+from sqlalchemy.exc import SQLAlchemyError
 
 
 class TaurusException(Exception):
@@ -93,4 +99,72 @@ class DatabaseError(TaurusException):
             details={"error": str(e)}
         )
     """
-    pass
\ No newline at end of file
+    pass
+
+
+_T = TypeVar("_T")
+
+# Failures the repository layer translates into DatabaseError: anything
+# raised by SQLAlchemy, plus raw asyncpg errors from driver-level calls
+# (COPY). Programming errors and cancellation propagate unchanged.
+DB_ERRORS: tuple[type[Exception], ...] = (SQLAlchemyError, asyncpg.PostgresError)
+
+# serialization_failure / deadlock_detected — safe to retry the transaction
+_TRANSIENT_SQLSTATES = frozenset({"40001", "40P01"})
+
+
+def is_transient_db_error(exc: BaseException) -> bool:
+    """True if exc is a serialization failure or deadlock (retryable)."""
+    seen = 0
+    while exc is not None and seen < 4:
+        sqlstate = getattr(exc, "sqlstate", None) or getattr(exc, "pgcode", None)
+        if sqlstate in _TRANSIENT_SQLSTATES:
+            return True
+        # SQLAlchemy DBAPIError → .orig (driver adapter) → __cause__ (asyncpg)
+        exc = getattr(exc, "orig", None) or exc.__cause__
+        seen += 1
+    return False
+
+
+def db_operation(
+    message: str,
+    context: tuple[str, ...] = (),
+) -> Callable[[Callable[..., Awaitable[_T]]], Callable[..., Awaitable[_T]]]:
+    """
+    Wrap an async repository method: database failures become DatabaseError.
+
+    Replaces the per-method ``try/except Exception → log → DatabaseError``
+    boilerplate. The happy path is a plain await; formatting/logging only
+    happen on the error path. DatabaseError raised inside passes through.
+
+    Args:
+        message: Error message; may reference call arguments with
+                 str.format fields, e.g. "Failed to fetch animal id={animal_id}"
+        context: Argument names copied into DatabaseError.details
+
+    Example:
+        @db_operation("Failed to fetch animal id={animal_id}")
+        async def get_by_id(self, animal_id: int) -> Optional[Animal]:
+            ...
+    """
+    def decorator(fn: Callable[..., Awaitable[_T]]) -> Callable[..., Awaitable[_T]]:
+        logger = logging.getLogger(fn.__module__)
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> _T:
+            try:
+                return await fn(*args, **kwargs)
+            except DB_ERRORS as exc:
+                arguments = signature.bind(*args, **kwargs).arguments
+                text = message.format(**arguments)
+                logger.error(
+                    "[repo] %s failed: %s", fn.__qualname__, exc, exc_info=True
+                )
+                details = {name: arguments.get(name) for name in context}
+                details["error"] = str(exc)
+                raise DatabaseError(message=text, details=details) from exc
+
+        return wrapper
+
+    return decorator
@@ -506,12 +506,14 @@ It initializes FastAPI, configures middleware, and includes API routes.
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
+import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 
 from app.config import settings
 from app.api.v1 import router as api_v1_router
+from app.api.v1.endpoints.animals import BODY_SCHEMA_DEFS
 from app.api.v1.exception_handlers import (
     entity_not_found_handler,
     entity_already_exists_handler,
@@ -543,6 +545,7 @@ app = FastAPI(
     debug=settings.DEBUG,
     docs_url="/docs",  # Swagger UI
     redoc_url="/redoc",  # ReDoc
+    default_response_class=ORJSONResponse,  # orjson instead of stdlib json
 )
 
 
@@ -560,6 +563,29 @@ app.add_middleware(
 app.include_router(api_v1_router, prefix="/api")
 
 
+_default_openapi = app.openapi
+
+
+def _openapi() -> dict:
+    """
+    OpenAPI schema plus the nested models of raw-JSON request bodies.
+    
+    Bodies read by the animals router's _json_body() are documented via
+    openapi_extra, which cannot add components; their $defs (e.g.
+    AnimalCreate inside AnimalBulkCreate) are merged in here so the
+    #/components/schemas/... references resolve.
+    """
+    if app.openapi_schema is None:
+        schema = _default_openapi()
+        components = schema.setdefault("components", {}).setdefault("schemas", {})
+        for name, definition in BODY_SCHEMA_DEFS.items():
+            components.setdefault(name, definition)
+    return app.openapi_schema
+
+
+app.openapi = _openapi
+
+
 # Register exception handlers
 app.add_exception_handler(EntityNotFoundError, entity_not_found_handler)
 app.add_exception_handler(EntityAlreadyExistsError, entity_already_exists_handler)
@@ -581,7 +607,7 @@ async def root():
         "name": settings.APP_NAME,
         "version": settings.APP_VERSION,
         "status": "running",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": datetime.now(timezone.utc),
         "docs": "/docs",
         "api": "/api/v1",
     }
@@ -602,10 +628,29 @@ async def health_check():
     return {
         "status": "healthy" if db_healthy else "degraded",
         "database": "connected" if db_healthy else "disconnected",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": datetime.now(timezone.utc),
     }
 
 
+async def pool_stats():
+    """
+    Database connection pool usage.
+    
+    A steadily non-zero overflow means pool_size is too small for the
+    camera concurrency; checked_out at size + max_overflow means requests
+    are queueing for connections.
+    """
+    from app.core.database import get_pool_stats
+    
+    return get_pool_stats()
+
+
+# Pool internals are for debugging only — the route does not exist in
+# production (hiding it from the docs would leave it reachable)
+if settings.DEBUG:
+    app.add_api_route("/debug/pool", pool_stats, methods=["GET"])
+
+
 # Startup event
 @app.on_event("startup")
 async def startup_event():
@@ -617,9 +662,20 @@ async def startup_event():
     from app.core.database import check_db_connection
     from app.api.v1.websocket import initialize_ws_manager
     from app.services.ai.yolo_service import initialize_yolo_service
+    from app.repositories.detection_counter import initialize_detection_counter
+    from app.repositories.weight_measurement_writer import initialize_weight_writer
+    from app.repositories.weight_stats_view import initialize_stats_view_refresher
+    
+    logger.info("Starting %s v%s", settings.APP_NAME, settings.APP_VERSION)
+    logger.info("Debug mode: %s", settings.DEBUG)
     
-    logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
-    logger.info(f"Debug mode: {settings.DEBUG}")
+    # Eager tasks (Python 3.12+): create_task() runs the coroutine inline up
+    # to its first real suspension — broadcasts with no clients, cache hits
+    # etc. finish without a trip through the loop's ready queue. Set before
+    # any background task below is created.
+    if settings.ASYNCIO_EAGER_TASKS and hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+        logger.info("✓ Eager task factory enabled")
     
     # Check database connection
     db_healthy = await check_db_connection()
@@ -632,12 +688,24 @@ async def startup_event():
     initialize_ws_manager()
     logger.info("✓ WebSocket manager initialized")
     
+    # Start coalesced detection counter writer
+    initialize_detection_counter()
+    logger.info("✓ Detection counter coalescer started")
+    
+    # Start buffered weight measurement writer
+    initialize_weight_writer()
+    logger.info("✓ Weight measurement writer started")
+    
+    # Periodic refresh of the precomputed 30-day weight stats
+    initialize_stats_view_refresher()
+    logger.info("✓ Weight stats view refresher started")
+    
     # Load AI models
     try:
         await initialize_yolo_service()
         logger.info("✓ AI models loaded successfully")
     except Exception as e:
-        logger.error(f"✗ AI model loading failed: {e}")
+        logger.error("✗ AI model loading failed: %s", e)
         logger.warning("API will start but AI endpoints will not work")
     
     logger.info("✓ Application startup complete")
@@ -654,6 +722,9 @@ async def shutdown_event():
     from app.core.database import close_db
     from app.api.v1.websocket import shutdown_ws_manager
     from app.services.ai.yolo_service import shutdown_yolo_service
+    from app.repositories.detection_counter import shutdown_detection_counter
+    from app.repositories.weight_measurement_writer import shutdown_weight_writer
+    from app.repositories.weight_stats_view import shutdown_stats_view_refresher
     
     logger.info("Shutting down application...")
     
@@ -662,12 +733,28 @@ async def shutdown_event():
         await shutdown_yolo_service()
         logger.info("✓ AI models unloaded")
     except Exception as e:
-        logger.error(f"Error unloading AI models: {e}")
+        logger.error("Error unloading AI models: %s", e)
     
     # Shutdown WebSocket connections
     await shutdown_ws_manager()
     logger.info("✓ WebSocket connections closed")
     
+    await shutdown_stats_view_refresher()
+    
+    # Drain buffered weight measurements (needs the DB, so before close_db)
+    try:
+        await shutdown_weight_writer()
+        logger.info("✓ Weight measurement writer drained")
+    except Exception as e:
+        logger.error("Error draining weight measurement writer: %s", e)
+    
+    # Flush pending detection counters (needs the DB, so before close_db)
+    try:
+        await shutdown_detection_counter()
+        logger.info("✓ Detection counters flushed")
+    except Exception as e:
+        logger.error("Error flushing detection counters: %s", e)
+    
     # Close database
     await close_db()
     logger.info("✓ Database connections closed")
@@ -683,7 +770,7 @@ async def global_exception_handler(request, exc):
     
     Catches all unhandled exceptions and returns proper error response.
     """
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
     return JSONResponse(
         status_code=500,
         content={
@@ -702,4 +789,8 @@ if __name__ == "__main__":
         port=settings.PORT,
         reload=settings.DEBUG,  # Auto-reload in development
         log_level=settings.LOG_LEVEL.lower(),
+        loop="auto",  # uvloop when installed (uvicorn[standard]), else asyncio
+        # Live updates are ~150 B frames: deflate costs CPU + a zlib context
+        # per connection and saves next to nothing
+        ws_per_message_deflate=False,
     )
\ No newline at end of file
@@ -5,9 +5,9 @@ This module defines the Animal model which represents individual animals
 in the farm monitoring system.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
-from sqlalchemy import String, Enum as SQLEnum, Index, CheckConstraint
+from sqlalchemy import String, DateTime, Enum as SQLEnum, Index, CheckConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import enum
 
@@ -103,13 +103,17 @@ class Animal(BaseModel):
     )
     
     # Dates
+    # TIMESTAMPTZ: asyncpg binds/returns aware UTC datetimes natively
     birth_date: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
         nullable=True,
         comment="Date of birth (if known)",
     )
     
     acquisition_date: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
         nullable=False,
+        server_default=func.now(),  # Berilmasa DB o'zi qo'yadi
         comment="Date when animal was acquired/added to farm",
     )
     
@@ -124,11 +128,13 @@ class Animal(BaseModel):
     
     # Detection Tracking
     first_detected_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
         nullable=True,
         comment="First time detected by camera system",
     )
     
     last_detected_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
         nullable=True,
         index=True,
         comment="Most recent detection timestamp",
@@ -198,7 +204,7 @@ class Animal(BaseModel):
         """
         if not self.birth_date:
             return None
-        return (datetime.utcnow() - self.birth_date).days
+        return (datetime.now(timezone.utc) - self.birth_date).days
     
     @property
     def is_active(self) -> bool:
@@ -215,7 +221,7 @@ class Animal(BaseModel):
             detected_at: Detection timestamp (defaults to now)
         """
         if detected_at is None:
-            detected_at = datetime.utcnow()
+            detected_at = datetime.now(timezone.utc)
         
         if self.first_detected_at is None:
             self.first_detected_at = detected_at
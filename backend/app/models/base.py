@@ -6,8 +6,9 @@ and common mixins for timestamp tracking and soft deletes.
 """
 
 from datetime import datetime
-from typing import Any
-from sqlalchemy import DateTime, Boolean, Integer
+from operator import attrgetter
+from typing import Any, Callable
+from sqlalchemy import DateTime, Boolean, Integer, inspect
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -104,9 +105,29 @@ class BaseModel(Base, IDMixin, TimestampMixin):
         Useful for serialization and debugging.
         
         Returns:
-            Dictionary with all column values
+            Dictionary with all column values, keyed by attribute name
         """
-        return {
-            column.name: getattr(self, column.name)
-            for column in self.__table__.columns
-        }
\ No newline at end of file
+        cls = type(self)
+        fields = _FIELDS.get(cls)
+        if fields is None:
+            fields = _FIELDS[cls] = _column_fields(cls)
+        keys, getter = fields
+        return dict(zip(keys, getter(self)))
+
+
+# Per-class (attribute keys, attrgetter), built on first to_dict() call
+# (the mapper is not fully configured yet while the class is declared)
+_FIELDS: dict[type, tuple[tuple[str, ...], Callable[[Any], tuple]]] = {}
+
+
+def _column_fields(cls: type) -> tuple[tuple[str, ...], Callable[[Any], tuple]]:
+    """
+    Column attribute keys of a mapped class, plus one attrgetter for all.
+    
+    Uses the mapper's attribute keys, not table column names: they differ
+    for renamed columns (e.g. estimated_weight_kg → weight_g). BaseModel
+    subclasses always have several columns (id + timestamps), so the
+    getter returns a tuple.
+    """
+    keys = tuple(prop.key for prop in inspect(cls).column_attrs)
+    return keys, attrgetter(*keys)
@@ -0,0 +1,52 @@
+"""
+Custom column types shared by the models.
+"""
+
+from typing import Any, Optional
+
+from sqlalchemy import Integer
+from sqlalchemy.types import TypeDecorator
+
+
+class QuantizedFloat(TypeDecorator):
+    """
+    Float in Python, fixed-point integer in the database.
+
+    Stores ``round(value * scale)`` in an integer column (``impl``) and
+    divides by ``scale`` on the way back. Bound parameters go through the
+    same conversion, so comparisons like ``col >= 0.7`` work unchanged.
+
+    Raw paths that bypass SQLAlchemy types (COPY, text() SQL) must use
+    :meth:`to_db` / the scale themselves.
+
+    Args:
+        scale: Units per 1.0 (e.g. 1000 → grams for a kg value)
+        impl:  Integer type to store (Integer, SmallInteger)
+    """
+
+    impl = Integer
+    cache_ok = True
+
+    def __init__(self, scale: int, impl: Any = Integer) -> None:
+        super().__init__()
+        self.impl = impl() if isinstance(impl, type) else impl
+        self.scale = scale
+
+    def to_db(self, value: Optional[float]) -> Optional[int]:
+        """Python float → stored integer."""
+        if value is None:
+            return None
+        return round(value * self.scale)
+
+    def process_bind_param(self, value: Optional[float], dialect) -> Optional[int]:
+        return self.to_db(value)
+
+    def process_result_value(self, value: Any, dialect) -> Optional[float]:
+        if value is None:
+            return None
+        # avg() etc. return numeric → Decimal; normalize to float
+        return float(value) / self.scale
+
+    @property
+    def python_type(self) -> type:
+        return float
@@ -9,22 +9,30 @@ DESIGN CONSIDERATIONS:
 - Time-series data (indexed by timestamp)
 - Store raw AI data (JSONB) for future model improvements
 - Relationship to Animal entity
+- Fixed-point storage: weight as int4 grams, confidence as int2 basis
+  points (1/10000) — half the width of two float8 columns
+- TimescaleDB hypertable (7-day chunks) where the extension is available;
+  the primary key there is (id, timestamp), see migration 0011
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, Any
 from sqlalchemy import (
     String,
-    Float,
+    Integer,
+    SmallInteger,
     DateTime,
     ForeignKey,
     Index,
     CheckConstraint,
     JSON,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.ext.hybrid import hybrid_property
 
 from app.models.base import BaseModel
+from app.models.types import QuantizedFloat
 
 
 class WeightMeasurement(BaseModel):
@@ -46,7 +54,9 @@ class WeightMeasurement(BaseModel):
         animal: The Animal this measurement belongs to
         
     Indexes:
-        - animal_id + timestamp (for per-animal time-series queries)
+        - animal_id + timestamp DESC, INCLUDE weight/confidence
+          (per-animal time-series queries and stats, index-only)
+        - timestamp DESC WHERE confidence >= 0.7 (recent global feed)
         - timestamp only (for global time-series queries)
         - confidence_score (for filtering low-quality measurements)
     """
@@ -69,17 +79,21 @@ class WeightMeasurement(BaseModel):
         comment="When the measurement was captured (camera timestamp)",
     )
     
+    # Stored as integer grams; the attribute is still kilograms (float)
     estimated_weight_kg: Mapped[float] = mapped_column(
-        Float,
+        "weight_g",
+        QuantizedFloat(1000, Integer),
         nullable=False,
-        comment="AI-estimated weight in kilograms",
+        comment="AI-estimated weight in grams (attribute: kilograms)",
     )
     
+    # Stored as basis points 0..10000; the attribute is still 0.0 - 1.0
     confidence_score: Mapped[float] = mapped_column(
-        Float,
+        "confidence_i",
+        QuantizedFloat(10_000, SmallInteger),
         nullable=False,
         index=True,
-        comment="AI model confidence score (0.0 to 1.0)",
+        comment="AI model confidence in 1/10000 units (attribute: 0.0 to 1.0)",
     )
     
     # Camera Information
@@ -128,24 +142,32 @@ class WeightMeasurement(BaseModel):
     __table_args__ = (
         # Constraint: confidence_score must be between 0 and 1
         CheckConstraint(
-            "confidence_score >= 0.0 AND confidence_score <= 1.0",
+            "confidence_i >= 0 AND confidence_i <= 10000",
             name="check_confidence_range",
         ),
         # Constraint: weight must be positive
         CheckConstraint(
-            "estimated_weight_kg > 0",
+            "weight_g > 0",
             name="check_weight_positive",
         ),
-        # Composite index for time-series queries per animal
+        # Composite index for time-series queries per animal.
+        # DESC matches every ORDER BY; INCLUDE makes stats index-only.
         Index(
             "ix_weight_measurements_animal_time",
             "animal_id",
-            "timestamp",
+            text('"timestamp" DESC'),
+            postgresql_include=["weight_g", "confidence_i"],
+        ),
+        # Partial index for the live feed (get_recent_global)
+        Index(
+            "ix_weight_measurements_recent_confident",
+            text('"timestamp" DESC'),
+            postgresql_where=text("confidence_i >= 7000"),
         ),
         # Index for filtering high-confidence measurements
         Index(
             "ix_weight_measurements_confidence",
-            "confidence_score",
+            "confidence_i",
         ),
         # Index for per-camera analytics
         Index(
@@ -165,11 +187,14 @@ class WeightMeasurement(BaseModel):
             f"camera={self.camera_id})>"
         )
     
-    @property
+    @hybrid_property
     def is_high_confidence(self) -> bool:
         """
         Check if this is a high-confidence measurement.
         
+        Hybrid property: evaluates in Python on instances and compiles to
+        SQL on the class, e.g. ``.where(WeightMeasurement.is_high_confidence)``.
+        
         Returns:
             True if confidence >= 0.8 (configurable threshold)
         """
@@ -183,4 +208,4 @@ class WeightMeasurement(BaseModel):
         Returns:
             Seconds since measurement was taken
         """
-        return (datetime.utcnow() - self.timestamp).total_seconds()
\ No newline at end of file
+        return (datetime.now(timezone.utc) - self.timestamp).total_seconds()
\ No newline at end of file
@@ -8,18 +8,161 @@ PATTERN: Repository pattern isolates DB layer from business logic.
 Service layer calls repository; repository never calls service.
 """
 
-from typing import Optional, Sequence
-from sqlalchemy import select, func, and_
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, AsyncIterator, Optional, Sequence
+from sqlalchemy import (
+    Row, Integer, select, update, delete, func, and_, any_, bindparam,
+    lambda_stmt, text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from app.models.animal import Animal, AnimalStatus, AnimalSpecies
+from app.models.detection import Detection
 from app.schemas.animal import AnimalCreate, AnimalUpdate
-from app.core.exceptions import DatabaseError
+from app.core.cache import TTLCache
+from app.core.database import on_commit
+from app.core.exceptions import DB_ERRORS, DatabaseError, db_operation
+from app.repositories.detection_counter import get_detection_counter
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# Hot single-row lookups, built once at import. lambda_stmt caches the
+# compiled SQL, so repeated calls skip statement construction/compilation.
+#
+# Animal.detections / Animal.weight_measurements are lazy="selectin" on the
+# model, so every entity load would also pull each animal's FULL detection
+# and weight history — 1 + 2 queries per statement, unbounded rows — while
+# AnimalResponse serializes none of it. Every entity statement below opts
+# out with raiseload("*"): an accidental access raises instead of silently
+# issuing (or, under asyncio, failing) a lazy load.
+_GET_BY_ID = lambda_stmt(
+    lambda: select(Animal)
+    .options(raiseload("*"))
+    .where(Animal.id == bindparam("pk"))
+)
+# tag_id is stored upper-cased (schema validators) → plain equality hits
+# the unique B-tree ix_animals_tag_id; upper(tag_id) would not.
+_GET_BY_TAG_ID = lambda_stmt(
+    lambda: select(Animal)
+    .options(raiseload("*"))
+    .where(Animal.tag_id == bindparam("tag"))
+)
+# id = ANY(:ids) binds ONE array parameter — a single cached statement for
+# any number of ids (IN-expansion would compile one variant per length)
+_GET_BY_IDS = select(Animal).options(raiseload("*")).where(
+    Animal.id == any_(bindparam("ids", type_=ARRAY(Integer)))
+)
+_GET_TAGS_BY_IDS = select(Animal.id, Animal.tag_id).where(
+    Animal.id == any_(bindparam("ids", type_=ARRAY(Integer)))
+)
+_GET_STATUS_AND_TAG = lambda_stmt(
+    lambda: select(Animal.status, Animal.tag_id)
+    .where(Animal.id == bindparam("pk"))
+)
+_GET_FIRST_ACTIVE = lambda_stmt(
+    lambda: select(Animal)
+    .options(raiseload("*"))
+    .where(Animal.status == AnimalStatus.ACTIVE)
+    .order_by(Animal.id)
+    .limit(1)
+)
+
+
+# Process-wide id → tag_id for existence checks on the measurement paths
+# (every create / list / stats call validates its animal). Only hits are
+# cached, so new animals show up at once; update/delete through this
+# repository drop the entry once committed, other workers see a change
+# within the TTL.
+_TAG_BY_ID = TTLCache(ttl=30.0, max_size=10_000)
+
+
+# List/count statements: one per filter shape, built and compiled once.
+# Filter values, cursor and page bounds are bind parameters, so every call
+# with the same shape reuses the engine's compiled-SQL cache entry.
+def _filter_clauses(has_species: bool, has_status: bool) -> list:
+    """WHERE clauses for a filter shape (values bound as :species/:status)."""
+    clauses = []
+    if has_species:
+        clauses.append(Animal.species == bindparam("species"))
+    if has_status:
+        clauses.append(Animal.status == bindparam("status"))
+    return clauses
+
+
+# Species filter string → enum (dict lookup, no ValueError on bad input)
+_SPECIES_BY_VALUE = {s.value: s for s in AnimalSpecies}
+
+
+# Scalar columns served by list endpoints (AnimalResponse fields).
+# Selecting these instead of the entity skips ORM hydration, identity-map
+# bookkeeping and the selectin-loaded detection/weight collections.
+_LIST_COLUMNS = (
+    Animal.id,
+    Animal.tag_id,
+    Animal.species,
+    Animal.breed,
+    Animal.gender,
+    Animal.birth_date,
+    Animal.acquisition_date,
+    Animal.status,
+    Animal.notes,
+    Animal.first_detected_at,
+    Animal.last_detected_at,
+    Animal.total_detections,
+    Animal.created_at,
+    Animal.updated_at,
+)
+
+
+@lru_cache(maxsize=None)
+def _list_stmt(
+    has_species: bool,
+    has_status: bool,
+    keyset: bool,
+    rows: bool = False,
+    with_total: bool = False,
+):
+    clauses = _filter_clauses(has_species, has_status)
+    if keyset:
+        clauses.append(Animal.id > bindparam("after_id"))
+
+    stmt = (
+        select(*_LIST_COLUMNS) if rows
+        else select(Animal).options(raiseload("*"))
+    )
+    if with_total:
+        # Window runs over the filtered set before LIMIT/OFFSET → full total
+        stmt = stmt.add_columns(func.count().over().label("_total"))
+    if clauses:
+        stmt = stmt.where(and_(*clauses))
+    stmt = stmt.order_by(Animal.id).limit(bindparam("limit"))
+    if not keyset:
+        stmt = stmt.offset(bindparam("skip"))
+    return stmt
+
+
+# Planner row estimate for the whole table (kept fresh by autovacuum/ANALYZE)
+_ESTIMATE_COUNT = text(
+    "SELECT reltuples::bigint FROM pg_class WHERE oid = 'animals'::regclass"
+)
+# Below this size an exact count(*) is cheap and the estimate is too coarse
+_ESTIMATE_MIN_ROWS = 100_000
+
+
+@lru_cache(maxsize=None)
+def _count_stmt(has_species: bool, has_status: bool):
+    clauses = _filter_clauses(has_species, has_status)
+    stmt = select(func.count()).select_from(Animal)
+    if clauses:
+        stmt = stmt.where(and_(*clauses))
+    return stmt
+
+
 class AnimalRepository:
     """
     Repository for Animal entity database operations.
@@ -33,267 +176,554 @@ class AnimalRepository:
 
     def __init__(self, db: AsyncSession) -> None:
         self.db = db
+        # Per-session lookup cache: ("id", pk) / ("tag", tag_id) → Animal.
+        # Lives in session.info, so every repository sharing this request's
+        # session sees it and it disappears with the session.
+        self._cache: dict[tuple[str, Any], Animal] = db.info.setdefault(
+            "animal_cache", {}
+        )
+
+    def _remember(self, animal: Animal) -> Animal:
+        """Cache an animal under both lookup keys."""
+        self._cache[("id", animal.id)] = animal
+        self._cache[("tag", animal.tag_id)] = animal
+        return animal
+
+    def _forget(self, animal_id: int) -> None:
+        """Drop every cached key pointing at this animal."""
+        for key in [k for k, v in self._cache.items() if v.id == animal_id]:
+            del self._cache[key]
 
     # -------------------------------------------------------------------------
     # CREATE
     # -------------------------------------------------------------------------
 
-    async def create(self, animal_data: AnimalCreate) -> Animal:
+    @db_operation("Failed to create animal")
+    async def create(self, animal_data: AnimalCreate) -> Optional[Animal]:
         """
-        Insert a new animal row.
+        Insert a new animal row unless its tag_id is already taken.
 
-        NOTE: Does NOT check uniqueness — that is the Service layer's job.
+        The unique index on tag_id is the uniqueness check: the INSERT
+        uses ON CONFLICT (tag_id) DO NOTHING, so no SELECT is needed first
+        and concurrent creates cannot both pass. Deciding what a conflict
+        means is the Service layer's job.
 
         Args:
             animal_data: Validated Pydantic schema
 
         Returns:
-            Persisted Animal ORM instance (with generated id)
+            Persisted Animal ORM instance (with generated id),
+            or None if an animal with this tag_id already exists
 
         Raises:
             DatabaseError: On any SQLAlchemy/DB-level failure
         """
-        try:
-            animal = Animal(**animal_data.model_dump())
-            self.db.add(animal)
-            await self.db.flush()          # Get generated PK without commit
-            await self.db.refresh(animal)  # Load DB-computed defaults
-            logger.debug(f"[repo] Created animal pk={animal.id} tag={animal.tag_id}")
-            return animal
-        except Exception as exc:
-            logger.error(f"[repo] create failed: {exc}", exc_info=True)
-            raise DatabaseError(
-                message="Failed to create animal",
-                details={"error": str(exc)},
-            ) from exc
+        # INSERT ... RETURNING: PK and server defaults in one round-trip.
+        # None fields are omitted so server defaults (acquisition_date)
+        # apply instead of an explicit NULL.
+        result = await self.db.execute(
+            pg_insert(Animal)
+            .values(**animal_data.model_dump(exclude_none=True))
+            .on_conflict_do_nothing(index_elements=[Animal.tag_id])
+            .returning(Animal)
+            .options(raiseload("*"))
+        )
+        animal = result.scalar_one_or_none()
+        if animal is None:
+            return None
+        logger.debug("[repo] Created animal pk=%s tag=%s", animal.id, animal.tag_id)
+        return self._remember(animal)
+
+    @db_operation("Failed to create animals")
+    async def create_many(self, animals: Sequence[AnimalCreate]) -> list[Animal]:
+        """
+        Insert many animals, skipping tag_ids that are already taken.
+
+        Same ON CONFLICT (tag_id) DO NOTHING as create(), sent as one
+        multi-row INSERT ... RETURNING per column set (rows omitting
+        different optional fields can't share a VALUES list).
+
+        Returns:
+            The inserted animals; conflicting tag_ids are simply absent
+        """
+        by_columns: dict[frozenset, list[dict]] = {}
+        for animal_data in animals:
+            params = animal_data.model_dump(exclude_none=True)
+            by_columns.setdefault(frozenset(params), []).append(params)
+
+        created: list[Animal] = []
+        for rows in by_columns.values():
+            result = await self.db.execute(
+                pg_insert(Animal)
+                .values(rows)
+                .on_conflict_do_nothing(index_elements=[Animal.tag_id])
+                .returning(Animal)
+                .options(raiseload("*"))
+            )
+            created.extend(self._remember(a) for a in result.scalars())
+
+        logger.debug("[repo] Created %s/%s animals", len(created), len(animals))
+        return created
 
     # -------------------------------------------------------------------------
     # READ — single
     # -------------------------------------------------------------------------
 
+    @db_operation("Failed to fetch animal id={animal_id}")
     async def get_by_id(self, animal_id: int) -> Optional[Animal]:
         """
         Fetch animal by primary key.
 
+        Repeated lookups within the same session are served from the
+        per-session cache (no round-trip).
+
         Returns:
             Animal instance or None if not found
         """
-        try:
-            result = await self.db.execute(
-                select(Animal).where(Animal.id == animal_id)
-            )
-            return result.scalar_one_or_none()
-        except Exception as exc:
-            logger.error(f"[repo] get_by_id({animal_id}) failed: {exc}")
-            raise DatabaseError(
-                message=f"Failed to fetch animal id={animal_id}",
-                details={"error": str(exc)},
-            ) from exc
+        cached = self._cache.get(("id", animal_id))
+        if cached is not None:
+            return cached
+
+        result = await self.db.execute(_GET_BY_ID, {"pk": animal_id})
+        animal = result.scalar_one_or_none()
+        return self._remember(animal) if animal else None
+
+    @db_operation("Failed to fetch animals by ids")
+    async def get_by_ids(self, animal_ids: Sequence[int]) -> dict[int, Animal]:
+        """
+        Fetch many animals by primary key in ONE query.
+
+        Use instead of looping get_by_id(). Ids already in the per-session
+        cache are not fetched again.
+
+        Returns:
+            {id: Animal} for the ids that exist (missing ids are absent)
+        """
+        found: dict[int, Animal] = {}
+        missing: list[int] = []
+        for animal_id in dict.fromkeys(animal_ids):
+            cached = self._cache.get(("id", animal_id))
+            if cached is not None:
+                found[animal_id] = cached
+            else:
+                missing.append(animal_id)
+
+        if not missing:
+            return found
+
+        result = await self.db.execute(_GET_BY_IDS, {"ids": missing})
+        for animal in result.scalars():
+            found[animal.id] = self._remember(animal)
+        return found
+
+    @db_operation("Failed to fetch animal tags")
+    async def get_tag_ids(self, animal_ids: Sequence[int]) -> dict[int, str]:
+        """
+        Resolve animal ids to tag_ids — the cheap existence check.
 
+        Served from a process-wide 30 s cache; misses are fetched in ONE
+        (id, tag_id) query, no entity is loaded.
+
+        Returns:
+            {id: tag_id} for the ids that exist (missing ids are absent)
+        """
+        found: dict[int, str] = {}
+        missing: list[int] = []
+        for animal_id in dict.fromkeys(animal_ids):
+            tag_id = _TAG_BY_ID.get(animal_id)
+            if tag_id is not TTLCache.MISS:
+                found[animal_id] = tag_id
+            else:
+                missing.append(animal_id)
+
+        if not missing:
+            return found
+
+        result = await self.db.execute(_GET_TAGS_BY_IDS, {"ids": missing})
+        for animal_id, tag_id in result:
+            _TAG_BY_ID.put(animal_id, tag_id)
+            found[animal_id] = tag_id
+        return found
+
+    @db_operation("Failed to fetch animal id={animal_id}")
+    async def get_status_and_tag(self, animal_id: int) -> Optional[Row]:
+        """
+        Fetch only (status, tag_id) for an animal.
+
+        For service-side guards before update/delete: no ORM instance is
+        built or tracked and the eager-loaded relationships are skipped.
+
+        Returns:
+            Row with .status and .tag_id, or None if not found
+        """
+        result = await self.db.execute(_GET_STATUS_AND_TAG, {"pk": animal_id})
+        return result.one_or_none()
+
+    @db_operation("Failed to fetch animal tag={tag_id}")
     async def get_by_tag_id(self, tag_id: str) -> Optional[Animal]:
         """
-        Fetch animal by tag identifier (case-insensitive).
+        Fetch animal by tag identifier.
 
         Args:
-            tag_id: e.g. "jnv-001" or "JNV-001" — treated equally
+            tag_id: Normalized (upper-case) tag, e.g. "JNV-001".
+                    AnimalCreate/AnimalUpdate validators and the service
+                    layer normalize input before it gets here.
 
         Returns:
             Animal instance or None
         """
-        try:
-            result = await self.db.execute(
-                select(Animal).where(
-                    func.upper(Animal.tag_id) == tag_id.upper()
-                )
-            )
-            return result.scalar_one_or_none()
-        except Exception as exc:
-            logger.error(f"[repo] get_by_tag_id({tag_id}) failed: {exc}")
-            raise DatabaseError(
-                message=f"Failed to fetch animal tag={tag_id}",
-                details={"error": str(exc)},
-            ) from exc
+        cached = self._cache.get(("tag", tag_id))
+        if cached is not None:
+            return cached
+
+        result = await self.db.execute(
+            _GET_BY_TAG_ID, {"tag": tag_id}
+        )
+        animal = result.scalar_one_or_none()
+        return self._remember(animal) if animal else None
 
     # -------------------------------------------------------------------------
     # READ — collection
     # -------------------------------------------------------------------------
 
+    @db_operation("Failed to fetch animals")
     async def get_all(
         self,
         skip: int = 0,
         limit: int = 100,
         species: Optional[str] = None,
         status: Optional[AnimalStatus] = None,
+        after_id: Optional[int] = None,
     ) -> Sequence[Animal]:
         """
         Paginated list with optional filters.
 
+        Prefer ``after_id`` (keyset) over ``skip``: OFFSET makes Postgres
+        read and discard every skipped row, so deep pages get slower;
+        ``WHERE id > :after_id`` seeks straight to the page via the PK.
+
         Args:
-            skip:    Offset for pagination
-            limit:   Page size (caller should cap at 100)
-            species: Filter by species string (e.g. "cattle")
-            status:  Filter by AnimalStatus enum
+            skip:     Offset for pagination (ignored when after_id is set)
+            limit:    Page size (caller should cap at 100)
+            species:  Filter by species string (e.g. "cattle")
+            status:   Filter by AnimalStatus enum
+            after_id: Keyset cursor — last id of the previous page
 
         Returns:
             Sequence of Animal instances (may be empty)
         """
-        try:
-            stmt = select(Animal)
+        params = self._list_params(skip, limit, species, status, after_id)
+
+        stmt = _list_stmt(
+            "species" in params, "status" in params, "after_id" in params
+        )
+        result = await self.db.execute(stmt, params)
+        return result.scalars().all()
+
+    @db_operation("Failed to fetch animals")
+    async def get_all_rows(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        species: Optional[str] = None,
+        status: Optional[AnimalStatus] = None,
+        after_id: Optional[int] = None,
+    ) -> Sequence[Row]:
+        """
+        Same page as get_all(), as plain column rows instead of entities.
 
-            # Build WHERE clauses dynamically
-            conditions = []
-            if species:
-                try:
-                    conditions.append(
-                        Animal.species == AnimalSpecies(species.lower())
-                    )
-                except ValueError:
-                    logger.warning(f"[repo] Unknown species filter: {species!r} — ignored")
+        For list responses: rows carry exactly the AnimalResponse fields
+        and build directly (``AnimalResponse.from_orm_trusted(row)``).
+        Use get_all() when hydrated Animal instances are needed.
 
-            if status:
-                conditions.append(Animal.status == status)
+        Returns:
+            Sequence of Row (may be empty)
+        """
+        params = self._list_params(skip, limit, species, status, after_id)
 
-            if conditions:
-                stmt = stmt.where(and_(*conditions))
+        stmt = _list_stmt(
+            "species" in params, "status" in params, "after_id" in params,
+            rows=True,
+        )
+        result = await self.db.execute(stmt, params)
+        return result.all()
 
-            stmt = stmt.offset(skip).limit(limit).order_by(Animal.id)
+    async def iter_all(
+        self,
+        species: Optional[str] = None,
+        status: Optional[AnimalStatus] = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[Animal]:
+        """
+        Stream every matching animal through a server-side cursor.
 
-            result = await self.db.execute(stmt)
-            return result.scalars().all()
+        Unlike get_all(), rows are fetched ``batch_size`` at a time, so
+        memory stays flat no matter how many animals match. Intended for
+        exports — relationship collections are NOT loaded.
 
-        except Exception as exc:
-            logger.error(f"[repo] get_all failed: {exc}", exc_info=True)
+        Args:
+            species:    Filter by species string (e.g. "cattle")
+            status:     Filter by AnimalStatus enum
+            batch_size: Rows fetched per cursor round-trip
+
+        Yields:
+            Animal instances ordered by id
+        """
+        params = self._filter_params(species, status)
+        stmt = (
+            select(Animal)
+            .options(
+                raiseload(Animal.detections),
+                raiseload(Animal.weight_measurements),
+            )
+            .order_by(Animal.id)
+            .execution_options(yield_per=batch_size)
+        )
+
+        clauses = _filter_clauses("species" in params, "status" in params)
+        if clauses:
+            stmt = stmt.where(and_(*clauses))
+
+        try:
+            result = await self.db.stream_scalars(stmt, params)
+            async for animal in result:
+                yield animal
+        except DB_ERRORS as exc:
+            logger.error("[repo] iter_all failed: %s", exc, exc_info=True)
             raise DatabaseError(
-                message="Failed to fetch animals",
+                message="Failed to stream animals",
                 details={"error": str(exc)},
             ) from exc
 
-    async def count(
+    @db_operation("Failed to fetch animals")
+    async def get_all_with_total(
         self,
+        skip: int = 0,
+        limit: int = 100,
         species: Optional[str] = None,
         status: Optional[AnimalStatus] = None,
-    ) -> int:
+        after_id: Optional[int] = None,
+    ) -> tuple[Sequence[Row], int]:
         """
-        Count animals matching optional filters.
+        A get_all_rows() page plus the filtered total.
 
-        Used alongside get_all() to build paginated responses.
+        Filtered OFFSET pages get both from ONE statement via
+        ``COUNT(*) OVER ()``. Falls back to a separate count() when the
+        window cannot give the total:
+        - keyset pages (the cursor clause would shrink the count),
+        - unfiltered lists (count() uses the cheap planner estimate on
+          large tables, a window would scan every row),
+        - an empty page past the end (no row to carry the total).
 
         Returns:
-            Integer count
+            (rows, total)
         """
-        try:
-            stmt = select(func.count()).select_from(Animal)
+        params = self._list_params(skip, limit, species, status, after_id)
+        filtered = "species" in params or "status" in params
+
+        if after_id is None and filtered:
+            stmt = _list_stmt(
+                "species" in params, "status" in params, False,
+                rows=True, with_total=True,
+            )
+            rows = (await self.db.execute(stmt, params)).all()
+            if rows:
+                return rows, rows[0]._total
+            if not skip:
+                return rows, 0
+        else:
+            rows = await self.get_all_rows(skip, limit, species, status, after_id)
 
-            conditions = []
-            if species:
-                try:
-                    conditions.append(
-                        Animal.species == AnimalSpecies(species.lower())
-                    )
-                except ValueError:
-                    pass
+        return rows, await self.count(species=species, status=status)
 
-            if status:
-                conditions.append(Animal.status == status)
+    @db_operation("Failed to count animals")
+    async def count(
+        self,
+        species: Optional[str] = None,
+        status: Optional[AnimalStatus] = None,
+    ) -> int:
+        """
+        Count animals matching optional filters.
 
-            if conditions:
-                stmt = stmt.where(and_(*conditions))
+        Used alongside get_all() to build paginated responses.
 
-            result = await self.db.execute(stmt)
-            return result.scalar_one()
+        Unfiltered counts on a large table use the planner estimate
+        (pg_class.reltuples) instead of an O(rows) count(*) scan.
 
-        except Exception as exc:
-            logger.error(f"[repo] count failed: {exc}", exc_info=True)
-            raise DatabaseError(
-                message="Failed to count animals",
-                details={"error": str(exc)},
-            ) from exc
+        Returns:
+            Integer count
+        """
+        params = self._filter_params(species, status)
+
+        if not params:
+            estimate = (await self.db.execute(_ESTIMATE_COUNT)).scalar_one()
+            if estimate >= _ESTIMATE_MIN_ROWS:
+                return estimate
+
+        stmt = _count_stmt("species" in params, "status" in params)
+        result = await self.db.execute(stmt, params)
+        return result.scalar_one()
+
+    @classmethod
+    def _list_params(
+        cls,
+        skip: int,
+        limit: int,
+        species: Optional[str],
+        status: Optional[AnimalStatus],
+        after_id: Optional[int],
+    ) -> dict[str, Any]:
+        """Bind parameters for a list page (keyset when after_id is set)."""
+        params = cls._filter_params(species, status)
+        params["limit"] = limit
+        if after_id is not None:
+            params["after_id"] = after_id
+        else:
+            params["skip"] = skip
+        return params
+
+    @staticmethod
+    def _filter_params(
+        species: Optional[str],
+        status: Optional[AnimalStatus],
+    ) -> dict[str, Any]:
+        """Translate optional list filters into bind parameter values."""
+        params: dict[str, Any] = {}
+        if species:
+            species_enum = _SPECIES_BY_VALUE.get(species.lower())
+            if species_enum is not None:
+                params["species"] = species_enum
+            else:
+                logger.warning("[repo] Unknown species filter: %r — ignored", species)
+
+        if status:
+            params["status"] = status
+
+        return params
 
     # -------------------------------------------------------------------------
     # UPDATE
     # -------------------------------------------------------------------------
 
+    @db_operation("Failed to update animal id={animal_id}")
     async def update(
         self,
         animal_id: int,
         update_data: AnimalUpdate,
+        blocked_statuses: Sequence[AnimalStatus] = (),
     ) -> Optional[Animal]:
         """
         Partial update — only non-None fields are applied.
 
         Args:
-            animal_id:   PK of the animal to update
-            update_data: Pydantic schema; None fields are skipped
+            animal_id:        PK of the animal to update
+            update_data:      Pydantic schema; None fields are skipped
+            blocked_statuses: Leave the row untouched if its current status
+                              is one of these (checked in the same statement)
 
         Returns:
-            Updated Animal instance, or None if not found
+            Updated Animal instance, or None if not found / blocked
 
         Raises:
             DatabaseError: On DB failure
         """
-        try:
-            animal = await self.get_by_id(animal_id)
-            if not animal:
-                return None
-
-            # Apply only fields that were explicitly set
-            update_fields = update_data.model_dump(exclude_none=True)
-            for field, value in update_fields.items():
-                setattr(animal, field, value)
-
-            await self.db.flush()
-            await self.db.refresh(animal)
-
-            logger.debug(
-                f"[repo] Updated animal pk={animal_id} "
-                f"fields={list(update_fields.keys())}"
+        guard = [Animal.id == animal_id]
+        if blocked_statuses:
+            guard.append(Animal.status.notin_(blocked_statuses))
+
+        # Apply only fields that were explicitly set
+        update_fields = update_data.model_dump(exclude_none=True)
+        if not update_fields:
+            if not blocked_statuses:
+                return await self.get_by_id(animal_id)
+            result = await self.db.execute(
+                select(Animal).options(raiseload("*")).where(*guard)
             )
-            return animal
+            return result.scalar_one_or_none()
 
-        except DatabaseError:
-            raise
-        except Exception as exc:
-            logger.error(f"[repo] update({animal_id}) failed: {exc}", exc_info=True)
-            raise DatabaseError(
-                message=f"Failed to update animal id={animal_id}",
-                details={"error": str(exc)},
-            ) from exc
+        # Single UPDATE ... RETURNING — no existence SELECT beforehand
+        result = await self.db.execute(
+            update(Animal)
+            .where(*guard)
+            .values(**update_fields)
+            .returning(Animal)
+            .options(raiseload("*"))
+            .execution_options(
+                synchronize_session=False,
+                populate_existing=True,
+            )
+        )
+        animal = result.scalar_one_or_none()
+        self._forget(animal_id)   # tag_id may have changed
+        on_commit(self.db, lambda: _TAG_BY_ID.pop(animal_id))
+        if animal is None:
+            return None
+        self._remember(animal)
+
+        logger.debug(
+            "[repo] Updated animal pk=%s fields=%s",
+            animal_id,
+            list(update_fields.keys()),
+        )
+        return animal
 
     # -------------------------------------------------------------------------
     # DELETE
     # -------------------------------------------------------------------------
 
-    async def delete(self, animal_id: int) -> bool:
+    @db_operation("Failed to delete animal id={animal_id}")
+    async def delete(
+        self,
+        animal_id: int,
+        blocked_statuses: Sequence[AnimalStatus] = (),
+    ) -> Optional[str]:
         """
         Hard-delete animal by PK.
 
+        Args:
+            animal_id:        PK of the animal to delete
+            blocked_statuses: Keep the row (and its detections) if its
+                              current status is one of these
+
         Returns:
-            True if deleted, False if not found
+            tag_id of the deleted animal, or None if not found / blocked
         """
-        try:
-            animal = await self.get_by_id(animal_id)
-            if not animal:
-                return False
-
-            await self.db.delete(animal)
-            await self.db.flush()
-
-            logger.debug(f"[repo] Deleted animal pk={animal_id}")
-            return True
-
-        except DatabaseError:
-            raise
-        except Exception as exc:
-            logger.error(f"[repo] delete({animal_id}) failed: {exc}", exc_info=True)
-            raise DatabaseError(
-                message=f"Failed to delete animal id={animal_id}",
-                details={"error": str(exc)},
-            ) from exc
+        target = select(Animal.id).where(Animal.id == animal_id)
+        if blocked_statuses:
+            target = target.where(Animal.status.notin_(blocked_statuses))
+        target = target.cte("target")
+
+        # Detections are removed with the animal (ORM cascade semantics);
+        # the FK alone would only SET NULL. Both deletes go out as ONE
+        # statement: WITH ... DELETE FROM detections ... DELETE FROM animals,
+        # both restricted to the guarded target row.
+        # weight_measurements are handled by ON DELETE CASCADE.
+        purge_detections = (
+            delete(Detection)
+            .where(Detection.animal_id.in_(select(target.c.id)))
+            .cte("purged_detections")
+        )
+        result = await self.db.execute(
+            delete(Animal)
+            .where(Animal.id.in_(select(target.c.id)))
+            .add_cte(target, purge_detections)
+            .returning(Animal.tag_id)
+            .execution_options(synchronize_session=False)
+        )
+        self._forget(animal_id)
+        on_commit(self.db, lambda: _TAG_BY_ID.pop(animal_id))
+        tag_id = result.scalar_one_or_none()
+        if tag_id is None:
+            return None
+
+        logger.debug("[repo] Deleted animal pk=%s", animal_id)
+        return tag_id
 
     # -------------------------------------------------------------------------
     # HELPERS (used by pipeline / detection)
     # -------------------------------------------------------------------------
 
+    @db_operation("Failed to fetch first active animal")
     async def get_first_active(self) -> Optional[Animal]:
         """
         Return the first active animal.
@@ -301,47 +731,56 @@ class AnimalRepository:
         Used by the detection pipeline when animal matching is not yet
         implemented (MVP fallback).
         """
-        try:
-            result = await self.db.execute(
-                select(Animal)
-                .where(Animal.status == AnimalStatus.ACTIVE)
-                .order_by(Animal.id)
-                .limit(1)
-            )
-            return result.scalar_one_or_none()
-        except Exception as exc:
-            raise DatabaseError(
-                message="Failed to fetch first active animal",
-                details={"error": str(exc)},
-            ) from exc
+        result = await self.db.execute(_GET_FIRST_ACTIVE)
+        return result.scalar_one_or_none()
 
     async def increment_detection_count(
         self,
         animal_id: int,
     ) -> None:
         """
-        Atomically increment total_detections and update last_detected_at.
+        Increment total_detections and update last_detected_at.
 
         Called by the detection pipeline after each confirmed detection.
+        The event is queued on the DetectionCounterCoalescer and applied
+        with other pending events in a single UPDATE (no round-trip here).
+        Falls back to a direct update when the coalescer is not running.
 
         Args:
             animal_id: PK of the detected animal
         """
-        from datetime import datetime
+        try:
+            get_detection_counter().bump(animal_id)
+            return
+        except RuntimeError:
+            pass
 
         try:
-            animal = await self.get_by_id(animal_id)
-            if not animal:
+            # Same fold as the coalescer, as ONE UPDATE ... RETURNING —
+            # no SELECT first, no ORM flush
+            now = datetime.now(timezone.utc)
+            result = await self.db.execute(
+                update(Animal)
+                .where(Animal.id == animal_id)
+                .values(
+                    total_detections=Animal.total_detections + 1,
+                    first_detected_at=func.coalesce(Animal.first_detected_at, now),
+                    last_detected_at=func.greatest(Animal.last_detected_at, now),
+                )
+                .returning(Animal.id)
+                .execution_options(synchronize_session=False)
+            )
+            self._forget(animal_id)   # cached instance is now stale
+            if result.scalar_one_or_none() is None:
                 logger.warning(
-                    f"[repo] increment_detection_count: animal {animal_id} not found"
+                    "[repo] increment_detection_count: animal %s not found",
+                    animal_id,
                 )
-                return
-
-            animal.mark_detected()   # uses the model helper method
-            await self.db.flush()
 
-        except Exception as exc:
+        except DB_ERRORS as exc:
             logger.error(
-                f"[repo] increment_detection_count({animal_id}) failed: {exc}"
+                "[repo] increment_detection_count(%s) failed: %s",
+                animal_id,
+                exc,
             )
-            # Non-critical — don't raise, just log
\ No newline at end of file
+            # Non-critical — don't raise, just log
@@ -4,17 +4,117 @@ Detection repository — raw YOLO event log data access.
 RESPONSIBILITY: Database access only. No business logic.
 """
 
-from datetime import datetime
-from typing import Optional, Sequence
-from sqlalchemy import select, func, and_, desc
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Iterable, Optional, Sequence
+from sqlalchemy import (
+    Integer, select, insert, func, and_, any_, bindparam, desc, tuple_, text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, selectinload
 
+from app.models.animal import Animal
 from app.models.detection import Detection
-from app.core.exceptions import DatabaseError
+from app.core.cache import TTLCache
+from app.core.database import copy_records
+from app.core.exceptions import DB_ERRORS, DatabaseError, db_operation
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Insertable columns, in COPY order (id / created_at / updated_at are server-side).
+# bulk_ingest() records are tuples in exactly this order.
+COPY_COLUMNS = (
+    "animal_id",
+    "camera_id",
+    "timestamp",
+    "confidence",
+    "class_id",
+    "class_name",
+    "bbox_x",
+    "bbox_y",
+    "bbox_w",
+    "bbox_h",
+    "estimated_weight",
+    "frame_number",
+    "inference_time_ms",
+)
+
+# Rows per statement / COPY chunk — bounds memory on very large batches
+_BATCH_SIZE = 10_000
+
+# count_in_range() results for windows that closed more than
+# _RANGE_SETTLE_LAG ago, keyed (start, end, camera_id). Such counts rarely
+# change, but can: animal deletes purge detections, bulk_ingest backfills
+# past windows, and other workers keep their own copy — hence the TTL.
+_RANGE_COUNT_CACHE = TTLCache(ttl=60.0, max_size=1024)
+_RANGE_SETTLE_LAG = timedelta(minutes=5)
+
+
+# Detection INSERT + animal counter bump in ONE statement (see
+# create_and_touch_animal). With animal_id NULL the UPDATE simply
+# matches nothing; the detection id is still returned.
+_INSERT_AND_TOUCH = text("""
+    WITH ins AS (
+        INSERT INTO detections (
+            animal_id, camera_id, "timestamp", confidence, class_id,
+            class_name, bbox_x, bbox_y, bbox_w, bbox_h,
+            estimated_weight, frame_number, inference_time_ms
+        )
+        VALUES (
+            :animal_id, :camera_id, :timestamp, :confidence, :class_id,
+            :class_name, :bbox_x, :bbox_y, :bbox_w, :bbox_h,
+            :estimated_weight, :frame_number, :inference_time_ms
+        )
+        RETURNING id, animal_id, "timestamp"
+    ), touch AS (
+        UPDATE animals
+           SET total_detections  = animals.total_detections + 1,
+               first_detected_at = COALESCE(animals.first_detected_at, ins."timestamp"),
+               last_detected_at  = GREATEST(animals.last_detected_at, ins."timestamp"),
+               updated_at        = now()
+          FROM ins
+         WHERE animals.id = ins.animal_id
+    )
+    SELECT id FROM ins
+""")
+
+
+def _bbox_columns(bbox: dict) -> dict[str, float]:
+    """Unpack a {"x","y","w","h"} bounding box into its column values."""
+    return {
+        "bbox_x": bbox["x"],
+        "bbox_y": bbox["y"],
+        "bbox_w": bbox["w"],
+        "bbox_h": bbox["h"],
+    }
+
+
+def _row_values(row: dict[str, Any]) -> dict[str, Any]:
+    """Detection create() kwargs → column values (bbox unpacked)."""
+    values = {k: v for k, v in row.items() if k != "bbox"}
+    values.update(_bbox_columns(row["bbox"]))
+    return values
+
+
+def _load_options(load_relations: bool) -> tuple:
+    """
+    Loader options for detection list reads.
+
+    Detection.animal is lazy="selectin" on the model, and Animal in turn
+    selectin-loads its full detection and weight history — so a plain
+    select(Detection) fans out into several extra queries. List reads
+    opt out with raiseload("*") (accidental access raises instead of
+    issuing a hidden SELECT); callers that need the animal get it with
+    ONE extra IN-query and nothing below it.
+    """
+    if load_relations:
+        return (
+            selectinload(Detection.animal).raiseload("*"),
+            raiseload("*"),
+        )
+    return (raiseload("*"),)
+
 
 class DetectionRepository:
     """
@@ -31,6 +131,7 @@ class DetectionRepository:
     # CREATE
     # -------------------------------------------------------------------------
 
+    @db_operation("Failed to create detection")
     async def create(
         self,
         animal_id: Optional[int],
@@ -50,79 +151,256 @@ class DetectionRepository:
         Returns:
             Persisted Detection instance with generated id
         """
-        try:
-            detection = Detection(
+        # INSERT ... RETURNING: PK and server defaults in one round-trip
+        result = await self.db.execute(
+            insert(Detection)
+            .values(
                 animal_id=animal_id,
                 camera_id=camera_id,
                 timestamp=timestamp,
                 confidence=confidence,
                 class_id=class_id,
                 class_name=class_name,
-                bbox=bbox,
+                **_bbox_columns(bbox),
                 estimated_weight=estimated_weight,
                 frame_number=frame_number,
                 inference_time_ms=inference_time_ms,
             )
-            self.db.add(detection)
-            await self.db.flush()
-            await self.db.refresh(detection)
-            logger.debug(f"[repo] Detection created id={detection.id} camera={camera_id}")
-            return detection
-        except Exception as exc:
-            logger.error(f"[repo] Detection.create failed: {exc}", exc_info=True)
+            .returning(Detection)
+        )
+        detection = result.scalar_one()
+        # Hottest write path (per frame, per camera) — skip the call entirely
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "[repo] Detection created id=%s camera=%s",
+                detection.id,
+                camera_id,
+            )
+        return detection
+
+    @db_operation("Failed to create detection")
+    async def create_and_touch_animal(
+        self,
+        animal_id: Optional[int],
+        camera_id: str,
+        timestamp: datetime,
+        confidence: float,
+        class_id: int,
+        class_name: str,
+        bbox: dict,
+        estimated_weight: Optional[float] = None,
+        frame_number: Optional[int] = None,
+        inference_time_ms: Optional[float] = None,
+    ) -> int:
+        """
+        Insert a detection AND bump the animal's detection counters in a
+        single round-trip (data-modifying CTE).
+
+        Ingest code should call this instead of create() followed by
+        AnimalRepository.increment_detection_count() when it needs the
+        animal row current immediately (the coalesced counter is eventually
+        consistent, ~200 ms).
+
+        Returns:
+            Generated detection id
+        """
+        result = await self.db.execute(
+            _INSERT_AND_TOUCH,
+            {
+                "animal_id": animal_id,
+                "camera_id": camera_id,
+                "timestamp": timestamp,
+                "confidence": confidence,
+                "class_id": class_id,
+                "class_name": class_name,
+                **_bbox_columns(bbox),
+                "estimated_weight": estimated_weight,
+                "frame_number": frame_number,
+                "inference_time_ms": inference_time_ms,
+            },
+        )
+        detection_id = result.scalar_one()
+        logger.debug(
+            "[repo] Detection created id=%s camera=%s (animal %s touched)",
+            detection_id,
+            camera_id,
+            animal_id,
+        )
+        return detection_id
+
+    async def create_many(
+        self,
+        rows: Sequence[dict[str, Any]],
+        return_ids: bool = False,
+    ) -> list[int]:
+        """
+        Insert many detection events in as few round-trips as possible.
+
+        Each row is a dict with the same keys as create()'s arguments.
+
+        - return_ids=False: rows are streamed with COPY via bulk_ingest().
+        - return_ids=True:  one multi-row INSERT ... RETURNING id per
+          chunk (SQLAlchemy "insertmanyvalues").
+
+        No per-row flush/refresh on either path.
+
+        Returns:
+            Generated ids in input order (empty list when return_ids=False)
+        """
+        if not rows:
+            return []
+
+        if not return_ids:
+            await self.bulk_ingest(
+                tuple(values.get(col) for col in COPY_COLUMNS)
+                for values in map(_row_values, rows)
+            )
+            return []
+
+        try:
+            ids: list[int] = []
+            for start in range(0, len(rows), _BATCH_SIZE):
+                result = await self.db.execute(
+                    insert(Detection).returning(Detection.id, sort_by_parameter_order=True),
+                    [_row_values(row) for row in rows[start:start + _BATCH_SIZE]],
+                )
+                ids.extend(result.scalars().all())
+            logger.debug("[repo] Detections inserted: %s", len(ids))
+            return ids
+
+        except DB_ERRORS as exc:
+            logger.error("[repo] Detection.create_many failed: %s", exc, exc_info=True)
             raise DatabaseError(
-                message="Failed to create detection",
-                details={"error": str(exc)},
+                message="Failed to create detections",
+                details={"error": str(exc), "rows": len(rows)},
             ) from exc
 
+    @db_operation("Failed to bulk ingest detections")
+    async def bulk_ingest(self, records: Iterable[tuple]) -> int:
+        """
+        High-rate ingest through asyncpg's binary COPY protocol.
+
+        Orders of magnitude faster than any INSERT path for frame-rate
+        detection streams. Records are tuples in COPY_COLUMNS order
+        (bounding box as four floats) and are sent in 10k-row chunks.
+
+        All chunks run inside a SAVEPOINT: a failure rolls back this
+        batch only, leaving the caller's transaction usable.
+
+        Returns:
+            Number of rows written
+        """
+        async with self.db.begin_nested():
+            count = await copy_records(
+                self.db,
+                "detections",
+                COPY_COLUMNS,
+                records,
+                chunk_size=_BATCH_SIZE,
+            )
+        logger.debug("[repo] Detections copied: %s", count)
+        return count
+
     # -------------------------------------------------------------------------
     # READ
     # -------------------------------------------------------------------------
 
+    @db_operation("Failed to fetch detection id={detection_id}")
     async def get_by_id(self, detection_id: int) -> Optional[Detection]:
         """Fetch single detection by PK."""
-        try:
-            result = await self.db.execute(
-                select(Detection).where(Detection.id == detection_id)
-            )
-            return result.scalar_one_or_none()
-        except Exception as exc:
-            raise DatabaseError(
-                message=f"Failed to fetch detection id={detection_id}",
-                details={"error": str(exc)},
-            ) from exc
+        result = await self.db.execute(
+            select(Detection).where(Detection.id == detection_id)
+        )
+        return result.scalar_one_or_none()
 
+    @db_operation("Failed to fetch detections for animal {animal_id}")
     async def get_by_animal(
         self,
         animal_id: int,
         limit: int = 50,
+        load_relations: bool = False,
     ) -> Sequence[Detection]:
         """
         Get recent detections for a specific animal.
 
         Args:
-            animal_id: FK to animals table
-            limit:     Max rows to return (newest first)
+            animal_id:      FK to animals table
+            limit:          Max rows to return (newest first)
+            load_relations: Also load Detection.animal (one IN-query)
+
+        Index: ix_detections_animal_time (animal_id, timestamp DESC)
+        INCLUDE (confidence, class_id) — ordered range scan, no sort.
         """
-        try:
-            result = await self.db.execute(
-                select(Detection)
-                .where(Detection.animal_id == animal_id)
-                .order_by(desc(Detection.timestamp))
-                .limit(limit)
+        result = await self.db.execute(
+            select(Detection)
+            .options(*_load_options(load_relations))
+            .where(Detection.animal_id == animal_id)
+            .order_by(desc(Detection.timestamp))
+            .limit(limit)
+        )
+        return result.scalars().all()
+
+    @db_operation("Failed to fetch detections for animals")
+    async def get_by_animals(
+        self,
+        animal_ids: Sequence[int],
+        limit_per_animal: int = 50,
+    ) -> dict[int, list[Detection]]:
+        """
+        Recent detections for many animals in ONE query.
+
+        Use instead of looping get_by_animal(). Rows are ranked per animal
+        (row_number over timestamp DESC) so each animal gets at most
+        ``limit_per_animal`` of its newest detections.
+
+        Index: ix_detections_animal_time, one range per animal id.
+
+        Returns:
+            {animal_id: [Detection, ...]} newest first; animals without
+            detections are absent
+        """
+        if not animal_ids:
+            return {}
+
+        ranked = (
+            select(
+                Detection.id,
+                func.row_number()
+                .over(
+                    partition_by=Detection.animal_id,
+                    order_by=desc(Detection.timestamp),
+                )
+                .label("rn"),
             )
-            return result.scalars().all()
-        except Exception as exc:
-            raise DatabaseError(
-                message=f"Failed to fetch detections for animal {animal_id}",
-                details={"error": str(exc)},
-            ) from exc
+            .where(
+                Detection.animal_id
+                == any_(bindparam("ids", type_=ARRAY(Integer)))
+            )
+            .subquery()
+        )
+        stmt = (
+            select(Detection)
+            .options(*_load_options(False))
+            .join(ranked, ranked.c.id == Detection.id)
+            .where(ranked.c.rn <= limit_per_animal)
+            .order_by(Detection.animal_id, desc(Detection.timestamp))
+        )
 
+        result = await self.db.execute(stmt, {"ids": list(animal_ids)})
+        grouped: dict[int, list[Detection]] = {}
+        for detection in result.scalars():
+            grouped.setdefault(detection.animal_id, []).append(detection)
+        return grouped
+
+    @db_operation("Failed to fetch recent detections")
     async def get_recent(
         self,
         limit: int = 100,
         camera_id: Optional[str] = None,
         min_confidence: float = 0.0,
+        after_ts: Optional[datetime] = None,
+        after_id: Optional[int] = None,
+        load_relations: bool = False,
     ) -> Sequence[Detection]:
         """
         Get most recent detections across all cameras.
@@ -131,40 +409,119 @@ class DetectionRepository:
             limit:          Max rows
             camera_id:      Filter by camera (optional)
             min_confidence: Filter low-quality detections (optional)
+            after_ts:       Keyset cursor — timestamp of the previous
+                            page's last row (optional)
+            after_id:       Its id; PK tiebreaker for equal timestamps
+            load_relations: Also load Detection.animal (one IN-query)
+
+        Index: with camera_id → ix_detections_camera_time
+        (camera_id, timestamp DESC) INCLUDE (confidence); the confidence
+        filter is checked in the index. Without camera_id the planner
+        walks the newest BRIN ranges of ix_detections_timestamp.
         """
-        try:
-            conditions = []
-            if camera_id:
-                conditions.append(Detection.camera_id == camera_id)
-            if min_confidence > 0:
-                conditions.append(Detection.confidence >= min_confidence)
+        conditions = []
+        if camera_id:
+            conditions.append(Detection.camera_id == camera_id)
+        if min_confidence > 0:
+            conditions.append(Detection.confidence >= min_confidence)
+        if after_ts is not None:
+            if after_id is not None:
+                conditions.append(
+                    tuple_(Detection.timestamp, Detection.id)
+                    < tuple_(after_ts, after_id)
+                )
+            else:
+                conditions.append(Detection.timestamp < after_ts)
+
+        stmt = (
+            select(Detection)
+            .options(*_load_options(load_relations))
+            .order_by(desc(Detection.timestamp), desc(Detection.id))
+            .limit(limit)
+        )
+        if conditions:
+            stmt = stmt.where(and_(*conditions))
 
-            stmt = select(Detection).order_by(desc(Detection.timestamp)).limit(limit)
-            if conditions:
-                stmt = stmt.where(and_(*conditions))
+        result = await self.db.execute(stmt)
+        return result.scalars().all()
 
-            result = await self.db.execute(stmt)
-            return result.scalars().all()
-        except Exception as exc:
+    async def iter_recent(
+        self,
+        camera_id: Optional[str] = None,
+        min_confidence: float = 0.0,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[Detection]:
+        """
+        Stream detections newest first through a server-side cursor.
+
+        For exports/analytics pulls: rows are fetched ``batch_size`` at a
+        time, so peak memory is one batch, not the whole result.
+        Relationships are NOT loaded (raiseload).
+
+        Args:
+            camera_id:      Filter by camera (optional)
+            min_confidence: Filter low-quality detections (optional)
+            start / end:    Timestamp bounds, inclusive (optional)
+            batch_size:     Rows fetched per cursor round-trip
+
+        Yields:
+            Detection instances ordered by (timestamp, id) DESC
+        """
+        conditions = []
+        if camera_id:
+            conditions.append(Detection.camera_id == camera_id)
+        if min_confidence > 0:
+            conditions.append(Detection.confidence >= min_confidence)
+        if start is not None:
+            conditions.append(Detection.timestamp >= start)
+        if end is not None:
+            conditions.append(Detection.timestamp <= end)
+
+        stmt = (
+            select(Detection)
+            .options(*_load_options(False))
+            .order_by(desc(Detection.timestamp), desc(Detection.id))
+            .execution_options(yield_per=batch_size)
+        )
+        if conditions:
+            stmt = stmt.where(and_(*conditions))
+
+        try:
+            result = await self.db.stream_scalars(stmt)
+            async for detection in result:
+                yield detection
+        except DB_ERRORS as exc:
+            logger.error("[repo] Detection.iter_recent failed: %s", exc, exc_info=True)
             raise DatabaseError(
-                message="Failed to fetch recent detections",
+                message="Failed to stream detections",
                 details={"error": str(exc)},
             ) from exc
 
-    async def count_by_animal(self, animal_id: int) -> int:
-        """Total detection count for one animal."""
-        try:
-            result = await self.db.execute(
+    @db_operation("Failed to count detections")
+    async def count_by_animal(self, animal_id: int, exact: bool = True) -> int:
+        """
+        Total detection count for one animal.
+
+        By default counts rows. exact=False reads animals.total_detections
+        instead — a single PK lookup, but that counter is only bumped by
+        the detection counter coalescer / create_and_touch_animal, so rows
+        written through create / create_many / bulk_ingest are missing
+        from it.
+
+        Index (exact): ix_detections_animal_time (index-only scan on its prefix).
+        """
+        if exact:
+            stmt = (
                 select(func.count())
                 .select_from(Detection)
                 .where(Detection.animal_id == animal_id)
             )
-            return result.scalar_one()
-        except Exception as exc:
-            raise DatabaseError(
-                message="Failed to count detections",
-                details={"error": str(exc)},
-            ) from exc
+        else:
+            stmt = select(Animal.total_detections).where(Animal.id == animal_id)
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none() or 0
 
     async def count_in_range(
         self,
@@ -172,7 +529,21 @@ class DetectionRepository:
         end: datetime,
         camera_id: Optional[str] = None,
     ) -> int:
-        """Count detections between two timestamps (for analytics)."""
+        """
+        Count detections between two timestamps (for analytics).
+
+        Index: with camera_id → ix_detections_camera_time (index-only
+        range scan); otherwise BRIN ix_detections_timestamp.
+
+        Counts of windows that are already settled are memoized in-process
+        for one TTL, so repeated dashboard queries over past periods are
+        served without a round-trip.
+        """
+        key = (start, end, camera_id)
+        cached = _RANGE_COUNT_CACHE.get(key)
+        if cached is not TTLCache.MISS:
+            return cached
+
         try:
             conditions = [
                 Detection.timestamp >= start,
@@ -186,9 +557,14 @@ class DetectionRepository:
                 .select_from(Detection)
                 .where(and_(*conditions))
             )
-            return result.scalar_one()
-        except Exception as exc:
+            count = result.scalar_one()
+        except DB_ERRORS as exc:
             raise DatabaseError(
                 message="Failed to count detections in range",
                 details={"error": str(exc)},
             ) from exc
+
+        end_utc = end if end.tzinfo else end.replace(tzinfo=timezone.utc)
+        if end_utc <= datetime.now(timezone.utc) - _RANGE_SETTLE_LAG:
+            _RANGE_COUNT_CACHE.put(key, count)
+        return count
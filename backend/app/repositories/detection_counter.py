@@ -0,0 +1,221 @@
+"""
+Coalesced detection counters for the animals table.
+
+The detection pipeline bumps ``total_detections`` / ``last_detected_at``
+once per confirmed detection. Doing that as SELECT + UPDATE per event puts
+two round-trips on the hot path. Instead, events are pushed onto an
+in-process outbox and a background task folds them into ONE statement per
+tick:
+
+    UPDATE animals
+       SET total_detections  = total_detections + v.hits,
+           first_detected_at = COALESCE(first_detected_at, v.first_seen),
+           last_detected_at  = GREATEST(last_detected_at, v.last_seen)
+      FROM (VALUES ...) AS v(id, hits, first_seen, last_seen)
+     WHERE animals.id = v.id
+
+RESPONSIBILITY: Database access only. No business logic.
+"""
+
+import asyncio
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Optional
+import logging
+
+from sqlalchemy import DateTime, Integer, column, func, update, values
+
+from app.core.database import AsyncSessionLocal
+from app.models.animal import Animal
+
+logger = logging.getLogger(__name__)
+
+
+class DetectionCounterCoalescer:
+    """
+    Outbox + periodic coalesced UPDATE for animal detection counters.
+
+    Args:
+        flush_interval: Seconds between flushes (default 200 ms)
+        max_batch:      Flush early once this many events are pending
+    """
+
+    def __init__(
+        self,
+        flush_interval: float = 0.2,
+        max_batch: int = 1000,
+    ) -> None:
+        self._flush_interval = flush_interval
+        self._max_batch = max_batch
+        self._queue: asyncio.Queue[tuple[int, datetime]] = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+        # Statistics
+        self._total_events = 0
+        self._total_flushes = 0
+
+    # -------------------------------------------------------------------------
+    # PRODUCER SIDE
+    # -------------------------------------------------------------------------
+
+    def bump(self, animal_id: int, detected_at: Optional[datetime] = None) -> None:
+        """
+        Record one detection for an animal (non-blocking, no DB I/O).
+
+        Args:
+            animal_id:   PK of the detected animal
+            detected_at: Detection timestamp (defaults to now)
+        """
+        self._queue.put_nowait(
+            (animal_id, detected_at or datetime.now(timezone.utc))
+        )
+
+    # -------------------------------------------------------------------------
+    # LIFECYCLE
+    # -------------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the background flush loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush loop and write out everything still queued."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        batch = []
+        while not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        if batch:
+            await self._flush(batch)
+
+    # -------------------------------------------------------------------------
+    # CONSUMER SIDE
+    # -------------------------------------------------------------------------
+
+    async def _run(self) -> None:
+        """Collect events for one tick, then flush them as a single UPDATE."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            # Block until there is at least one event — idle ticks cost nothing
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._flush_interval
+
+            while len(batch) < self._max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), timeout)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self._flush(batch)
+            except Exception as exc:
+                # Counters are non-critical — log and keep the loop alive
+                logger.error("[repo] detection counter flush failed: %s", exc)
+
+    async def _flush(self, batch: list[tuple[int, datetime]]) -> None:
+        """Fold a batch of events per animal and apply them in one statement."""
+        hits: Counter[int] = Counter()
+        first_seen: dict[int, datetime] = {}
+        last_seen: dict[int, datetime] = {}
+
+        for animal_id, detected_at in batch:
+            hits[animal_id] += 1
+            if animal_id not in first_seen or detected_at < first_seen[animal_id]:
+                first_seen[animal_id] = detected_at
+            if animal_id not in last_seen or detected_at > last_seen[animal_id]:
+                last_seen[animal_id] = detected_at
+
+        v = values(
+            column("id", Integer),
+            column("hits", Integer),
+            column("first_seen", DateTime(timezone=True)),
+            column("last_seen", DateTime(timezone=True)),
+            name="v",
+        ).data([
+            (animal_id, count, first_seen[animal_id], last_seen[animal_id])
+            for animal_id, count in hits.items()
+        ])
+
+        stmt = (
+            update(Animal)
+            .where(Animal.id == v.c.id)
+            .values(
+                total_detections=Animal.total_detections + v.c.hits,
+                first_detected_at=func.coalesce(
+                    Animal.first_detected_at, v.c.first_seen
+                ),
+                last_detected_at=func.greatest(
+                    Animal.last_detected_at, v.c.last_seen
+                ),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        async with AsyncSessionLocal() as db:
+            await db.execute(stmt)
+            await db.commit()
+
+        self._total_events += len(batch)
+        self._total_flushes += 1
+        logger.debug(
+            "[repo] Flushed %s detection events for %s animals",
+            len(batch),
+            len(hits),
+        )
+
+    def get_stats(self) -> dict:
+        """Get coalescer statistics."""
+        return {
+            "pending_events": self._queue.qsize(),
+            "total_events": self._total_events,
+            "total_flushes": self._total_flushes,
+        }
+
+
+# Global coalescer instance (started in main.py on startup)
+_detection_counter: DetectionCounterCoalescer | None = None
+
+
+def get_detection_counter() -> DetectionCounterCoalescer:
+    """
+    Get the global detection counter coalescer.
+
+    Raises:
+        RuntimeError: If coalescer hasn't been initialized
+    """
+    if _detection_counter is None:
+        raise RuntimeError(
+            "Detection counter not initialized. "
+            "Call initialize_detection_counter() in startup event."
+        )
+    return _detection_counter
+
+
+def initialize_detection_counter() -> DetectionCounterCoalescer:
+    """Create and start the global coalescer (call in startup event)."""
+    global _detection_counter
+    _detection_counter = DetectionCounterCoalescer()
+    _detection_counter.start()
+    return _detection_counter
+
+
+async def shutdown_detection_counter() -> None:
+    """Flush pending events and stop the coalescer (call in shutdown event)."""
+    global _detection_counter
+
+    if _detection_counter is not None:
+        await _detection_counter.stop()
+        _detection_counter = None
@@ -4,19 +4,181 @@ Weight Measurement repository for time-series data access.
 Optimized for high-frequency writes and time-series queries.
 """
 
-from typing import Optional, Sequence
-from datetime import datetime, timedelta
-from sqlalchemy import select, func, and_
+from functools import lru_cache
+from typing import Any, AsyncIterator, Optional, Sequence
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import (
+    DateTime, Integer, Row, select, insert, func, and_, any_, bindparam, lambda_stmt,
+    literal_column, text, tuple_, type_coerce,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import raiseload
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging
+import orjson
 
 from app.models.weight_measurement import WeightMeasurement
 from app.schemas.weight_measurement import WeightMeasurementCreate
-from app.core.exceptions import DatabaseError
+from app.core.cache import TTLCache
+from app.core.database import copy_records
+from app.core.exceptions import DB_ERRORS, DatabaseError, db_operation
 
 logger = logging.getLogger(__name__)
 
 
+# Column order of the tuples sent through COPY (create_many)
+COPY_COLUMNS = (
+    "animal_id",
+    "timestamp",
+    "weight_g",
+    "confidence_i",
+    "camera_id",
+    "raw_ai_data",
+    "image_path",
+)
+
+# Below this many rows COPY setup costs more than it saves → multi-row INSERT
+_COPY_MIN_ROWS = 100
+
+# Rows per statement / COPY chunk — bounds memory on very large batches
+_BATCH_SIZE = 10_000
+
+# Rows fetched per round-trip by the streaming readers
+_STREAM_BATCH = 100
+
+# Columns of WeightMeasurementResponse. List readers select these as plain
+# tuples (Row) — no identity map, no instance state, no attribute events.
+_RESPONSE_COLUMNS = (
+    WeightMeasurement.id,
+    WeightMeasurement.animal_id,
+    WeightMeasurement.timestamp,
+    WeightMeasurement.estimated_weight_kg,
+    WeightMeasurement.confidence_score,
+    WeightMeasurement.camera_id,
+    WeightMeasurement.raw_ai_data,
+    WeightMeasurement.image_path,
+    WeightMeasurement.created_at,
+    WeightMeasurement.updated_at,
+)
+
+# Hot repeat lookups, built once at import. lambda_stmt caches the
+# compiled SQL, so repeated calls skip statement construction/compilation.
+_GET_BY_ID = lambda_stmt(
+    lambda: select(WeightMeasurement)
+    .options(raiseload("*"))
+    .where(WeightMeasurement.id == bindparam("pk"))
+)
+# Columns read by get_latest_by_animal — all covered by
+# ix_weight_measurements_animal_time, so the read is index-only
+_GET_LATEST = lambda_stmt(
+    lambda: select(
+        WeightMeasurement.animal_id,
+        WeightMeasurement.timestamp,
+        WeightMeasurement.estimated_weight_kg,
+        WeightMeasurement.confidence_score,
+    )
+    .where(WeightMeasurement.animal_id == bindparam("animal_id"))
+    .order_by(WeightMeasurement.timestamp.desc())
+    .limit(1)
+)
+
+# Latest measurement of many animals in ONE statement: DISTINCT ON keeps the
+# first row per animal_id in (animal_id, timestamp DESC) order — exactly the
+# ix_weight_measurements_animal_time order, so no sort step.
+_GET_LATEST_FOR_ANIMALS = (
+    select(WeightMeasurement)
+    .options(raiseload("*"))
+    .distinct(WeightMeasurement.animal_id)
+    .where(
+        WeightMeasurement.animal_id
+        == any_(bindparam("animal_ids", type_=ARRAY(Integer)))
+    )
+    .order_by(WeightMeasurement.animal_id, WeightMeasurement.timestamp.desc())
+)
+
+
+# Precomputed stats for the dashboard default window (migration 0013,
+# refreshed by WeightStatsViewRefresher). Column types re-apply the
+# fixed-point scaling to the raw integer aggregates.
+STATS_VIEW_DAYS = 30
+STATS_VIEW_MIN_CONFIDENCE = 0.7
+_GET_VIEW_STATS = text("""
+    SELECT total, avg_weight, min_weight, max_weight, avg_confidence,
+           first_weight, last_weight, slope_per_day, median_weight,
+           first_ts, last_ts
+      FROM wm_stats_30d
+     WHERE animal_id = :animal_id
+""").columns(
+    total=Integer,
+    avg_weight=WeightMeasurement.__table__.c.weight_g.type,
+    min_weight=WeightMeasurement.__table__.c.weight_g.type,
+    max_weight=WeightMeasurement.__table__.c.weight_g.type,
+    avg_confidence=WeightMeasurement.__table__.c.confidence_i.type,
+    first_weight=WeightMeasurement.__table__.c.weight_g.type,
+    last_weight=WeightMeasurement.__table__.c.weight_g.type,
+    slope_per_day=WeightMeasurement.__table__.c.weight_g.type,
+    median_weight=WeightMeasurement.__table__.c.weight_g.type,
+    first_ts=DateTime(timezone=True),
+    last_ts=DateTime(timezone=True),
+)
+REFRESH_STATS_VIEW = text("REFRESH MATERIALIZED VIEW CONCURRENTLY wm_stats_30d")
+
+# Partial index ix_weight_measurements_recent_confident (migration 0012)
+# covers confidence_i >= 7000. The threshold is a bind parameter, and a
+# generic prepared plan cannot prove "confidence_i >= $1" implies it, so
+# the literal predicate is added whenever the threshold is at least 0.7.
+_RECENT_INDEX_MIN_CONFIDENCE = 0.7
+_RECENT_INDEX_PREDICATE = (
+    WeightMeasurement.__table__.c.confidence_i >= literal_column("7000")
+)
+
+
+@lru_cache(maxsize=None)
+def _count_by_animal_stmt(has_confidence: bool, has_start: bool, has_end: bool):
+    """One cached COUNT statement per filter combination (8 at most)."""
+    clauses = [WeightMeasurement.animal_id == bindparam("animal_id")]
+    if has_confidence:
+        clauses.append(WeightMeasurement.confidence_score >= bindparam("min_confidence"))
+    if has_start:
+        clauses.append(WeightMeasurement.timestamp >= bindparam("start_date"))
+    if has_end:
+        clauses.append(WeightMeasurement.timestamp <= bindparam("end_date"))
+    return select(func.count()).select_from(WeightMeasurement).where(and_(*clauses))
+
+
+# Dashboard hot spots: "current weight" per animal (dropped on every write
+# for that animal) and the slowly changing stats aggregate (TTL only).
+_LATEST_CACHE = TTLCache(ttl=10.0)
+_STATS_CACHE = TTLCache(ttl=30.0)
+
+
+def forget_latest(animal_id: int) -> None:
+    """Drop the cached latest measurement of an animal (call after writes)."""
+    _LATEST_CACHE.pop(animal_id)
+
+
+_WEIGHT_TYPE = WeightMeasurement.__table__.c.weight_g.type
+_CONFIDENCE_TYPE = WeightMeasurement.__table__.c.confidence_i.type
+
+
+def _copy_record(m: WeightMeasurementCreate) -> tuple[Any, ...]:
+    """
+    One measurement as a COPY tuple (COPY_COLUMNS order).
+
+    COPY bypasses SQLAlchemy's type processing: JSON goes as text and the
+    fixed-point columns are quantized here.
+    """
+    return (
+        m.animal_id,
+        m.timestamp,
+        _WEIGHT_TYPE.to_db(m.estimated_weight_kg),
+        _CONFIDENCE_TYPE.to_db(m.confidence_score),
+        m.camera_id,
+        orjson.dumps(m.raw_ai_data).decode() if m.raw_ai_data is not None else None,
+        m.image_path,
+    )
+
+
 class WeightMeasurementRepository:
     """
     Repository for WeightMeasurement time-series data.
@@ -30,6 +192,7 @@ class WeightMeasurementRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
     
+    @db_operation("Failed to create weight measurement")
     async def create(
         self,
         measurement_data: WeightMeasurementCreate,
@@ -48,42 +211,78 @@ class WeightMeasurementRepository:
         Raises:
             DatabaseError: If insert fails
         """
-        try:
-            measurement = WeightMeasurement(**measurement_data.model_dump())
-            
-            self.db.add(measurement)
-            await self.db.flush()
-            await self.db.refresh(measurement)
-            
-            logger.debug(
-                f"Created measurement: Animal {measurement.animal_id}, "
-                f"Weight {measurement.estimated_weight_kg:.2f}kg"
-            )
-            
-            return measurement
-            
-        except Exception as e:
-            logger.error(f"Failed to create weight measurement: {e}")
-            raise DatabaseError(
-                message="Failed to create weight measurement",
-                details={"error": str(e)},
-            )
+        # INSERT ... RETURNING: no flush + refresh SELECT round-trip.
+        # raiseload: the returned entity must not trigger the selectin
+        # load of .animal (a second SELECT) — callers never read it.
+        result = await self.db.execute(
+            insert(WeightMeasurement)
+            .values(**measurement_data.model_dump())
+            .returning(WeightMeasurement)
+            .options(raiseload("*"))
+        )
+        measurement = result.scalar_one()
+        forget_latest(measurement.animal_id)
+
+        logger.debug(
+            "Created measurement: Animal %s, Weight %.2fkg",
+            measurement.animal_id,
+            measurement.estimated_weight_kg,
+        )
+
+        return measurement
     
+    @db_operation("Failed to create weight measurements")
+    async def create_many(
+        self,
+        measurements: Sequence[WeightMeasurementCreate],
+    ) -> int:
+        """
+        Insert a batch of measurements in as few round-trips as possible.
+
+        - >= 100 rows: binary COPY (asyncpg copy_records_to_table),
+          inside a SAVEPOINT so a failed batch leaves the caller's
+          transaction usable.
+        - smaller batches: one multi-row INSERT per chunk.
+
+        No per-row flush/refresh on either path. Callers that need the
+        created rows back should use create().
+
+        Args:
+            measurements: Validated measurement data
+
+        Returns:
+            Number of rows written
+        """
+        if not measurements:
+            return 0
+
+        if len(measurements) >= _COPY_MIN_ROWS:
+            async with self.db.begin_nested():
+                count = await copy_records(
+                    self.db,
+                    "weight_measurements",
+                    COPY_COLUMNS,
+                    map(_copy_record, measurements),
+                    chunk_size=_BATCH_SIZE,
+                )
+        else:
+            await self.db.execute(
+                insert(WeightMeasurement),
+                [m.model_dump() for m in measurements],
+            )
+            count = len(measurements)
+
+        for animal_id in {m.animal_id for m in measurements}:
+            forget_latest(animal_id)
+
+        logger.debug("[repo] Weight measurements inserted: %s", count)
+        return count
+
+    @db_operation("Failed to retrieve measurement", context=("measurement_id",))
     async def get_by_id(self, measurement_id: int) -> Optional[WeightMeasurement]:
         """Get single measurement by ID."""
-        try:
-            stmt = select(WeightMeasurement).where(
-                WeightMeasurement.id == measurement_id
-            )
-            result = await self.db.execute(stmt)
-            return result.scalar_one_or_none()
-            
-        except Exception as e:
-            logger.error(f"Failed to get measurement {measurement_id}: {e}")
-            raise DatabaseError(
-                message="Failed to retrieve measurement",
-                details={"measurement_id": measurement_id, "error": str(e)},
-            )
+        result = await self.db.execute(_GET_BY_ID, {"pk": measurement_id})
+        return result.scalar_one_or_none()
     
     async def get_by_animal(
         self,
@@ -93,9 +292,16 @@ class WeightMeasurementRepository:
         min_confidence: Optional[float] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-    ) -> Sequence[WeightMeasurement]:
+        before: Optional[datetime] = None,
+        before_id: Optional[int] = None,
+        with_total: bool = False,
+    ) -> AsyncIterator[Row]:
         """
-        Get measurements for a specific animal with time filtering.
+        Stream measurements for a specific animal with time filtering.
+        
+        Rows are fetched in batches of 100 through a server-side cursor,
+        so large pages are never materialized as one list. Yields column
+        tuples (attribute access by name), not ORM instances.
         
         Args:
             animal_id: Animal primary key
@@ -104,45 +310,64 @@ class WeightMeasurementRepository:
             min_confidence: Filter by minimum confidence score
             start_date: Filter measurements after this date
             end_date: Filter measurements before this date
-            
-        Returns:
-            List of measurements ordered by timestamp (newest first)
+            before: Keyset cursor — only measurements strictly older than
+                this timestamp (previous page's last timestamp). Replaces
+                skip: the index seeks to the cursor instead of scanning
+                and discarding `skip` rows.
+            before_id: The previous page's last id; PK tiebreaker, so rows
+                sharing the cursor timestamp (several cameras, one batch)
+                are not skipped. (timestamp, id) < (before, before_id).
+            with_total: Add a ``total_count`` column (COUNT(*) OVER ()) —
+                the filtered count before skip/limit, in the same query.
+                Counts only rows older than ``before`` when a cursor is set.
+            
+        Yields:
+            Measurements ordered by timestamp, then id (newest first). The
+            order is fixed: limit=1 gives the newest row, never the oldest —
+            take window bounds from get_weight_stats() (first_date/last_date).
         """
-        try:
-            stmt = select(WeightMeasurement).where(
-                WeightMeasurement.animal_id == animal_id
+        columns = _RESPONSE_COLUMNS
+        if with_total:
+            columns = (*columns, func.count().over().label("total_count"))
+        stmt = (
+            select(*columns)
+            .where(WeightMeasurement.animal_id == animal_id)
+        )
+
+        # Apply filters
+        if min_confidence is not None:
+            stmt = stmt.where(
+                WeightMeasurement.confidence_score >= min_confidence
             )
-            
-            # Apply filters
-            if min_confidence is not None:
-                stmt = stmt.where(
-                    WeightMeasurement.confidence_score >= min_confidence
-                )
-            
-            if start_date:
-                stmt = stmt.where(WeightMeasurement.timestamp >= start_date)
-            
-            if end_date:
-                stmt = stmt.where(WeightMeasurement.timestamp <= end_date)
-            
-            # Order by timestamp (newest first)
-            stmt = stmt.order_by(WeightMeasurement.timestamp.desc())
-            
-            # Pagination
-            stmt = stmt.offset(skip).limit(limit)
-            
-            result = await self.db.execute(stmt)
-            measurements = result.scalars().all()
-            
-            return measurements
-            
-        except Exception as e:
-            logger.error(f"Failed to get measurements for animal {animal_id}: {e}")
-            raise DatabaseError(
-                message="Failed to retrieve measurements",
-                details={"animal_id": animal_id, "error": str(e)},
+
+        if start_date:
+            stmt = stmt.where(WeightMeasurement.timestamp >= start_date)
+
+        if end_date:
+            stmt = stmt.where(WeightMeasurement.timestamp <= end_date)
+
+        # Order by timestamp (newest first); id breaks timestamp ties so the
+        # keyset cursor is total
+        stmt = stmt.order_by(
+            WeightMeasurement.timestamp.desc(), WeightMeasurement.id.desc()
+        )
+
+        # Pagination: keyset when a cursor is given, OFFSET otherwise
+        if before is not None and before_id is not None:
+            stmt = stmt.where(
+                tuple_(WeightMeasurement.timestamp, WeightMeasurement.id)
+                < tuple_(before, before_id)
             )
+        elif before is not None:
+            stmt = stmt.where(WeightMeasurement.timestamp < before)
+        elif skip:
+            stmt = stmt.offset(skip)
+        stmt = stmt.limit(limit)
+
+        async for measurement in self._stream(stmt, "Failed to retrieve measurements"):
+            yield measurement
     
+    @db_operation("Failed to count measurements")
     async def count_by_animal(
         self,
         animal_id: int,
@@ -151,59 +376,67 @@ class WeightMeasurementRepository:
         end_date: Optional[datetime] = None,
     ) -> int:
         """Count measurements for an animal with filters."""
-        try:
-            stmt = select(func.count()).select_from(WeightMeasurement).where(
-                WeightMeasurement.animal_id == animal_id
-            )
-            
-            if min_confidence is not None:
-                stmt = stmt.where(
-                    WeightMeasurement.confidence_score >= min_confidence
-                )
-            
-            if start_date:
-                stmt = stmt.where(WeightMeasurement.timestamp >= start_date)
-            
-            if end_date:
-                stmt = stmt.where(WeightMeasurement.timestamp <= end_date)
-            
-            result = await self.db.execute(stmt)
-            return result.scalar_one()
-            
-        except Exception as e:
-            logger.error(f"Failed to count measurements: {e}")
-            raise DatabaseError(
-                message="Failed to count measurements",
-                details={"error": str(e)},
-            )
+        stmt = _count_by_animal_stmt(
+            min_confidence is not None,
+            start_date is not None,
+            end_date is not None,
+        )
+        params = {
+            "animal_id": animal_id,
+            "min_confidence": min_confidence,
+            "start_date": start_date,
+            "end_date": end_date,
+        }
+        result = await self.db.execute(
+            stmt, {k: v for k, v in params.items() if v is not None}
+        )
+        return result.scalar_one()
     
+    @db_operation("Failed to retrieve latest measurement", context=("animal_id",))
     async def get_latest_by_animal(
         self,
         animal_id: int,
-    ) -> Optional[WeightMeasurement]:
+    ) -> Optional[Row]:
         """
         Get most recent measurement for an animal.
         
-        Useful for displaying current weight.
+        Useful for displaying current weight. Returns a lightweight Row
+        (animal_id, timestamp, estimated_weight_kg, confidence_score),
+        not an ORM entity. Cached per process for 10 s; writes through
+        this repository drop the entry immediately.
         """
-        try:
-            stmt = (
-                select(WeightMeasurement)
-                .where(WeightMeasurement.animal_id == animal_id)
-                .order_by(WeightMeasurement.timestamp.desc())
-                .limit(1)
-            )
-            
-            result = await self.db.execute(stmt)
-            return result.scalar_one_or_none()
-            
-        except Exception as e:
-            logger.error(f"Failed to get latest measurement: {e}")
-            raise DatabaseError(
-                message="Failed to retrieve latest measurement",
-                details={"animal_id": animal_id, "error": str(e)},
-            )
+        cached = _LATEST_CACHE.get(animal_id)
+        if cached is not TTLCache.MISS:
+            return cached
+
+        result = await self.db.execute(_GET_LATEST, {"animal_id": animal_id})
+        latest = result.first()
+        _LATEST_CACHE.put(animal_id, latest)
+        return latest
     
+    @db_operation("Failed to retrieve latest measurements")
+    async def get_latest_for_animals(
+        self,
+        animal_ids: Sequence[int],
+    ) -> dict[int, WeightMeasurement]:
+        """
+        Get the most recent measurement of each given animal.
+        
+        One round-trip for any number of animals — use instead of calling
+        get_latest_by_animal() in a loop.
+        
+        Returns:
+            {animal_id: measurement}; animals without measurements are absent
+        """
+        if not animal_ids:
+            return {}
+
+        result = await self.db.execute(
+            _GET_LATEST_FOR_ANIMALS, {"animal_ids": list(set(animal_ids))}
+        )
+        return {m.animal_id: m for m in result.scalars()}
+    
+    @db_operation("Failed to calculate statistics", context=("animal_id",))
     async def get_weight_stats(
         self,
         animal_id: int,
@@ -224,80 +457,140 @@ class WeightMeasurementRepository:
             - average_weight
             - min_weight
             - max_weight
-            - weight_change (vs first measurement)
+            - median_weight
+            - weight_change (latest minus first measurement in the window)
+            - weight_change_per_day (least-squares slope, kg/day)
             - confidence_average
-        """
-        try:
-            cutoff_date = datetime.utcnow() - timedelta(days=days)
+            - first_date / last_date (oldest / newest measurement in window)
             
-            stmt = select(
-                func.count(WeightMeasurement.id).label("total"),
-                func.avg(WeightMeasurement.estimated_weight_kg).label("avg_weight"),
-                func.min(WeightMeasurement.estimated_weight_kg).label("min_weight"),
-                func.max(WeightMeasurement.estimated_weight_kg).label("max_weight"),
-                func.avg(WeightMeasurement.confidence_score).label("avg_confidence"),
-            ).where(
+        Results are cached per process for 30 s per
+        (animal_id, days, min_confidence). The dashboard default
+        (30 days, 0.7) is read from the wm_stats_30d materialized view,
+        which lags the live data by at most one refresh interval.
+        """
+        cache_key = (animal_id, days, min_confidence)
+        cached = _STATS_CACHE.get(cache_key)
+        if cached is not TTLCache.MISS:
+            return dict(cached)
+
+        row = None
+        if days == STATS_VIEW_DAYS and min_confidence == STATS_VIEW_MIN_CONFIDENCE:
+            result = await self.db.execute(_GET_VIEW_STATS, {"animal_id": animal_id})
+            row = result.first()
+
+        # Not in the view (other window, or first measurements since the
+        # last refresh) → aggregate live
+        if row is None:
+            row = await self._compute_weight_stats(animal_id, days, min_confidence)
+
+        if not row or row.total == 0:
+            return {
+                "total_measurements": 0,
+                "average_weight": None,
+                "min_weight": None,
+                "max_weight": None,
+                "median_weight": None,
+                "weight_change": None,
+                "weight_change_per_day": None,
+                "confidence_average": None,
+                "first_date": None,
+                "last_date": None,
+            }
+
+        # Latest minus earliest; 0.0 is a real "no change", not missing data
+        weight_change = None
+        if row.first_weight is not None and row.last_weight is not None:
+            weight_change = row.last_weight - row.first_weight
+
+        def _float(value) -> Optional[float]:
+            return float(value) if value is not None else None
+
+        stats = {
+            "total_measurements": row.total,
+            "average_weight": _float(row.avg_weight),
+            "min_weight": _float(row.min_weight),
+            "max_weight": _float(row.max_weight),
+            "median_weight": _float(row.median_weight),
+            "weight_change": _float(weight_change),
+            "weight_change_per_day": _float(row.slope_per_day),
+            "confidence_average": _float(row.avg_confidence),
+            "first_date": row.first_ts,
+            "last_date": row.last_ts,
+        }
+        _STATS_CACHE.put(cache_key, stats)
+        return dict(stats)
+
+    async def _compute_weight_stats(
+        self,
+        animal_id: int,
+        days: int,
+        min_confidence: float,
+    ) -> Optional[Row]:
+        """Aggregate the stats window from weight_measurements directly."""
+        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
+
+        # One pass over the window: aggregates + first/last weight by time
+        filtered = (
+            select(
+                WeightMeasurement.estimated_weight_kg.label("weight"),
+                WeightMeasurement.confidence_score.label("confidence"),
+                WeightMeasurement.timestamp.label("ts"),
+            )
+            .where(
                 and_(
                     WeightMeasurement.animal_id == animal_id,
                     WeightMeasurement.timestamp >= cutoff_date,
                     WeightMeasurement.confidence_score >= min_confidence,
                 )
             )
-            
-            result = await self.db.execute(stmt)
-            row = result.first()
-            
-            if not row or row.total == 0:
-                return {
-                    "total_measurements": 0,
-                    "average_weight": None,
-                    "min_weight": None,
-                    "max_weight": None,
-                    "weight_change": None,
-                    "confidence_average": None,
-                }
-            
-            # Get first and last measurements for trend
-            first_stmt = (
-                select(WeightMeasurement.estimated_weight_kg)
-                .where(
-                    and_(
-                        WeightMeasurement.animal_id == animal_id,
-                        WeightMeasurement.timestamp >= cutoff_date,
-                        WeightMeasurement.confidence_score >= min_confidence,
-                    )
-                )
-                .order_by(WeightMeasurement.timestamp.asc())
-                .limit(1)
-            )
-            first_result = await self.db.execute(first_stmt)
-            first_weight = first_result.scalar_one_or_none()
-            
-            weight_change = None
-            if first_weight and row.avg_weight:
-                weight_change = row.max_weight - first_weight
-            
-            return {
-                "total_measurements": row.total,
-                "average_weight": float(row.avg_weight) if row.avg_weight else None,
-                "min_weight": float(row.min_weight) if row.min_weight else None,
-                "max_weight": float(row.max_weight) if row.max_weight else None,
-                "weight_change": float(weight_change) if weight_change else None,
-                "confidence_average": float(row.avg_confidence) if row.avg_confidence else None,
-            }
-            
-        except Exception as e:
-            logger.error(f"Failed to calculate weight stats: {e}")
-            raise DatabaseError(
-                message="Failed to calculate statistics",
-                details={"animal_id": animal_id, "error": str(e)},
-            )
+            .cte("filtered")
+        )
+
+        first_weight = (
+            select(filtered.c.weight)
+            .order_by(filtered.c.ts.asc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        last_weight = (
+            select(filtered.c.weight)
+            .order_by(filtered.c.ts.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+
+        # Server-side trend/median on the raw stored integers, scaled back
+        # by coercing the result to the fixed-point type (grams → kg)
+        raw_weight = type_coerce(filtered.c.weight, Integer)
+        slope_per_day = func.regr_slope(
+            raw_weight, func.extract("epoch", filtered.c.ts)
+        ) * 86400
+        median_weight = func.percentile_cont(0.5).within_group(raw_weight)
+
+        stmt = select(
+            func.count().label("total"),
+            # avg() of the stored integers → coerce back to the
+            # fixed-point type so the result is scaled to kg / 0..1
+            type_coerce(func.avg(filtered.c.weight), _WEIGHT_TYPE).label("avg_weight"),
+            func.min(filtered.c.weight).label("min_weight"),
+            func.max(filtered.c.weight).label("max_weight"),
+            type_coerce(func.avg(filtered.c.confidence), _CONFIDENCE_TYPE).label("avg_confidence"),
+            first_weight.label("first_weight"),
+            last_weight.label("last_weight"),
+            type_coerce(slope_per_day, _WEIGHT_TYPE).label("slope_per_day"),
+            type_coerce(median_weight, _WEIGHT_TYPE).label("median_weight"),
+            func.min(filtered.c.ts).label("first_ts"),
+            func.max(filtered.c.ts).label("last_ts"),
+        ).select_from(filtered)
+
+        result = await self.db.execute(stmt)
+        return result.first()
     
     async def get_recent_global(
         self,
         limit: int = 50,
         min_confidence: float = 0.7,
-    ) -> Sequence[WeightMeasurement]:
+    ) -> AsyncIterator[Row]:
         """
         Get most recent measurements across all animals.
         
@@ -307,23 +600,33 @@ class WeightMeasurementRepository:
             limit: Maximum number of measurements
             min_confidence: Minimum confidence threshold
             
-        Returns:
+        Yields:
             Recent measurements ordered by timestamp (newest first)
         """
+        stmt = (
+            select(*_RESPONSE_COLUMNS)
+            .where(WeightMeasurement.confidence_score >= min_confidence)
+            .order_by(WeightMeasurement.timestamp.desc())
+            .limit(limit)
+        )
+        if min_confidence >= _RECENT_INDEX_MIN_CONFIDENCE:
+            # Redundant filter, lets every plan walk the small partial index
+            stmt = stmt.where(_RECENT_INDEX_PREDICATE)
+
+        async for measurement in self._stream(stmt, "Failed to retrieve recent measurements"):
+            yield measurement
+
+    async def _stream(self, stmt, message: str) -> AsyncIterator[Row]:
+        """Run stmt through a server-side cursor, _STREAM_BATCH rows at a time."""
         try:
-            stmt = (
-                select(WeightMeasurement)
-                .where(WeightMeasurement.confidence_score >= min_confidence)
-                .order_by(WeightMeasurement.timestamp.desc())
-                .limit(limit)
+            result = await self.db.stream(
+                stmt.execution_options(yield_per=_STREAM_BATCH)
             )
-            
-            result = await self.db.execute(stmt)
-            return result.scalars().all()
-            
-        except Exception as e:
-            logger.error(f"Failed to get recent global measurements: {e}")
+            async for row in result:
+                yield row
+        except DB_ERRORS as exc:
+            logger.error("[repo] %s: %s", message, exc, exc_info=True)
             raise DatabaseError(
-                message="Failed to retrieve recent measurements",
-                details={"error": str(e)},
-            )
\ No newline at end of file
+                message=message,
+                details={"error": str(exc)},
+            ) from exc
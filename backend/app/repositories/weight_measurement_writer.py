@@ -0,0 +1,368 @@
+"""
+Buffered writer for weight measurements.
+
+Cameras submit measurements one at a time; one INSERT per measurement
+makes ingest purely round-trip bound. The writer queues incoming rows and
+a background task writes them as ONE multi-row statement per tick:
+
+    INSERT INTO weight_measurements (...) VALUES (...), (...), ...
+    RETURNING ...
+
+A tick ends after ``WM_BUFFER_MS`` or as soon as ``WM_BUFFER_MAX`` rows
+are pending, whichever comes first. Each caller awaits a future that
+resolves to its own returned row, so callers still get ids and server
+defaults back — at the cost of up to one tick of latency. If the batch
+hits an integrity error, its rows are retried one SAVEPOINT each, so only
+the offending callers see the error.
+
+RESPONSIBILITY: Database access only. No business logic.
+"""
+
+import asyncio
+from typing import Optional
+import logging
+
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import raiseload
+
+from app.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.exceptions import DatabaseError, is_transient_db_error
+from app.models.weight_measurement import WeightMeasurement
+from app.repositories.weight_measurement import forget_latest
+from app.schemas.weight_measurement import WeightMeasurementCreate
+
+logger = logging.getLogger(__name__)
+
+# Deadlock / serialization failures: retry the batch this many times
+# (each attempt is a fresh transaction) with exponential backoff
+_MAX_RETRIES = 3
+_RETRY_BACKOFF = 0.05  # seconds, doubled per attempt
+
+# Queued by drain(): _run flushes what it holds and returns
+_STOP = None
+
+_INSERT = (
+    insert(WeightMeasurement)
+    .returning(WeightMeasurement, sort_by_parameter_order=True)
+    .options(raiseload("*"))
+)
+
+
+class WeightMeasurementWriter:
+    """
+    Queue + periodic batched INSERT ... RETURNING for weight measurements.
+
+    Args:
+        flush_interval: Seconds to collect rows before flushing
+        max_batch:      Flush early once this many rows are pending
+    """
+
+    def __init__(
+        self,
+        flush_interval: float = 0.2,
+        max_batch: int = 1000,
+    ) -> None:
+        self._flush_interval = flush_interval
+        self._max_batch = max_batch
+        # Items are (data, future); _STOP ends the flush loop
+        self._queue: asyncio.Queue[
+            Optional[tuple[WeightMeasurementCreate, asyncio.Future]]
+        ] = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+        # Batch _run currently holds (taken off the queue, maybe flushing)
+        self._batch: list[tuple[WeightMeasurementCreate, asyncio.Future]] = []
+        # Set by submit() once max_batch rows are pending → flush early
+        self._full = asyncio.Event()
+
+        # Statistics
+        self._total_rows = 0
+        self._total_flushes = 0
+        self._failed_flushes = 0
+
+    # -------------------------------------------------------------------------
+    # PRODUCER SIDE
+    # -------------------------------------------------------------------------
+
+    async def submit(
+        self,
+        measurement_data: WeightMeasurementCreate,
+    ) -> WeightMeasurement:
+        """
+        Queue one measurement and wait until its batch is committed.
+
+        Args:
+            measurement_data: Validated measurement data
+
+        Returns:
+            The inserted measurement (detached, all columns loaded)
+
+        Raises:
+            DatabaseError: If the batch containing this row failed, or
+                the writer is shut down
+        """
+        if self._closed:
+            raise DatabaseError(
+                message="Failed to create weight measurement",
+                details={"error": "weight writer is shut down"},
+            )
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((measurement_data, future))
+        if self._queue.qsize() >= self._max_batch:
+            self._full.set()
+        return await future
+
+    # -------------------------------------------------------------------------
+    # LIFECYCLE
+    # -------------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the background flush loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def drain(self) -> None:
+        """
+        Stop the flush loop and write out everything still queued.
+
+        The loop is stopped cooperatively (a _STOP item, not cancel()), so
+        the batch it already holds and any flush in progress complete.
+        Every submitted future is resolved or failed — none is dropped.
+        """
+        self._closed = True
+
+        if self._task is not None:
+            self._queue.put_nowait(_STOP)
+            self._full.set()  # End the current tick's wait at once
+            try:
+                await self._task
+            except Exception as exc:
+                logger.error("[repo] weight writer loop failed: %s", exc)
+            self._task = None
+            self._fail_unresolved(self._batch, "weight writer loop failed")
+
+        pending = []
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not _STOP:
+                pending.append(item)
+        for start in range(0, len(pending), self._max_batch):
+            batch = pending[start:start + self._max_batch]
+            try:
+                await self._flush(batch)
+            finally:
+                # _flush resolves every future it was given; if it raised
+                # (or was cancelled) fail what is left rather than hang
+                self._fail_unresolved(batch, "weight writer shut down")
+
+    # -------------------------------------------------------------------------
+    # CONSUMER SIDE
+    # -------------------------------------------------------------------------
+
+    async def _run(self) -> None:
+        """
+        Collect rows for one tick, then flush them as a single INSERT.
+
+        One timed wait per tick (not a wait_for() task + timer per row):
+        sleep until the tick ends or submit() reports a full batch, then
+        drain the queue with get_nowait().
+        """
+        while True:
+            # Block until there is at least one row — idle ticks cost nothing
+            item = await self._queue.get()
+            if item is _STOP:
+                return
+            batch = self._batch = [item]
+
+            if self._queue.qsize() + 1 < self._max_batch:
+                try:
+                    await asyncio.wait_for(
+                        self._full.wait(), self._flush_interval
+                    )
+                except asyncio.TimeoutError:
+                    pass
+            self._full.clear()
+
+            stopping = False
+            while len(batch) < self._max_batch and not self._queue.empty():
+                item = self._queue.get_nowait()
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            # Rows past max_batch stay queued and open the next tick
+            # (or are flushed by drain() after _STOP)
+            await self._flush(batch)
+            if stopping:
+                return
+
+    async def _flush(
+        self,
+        batch: list[tuple[WeightMeasurementCreate, asyncio.Future]],
+    ) -> None:
+        """Insert a batch and resolve every caller's future with its row."""
+        params = [data.model_dump() for data, _ in batch]
+
+        try:
+            for attempt in range(_MAX_RETRIES + 1):
+                try:
+                    async with AsyncSessionLocal() as db:
+                        result = await db.execute(_INSERT, params)
+                        rows = result.scalars().all()
+                        await db.commit()
+                    break
+                except Exception as exc:
+                    if attempt == _MAX_RETRIES or not is_transient_db_error(exc):
+                        raise
+                    await asyncio.sleep(_RETRY_BACKOFF * 2 ** attempt)
+        except IntegrityError as exc:
+            if len(batch) == 1:
+                self._fail(batch, exc)
+                return
+            # One bad row (FK to a just-deleted animal, check violation)
+            # must not fail its co-batched callers: isolate it
+            logger.warning(
+                "[repo] weight measurement batch rejected (%s rows), "
+                "retrying row by row: %s",
+                len(batch),
+                exc,
+            )
+            await self._flush_rows(batch, params)
+            return
+        except Exception as exc:
+            self._fail(batch, exc)
+            return
+
+        self._resolve(batch, rows)
+        self._total_flushes += 1
+        logger.debug("[repo] Flushed %s weight measurements", len(batch))
+
+    async def _flush_rows(
+        self,
+        batch: list[tuple[WeightMeasurementCreate, asyncio.Future]],
+        params: list[dict],
+    ) -> None:
+        """
+        Fallback after an IntegrityError: one SAVEPOINT per row, so only
+        the offending callers get the error and the rest are committed.
+        """
+        inserted: list[tuple] = []  # (item, row)
+        failed: list[tuple] = []    # (item, exc)
+        try:
+            async with AsyncSessionLocal() as db:
+                for item, row_params in zip(batch, params):
+                    try:
+                        async with db.begin_nested():
+                            result = await db.execute(_INSERT, row_params)
+                            inserted.append((item, result.scalar_one()))
+                    except IntegrityError as exc:
+                        failed.append((item, exc))
+                await db.commit()
+        except Exception as exc:
+            self._fail(batch, exc)
+            return
+
+        for item, exc in failed:
+            self._fail([item], exc)
+        if inserted:
+            self._resolve(
+                [item for item, _ in inserted], [row for _, row in inserted]
+            )
+        self._total_flushes += 1
+
+    def _resolve(
+        self,
+        batch: list[tuple[WeightMeasurementCreate, asyncio.Future]],
+        rows,
+    ) -> None:
+        """Hand each caller its inserted row."""
+        for animal_id in {data.animal_id for data, _ in batch}:
+            forget_latest(animal_id)
+
+        for (_, future), row in zip(batch, rows):
+            # Caller may have been cancelled while waiting
+            if not future.done():
+                future.set_result(row)
+
+        self._total_rows += len(batch)
+
+    def _fail_unresolved(
+        self,
+        batch: list[tuple[WeightMeasurementCreate, asyncio.Future]],
+        reason: str,
+    ) -> None:
+        """Fail the futures in batch that are still pending."""
+        unresolved = [item for item in batch if not item[1].done()]
+        if unresolved:
+            self._fail(unresolved, RuntimeError(reason))
+
+    def _fail(
+        self,
+        batch: list[tuple[WeightMeasurementCreate, asyncio.Future]],
+        exc: Exception,
+    ) -> None:
+        """Fail every caller in batch with a DatabaseError."""
+        self._failed_flushes += 1
+        logger.error(
+            "[repo] weight measurement flush failed (%s rows): %s",
+            len(batch),
+            exc,
+        )
+        error = DatabaseError(
+            message="Failed to create weight measurement",
+            details={"error": str(exc), "batch_size": len(batch)},
+        )
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    def get_stats(self) -> dict:
+        """Get writer statistics."""
+        return {
+            "pending_rows": self._queue.qsize(),
+            "total_rows": self._total_rows,
+            "total_flushes": self._total_flushes,
+            "failed_flushes": self._failed_flushes,
+        }
+
+
+# Global writer instance (started in main.py on startup)
+_weight_writer: WeightMeasurementWriter | None = None
+
+
+def get_weight_writer() -> WeightMeasurementWriter:
+    """
+    Get the global weight measurement writer.
+
+    Raises:
+        RuntimeError: If writer hasn't been initialized
+    """
+    if _weight_writer is None:
+        raise RuntimeError(
+            "Weight measurement writer not initialized. "
+            "Call initialize_weight_writer() in startup event."
+        )
+    return _weight_writer
+
+
+def initialize_weight_writer() -> WeightMeasurementWriter:
+    """Create and start the global writer (call in startup event)."""
+    global _weight_writer
+    _weight_writer = WeightMeasurementWriter(
+        flush_interval=settings.WM_BUFFER_MS / 1000,
+        max_batch=settings.WM_BUFFER_MAX,
+    )
+    _weight_writer.start()
+    return _weight_writer
+
+
+async def shutdown_weight_writer() -> None:
+    """Drain pending rows and stop the writer (call in shutdown event)."""
+    global _weight_writer
+
+    if _weight_writer is not None:
+        await _weight_writer.drain()
+        _weight_writer = None
@@ -0,0 +1,142 @@
+"""
+Periodic refresh of the wm_stats_30d materialized view.
+
+get_weight_stats() serves the dashboard default window (30 days,
+confidence >= 0.7) from this view, so the aggregate is paid once per
+refresh instead of once per request. REFRESH ... CONCURRENTLY keeps the
+view readable while it is rebuilt.
+
+Every uvicorn worker runs a refresher, but only one of them refreshes per
+interval: ticks are aligned to the wall clock (all workers wake at the
+same moment) and the refresh runs under pg_try_advisory_xact_lock — the
+workers that lose the race skip that tick.
+
+RESPONSIBILITY: Database access only. No business logic.
+"""
+
+import asyncio
+from typing import Optional
+import logging
+import time
+
+from sqlalchemy import text
+
+from app.core.database import AsyncSessionLocal
+from app.repositories.weight_measurement import REFRESH_STATS_VIEW
+
+logger = logging.getLogger(__name__)
+
+# Advisory lock key (any app-wide unique bigint): "wm_stats_30d" refresh
+_REFRESH_LOCK_KEY = 0x776D5F7374617473  # b"wm_stats"
+_TRY_LOCK = text("SELECT pg_try_advisory_xact_lock(:key)")
+
+
+class WeightStatsViewRefresher:
+    """
+    Background task refreshing wm_stats_30d every ``interval`` seconds.
+
+    Args:
+        interval: Seconds between refreshes (default 5 minutes)
+    """
+
+    def __init__(self, interval: float = 300.0) -> None:
+        self._interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+        # Statistics
+        self._total_refreshes = 0
+        self._skipped_refreshes = 0  # Another worker held the lock
+        self._failed_refreshes = 0
+
+    def start(self) -> None:
+        """Start the background refresh loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the refresh loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def refresh(self) -> bool:
+        """
+        Rebuild the view once, unless another worker is already doing it.
+
+        The transaction-level advisory lock is released at commit.
+
+        Returns:
+            True if this call refreshed the view
+        """
+        async with AsyncSessionLocal() as db:
+            locked = await db.scalar(_TRY_LOCK, {"key": _REFRESH_LOCK_KEY})
+            if not locked:
+                await db.rollback()
+                self._skipped_refreshes += 1
+                logger.debug("[repo] wm_stats_30d refresh skipped (locked)")
+                return False
+            await db.execute(REFRESH_STATS_VIEW)
+            await db.commit()
+        self._total_refreshes += 1
+        logger.debug("[repo] wm_stats_30d refreshed")
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            # Sleep to the next wall-clock multiple of the interval, so the
+            # refreshers of all workers compete for the lock at once
+            await asyncio.sleep(self._interval - time.time() % self._interval)
+            try:
+                await self.refresh()
+            except Exception as exc:
+                # Stale stats are acceptable — log and keep the loop alive
+                self._failed_refreshes += 1
+                logger.error("[repo] wm_stats_30d refresh failed: %s", exc)
+
+    def get_stats(self) -> dict:
+        """Get refresher statistics."""
+        return {
+            "total_refreshes": self._total_refreshes,
+            "skipped_refreshes": self._skipped_refreshes,
+            "failed_refreshes": self._failed_refreshes,
+        }
+
+
+# Global refresher instance (started in main.py on startup)
+_stats_view_refresher: WeightStatsViewRefresher | None = None
+
+
+def get_stats_view_refresher() -> WeightStatsViewRefresher:
+    """
+    Get the global stats view refresher.
+
+    Raises:
+        RuntimeError: If refresher hasn't been initialized
+    """
+    if _stats_view_refresher is None:
+        raise RuntimeError(
+            "Stats view refresher not initialized. "
+            "Call initialize_stats_view_refresher() in startup event."
+        )
+    return _stats_view_refresher
+
+
+def initialize_stats_view_refresher() -> WeightStatsViewRefresher:
+    """Create and start the global refresher (call in startup event)."""
+    global _stats_view_refresher
+    _stats_view_refresher = WeightStatsViewRefresher()
+    _stats_view_refresher.start()
+    return _stats_view_refresher
+
+
+async def shutdown_stats_view_refresher() -> None:
+    """Stop the refresher (call in shutdown event)."""
+    global _stats_view_refresher
+
+    if _stats_view_refresher is not None:
+        await _stats_view_refresher.stop()
+        _stats_view_refresher = None
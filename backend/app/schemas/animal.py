@@ -366,25 +366,44 @@ Pydantic schemas for Animal API.
 Production-ready version with robust datetime validation and normalization.
 """
 
+import re
 from datetime import datetime, timezone
 from typing import Optional, Any
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 
 from app.models.animal import AnimalSpecies, AnimalGender, AnimalStatus
 
+_UTC = timezone.utc
 
-def ensure_naive_utc(v: Any) -> Any:
+# Tag ID: faqat harf (istalgan alifbo), raqam va chiziqcha — eski
+# ``c.isalnum() or c == '-'`` bilan bir xil ([^\W_] = \w dan "_" siz)
+_TAG_RE = re.compile(r"\A(?:[^\W_]|-)+\Z")
+
+
+def ensure_aware_utc(v: Any) -> Any:
     """
-    Vaqtni solishtirishda xatolik chiqmasligi uchun uni 'naive' holatga keltiradi.
-    Bu funksiya ham kiritilayotgan, ham bazadan olinayotgan ma'lumotlar uchun ishlaydi.
+    Kiritilgan vaqtni UTC 'aware' holatga keltiradi (naive → UTC deb olinadi).
+    Barcha vaqt ustunlari TIMESTAMPTZ, shuning uchun bazadan kelgan qiymatlar
+    allaqachon aware UTC — ular uchun hech qanday konvertatsiya kerak emas.
     """
-    if isinstance(v, datetime) and v.tzinfo is not None:
-        return v.astimezone(timezone.utc).replace(tzinfo=None)
+    if isinstance(v, datetime):
+        tz = v.tzinfo
+        if tz is _UTC:
+            return v  # Eng ko'p uchraydigan holat — hech narsa qilmaymiz
+        if tz is None:
+            return v.replace(tzinfo=_UTC)
+        return v.astimezone(_UTC)
     return v
 
 
-class AnimalBase(BaseModel):
-    """Barcha hayvon sxemalari uchun asosiy model."""
+class AnimalFields(BaseModel):
+    """
+    Hayvonning umumiy maydonlari (validatorlarsiz).
+    
+    Javob sxemasi shundan meros oladi: bazadan kelgan qiymatlar allaqachon
+    tekshirilgan, har bir qator uchun kirish validatorlarini qayta ishlatish
+    (tag tekshiruvi, "kelajakdagi sana" uchun now()) ortiqcha.
+    """
     
     tag_id: str = Field(
         ..., min_length=3, max_length=50,
@@ -395,30 +414,34 @@ class AnimalBase(BaseModel):
     breed: Optional[str] = Field(None, max_length=100)
     gender: AnimalGender = Field(default=AnimalGender.UNKNOWN)
     birth_date: Optional[datetime] = Field(None)
-    acquisition_date: datetime = Field(default_factory=lambda: datetime.now(timezone.utc).replace(tzinfo=None))
+    # Berilmasa None → INSERT'da ustun tushirib qoldiriladi, DB now() qo'yadi
+    acquisition_date: Optional[datetime] = Field(None)
     status: AnimalStatus = Field(default=AnimalStatus.ACTIVE)
     notes: Optional[str] = Field(None, max_length=1000)
 
+
+class AnimalBase(AnimalFields):
+    """Kirish sxemalari uchun asosiy model (maydonlar + validatorlar)."""
+
     # REUSABLE VALIDATORS
     @field_validator("tag_id")
     @classmethod
     def validate_tag_id(cls, v: str) -> str:
         v = v.strip().upper()
-        if not all(c.isalnum() or c == '-' for c in v):
+        if not _TAG_RE.match(v):
             raise ValueError("Tag ID faqat harf, raqam va chiziqchadan iborat bo'lishi kerak")
         return v
 
     @field_validator("birth_date", "acquisition_date")
     @classmethod
     def validate_dates(cls, v: Optional[datetime]) -> Optional[datetime]:
-        """Kelajakdagi sanani kiritishni taqiqlash (Naive-safe comparison)."""
+        """Kelajakdagi sanani kiritishni taqiqlash (aware UTC comparison)."""
         if v is not None:
-            v_naive = ensure_naive_utc(v)
-            now_naive = datetime.now(timezone.utc).replace(tzinfo=None)
+            v_utc = ensure_aware_utc(v)
             
-            if v_naive > now_naive:
+            if v_utc > datetime.now(_UTC):
                 raise ValueError("Sana kelajakda bo'lishi mumkin emas")
-            return v_naive
+            return v_utc
         return v
 
 
@@ -427,6 +450,11 @@ class AnimalCreate(AnimalBase):
     pass
 
 
+class AnimalBulkCreate(BaseModel):
+    """Bir so'rovda ko'p hayvon yaratish (bitta multi-row INSERT)."""
+    items: list[AnimalCreate] = Field(..., min_length=1, max_length=1000)
+
+
 class AnimalUpdate(BaseModel):
     """Hayvonni yangilash uchun sxema (Hamma maydonlar optional)."""
     tag_id: Optional[str] = Field(None, min_length=3, max_length=50)
@@ -443,7 +471,7 @@ class AnimalUpdate(BaseModel):
     _validate_dates = field_validator("birth_date", "acquisition_date")(AnimalBase.validate_dates)
 
 
-class AnimalResponse(AnimalBase):
+class AnimalResponse(AnimalFields):
     """API javobi uchun sxema (Bazadagi barcha maydonlar bilan)."""
     id: int
     first_detected_at: Optional[datetime] = None
@@ -452,18 +480,26 @@ class AnimalResponse(AnimalBase):
     created_at: datetime
     updated_at: datetime
 
-    # Bazadan o'qiyotganda ham vaqtni normallashtiramiz
-    _normalize_dates = field_validator(
-        "birth_date", "acquisition_date", "created_at", "updated_at", 
-        "first_detected_at", "last_detected_at", mode="before"
-    )(ensure_naive_utc)
-
+    # Vaqt ustunlari TIMESTAMPTZ — bazadan aware UTC keladi, normalizatsiya shart emas
     model_config = ConfigDict(from_attributes=True)
 
+    @classmethod
+    def from_orm_trusted(cls, obj: Any) -> "AnimalResponse":
+        """
+        Bazadan kelgan Animal (yoki ustunlar Row'i) dan validatsiyasiz quradi.
+
+        Faqat ishonchli ma'lumot uchun! HTTP kirishi (AnimalCreate/AnimalUpdate)
+        har doim model_validate orqali o'tadi.
+        """
+        return cls.model_construct(
+            **{name: getattr(obj, name) for name in cls.model_fields}
+        )
+
 
 class AnimalListResponse(BaseModel):
     """Sahifalangan ro'yxat uchun javob sxemasi."""
     items: list[AnimalResponse]
     total: int
     skip: int
-    limit: int
\ No newline at end of file
+    limit: int
+    next_cursor: Optional[int] = None
\ No newline at end of file
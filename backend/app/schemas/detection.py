@@ -173,4 +173,36 @@ class ModelInfoResponse(BaseModel):
                 "available_classes": 80,
             }
         },
-    )
\ No newline at end of file
+    )
+
+
+class DetectionRecordResponse(BaseModel):
+    """Stored detection event (row of the detections table)."""
+    
+    id: int
+    animal_id: Optional[int] = None
+    camera_id: str
+    timestamp: datetime
+    confidence: float
+    class_id: int
+    class_name: str
+    bbox_x: float
+    bbox_y: float
+    bbox_w: float
+    bbox_h: float
+    estimated_weight: Optional[float] = None
+    frame_number: Optional[int] = None
+    inference_time_ms: Optional[float] = None
+    
+    model_config = ConfigDict(from_attributes=True)
+    
+    @classmethod
+    def from_orm_trusted(cls, obj: Any) -> "DetectionRecordResponse":
+        """
+        Build from a Detection ORM row WITHOUT validation.
+        
+        Trusted data only: values come straight from typed DB columns.
+        """
+        return cls.model_construct(
+            **{name: getattr(obj, name) for name in cls.model_fields}
+        )
@@ -4,10 +4,21 @@ Pydantic schemas for Weight Measurement API.
 Defines data structures for weight measurement operations.
 """
 
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 from typing import Optional, Any
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 
+_UTC = timezone.utc
+
+# Allowed clock skew for "future" timestamps from cameras
+_FUTURE_TOLERANCE_S = 5.0
+
+
+def _utcnow() -> datetime:
+    """Aware UTC now (default for measurement timestamps)."""
+    return datetime.now(_UTC)
+
 
 class WeightMeasurementBase(BaseModel):
     """Base schema for weight measurement."""
@@ -19,14 +30,16 @@ class WeightMeasurementBase(BaseModel):
     )
     
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=_utcnow,
         description="When the measurement was captured",
     )
     
+    # Stored as whole grams: anything below 1 g would round to weight_g = 0
+    # and violate check_weight_positive on INSERT
     estimated_weight_kg: float = Field(
         ...,
-        gt=0,
-        description="Estimated weight in kilograms",
+        ge=0.001,
+        description="Estimated weight in kilograms (min 1 g)",
     )
     
     confidence_score: float = Field(
@@ -58,12 +71,14 @@ class WeightMeasurementBase(BaseModel):
     @classmethod
     def validate_timestamp(cls, v: datetime) -> datetime:
         """
-        Ensure timestamp is not in the future.
+        Ensure timestamp is aware UTC and not in the future.
         
+        Naive values are taken as UTC, matching the TIMESTAMPTZ column.
         Allows up to 5 seconds in future to account for clock skew.
         """
-        max_future = datetime.utcnow().timestamp() + 5  # 5 seconds tolerance
-        if v.timestamp() > max_future:
+        if v.tzinfo is None:
+            v = v.replace(tzinfo=_UTC)
+        if v.timestamp() - time.time() > _FUTURE_TOLERANCE_S:
             raise ValueError("Timestamp cannot be more than 5 seconds in the future")
         return v
 
@@ -128,6 +143,19 @@ class WeightMeasurementResponse(WeightMeasurementBase):
             }
         },
     )
+    
+    @classmethod
+    def from_orm_trusted(cls, obj: Any) -> "WeightMeasurementResponse":
+        """
+        Build from a WeightMeasurement instance or column Row WITHOUT validation.
+        
+        Trusted data only: rows were validated on the way in, and
+        re-running validate_timestamp (now() comparison) per row is waste.
+        Client input must keep going through WeightMeasurementCreate.
+        """
+        return cls.model_construct(
+            **{name: getattr(obj, name) for name in cls.model_fields}
+        )
 
 
 class WeightMeasurementListResponse(BaseModel):
@@ -138,9 +166,9 @@ class WeightMeasurementListResponse(BaseModel):
         description="List of measurements",
     )
     
-    total: int = Field(
-        ...,
-        description="Total count (ignoring pagination)",
+    total: Optional[int] = Field(
+        None,
+        description="Total count (ignoring pagination); only when requested",
     )
     
     skip: int = Field(
@@ -152,6 +180,21 @@ class WeightMeasurementListResponse(BaseModel):
         10,
         description="Maximum items returned",
     )
+    
+    has_more: bool = Field(
+        False,
+        description="Whether another page exists",
+    )
+    
+    next_cursor: Optional[datetime] = Field(
+        None,
+        description="Pass as `before` to fetch the next page",
+    )
+    
+    next_cursor_id: Optional[int] = Field(
+        None,
+        description="Pass as `before_id` together with `before`",
+    )
 
 
 class WeightStatsResponse(BaseModel):
@@ -178,6 +221,16 @@ class WeightStatsResponse(BaseModel):
         description="Most recent weight measurement",
     )
     
+    median_weight_kg: Optional[float] = Field(
+        None,
+        description="Median weight across measurements",
+    )
+    
+    weight_change_per_day_kg: Optional[float] = Field(
+        None,
+        description="Least-squares weight gain rate (kg/day)",
+    )
+    
     weight_trend: Optional[str] = Field(
         None,
         description="Trend direction: 'increasing', 'decreasing', 'stable'",
@@ -199,6 +252,10 @@ class LiveWeightUpdate(BaseModel):
     Real-time weight update for WebSocket broadcast.
     
     Lightweight schema optimized for real-time transmission.
+    
+    Documents the message contract only: the server builds the payload as a
+    plain dict (WeightMeasurementService._broadcast_measurement) and never
+    instantiates this model on the hot path.
     """
     
     measurement_id: int
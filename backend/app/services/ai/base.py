@@ -13,9 +13,13 @@ from typing import Any
 from dataclasses import dataclass
 from datetime import datetime
 import numpy as np
+import orjson
 
+# datetime → ISO 8601 with "Z", numpy scalars/arrays handled natively
+_JSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_SERIALIZE_NUMPY
 
-@dataclass
+
+@dataclass(slots=True)
 class BoundingBox:
     """
     Bounding box coordinates.
@@ -46,7 +50,7 @@ class BoundingBox:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Detection:
     """
     Single object detection result.
@@ -79,7 +83,7 @@ class Detection:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class InferenceResult:
     """
     Complete inference result for a single frame.
@@ -112,6 +116,41 @@ class InferenceResult:
             'frame_shape': self.frame_shape,
             'timestamp': self.timestamp.isoformat(),
         }
+    
+    def to_json(self) -> bytes:
+        """
+        Serialize straight to JSON bytes (InferenceResultResponse layout).
+        
+        One orjson pass over plain dicts — no per-detection to_dict() /
+        isoformat() and no Pydantic model in between.
+        """
+        return orjson.dumps(
+            {
+                'detections': [
+                    {
+                        'class_id': d.class_id,
+                        'class_name': d.class_name,
+                        'confidence': d.confidence,
+                        'bounding_box': {
+                            'x': d.bounding_box.x,
+                            'y': d.bounding_box.y,
+                            'width': d.bounding_box.width,
+                            'height': d.bounding_box.height,
+                        },
+                        'timestamp': d.timestamp,
+                        'has_mask': d.mask is not None,
+                        'extra_data': d.extra_data or {},
+                    }
+                    for d in self.detections
+                ],
+                'detection_count': len(self.detections),
+                'inference_time_ms': self.inference_time_ms,
+                'model_name': self.model_name,
+                'frame_shape': self.frame_shape,
+                'timestamp': self.timestamp,
+            },
+            option=_JSON_OPTIONS,
+        )
 
 
 class AIServiceInterface(ABC):
@@ -146,6 +185,7 @@ class AIServiceInterface(ABC):
         frame: np.ndarray,
         confidence_threshold: float = 0.5,
         target_classes: list[int] | None = None,
+        include_abs_box: bool = False,
     ) -> InferenceResult:
         """
         Perform object detection on a single frame.
@@ -154,6 +194,8 @@ class AIServiceInterface(ABC):
             frame: Input image as numpy array (BGR format)
             confidence_threshold: Minimum confidence score (0.0-1.0)
             target_classes: Filter for specific class IDs (None = all classes)
+            include_abs_box: Add pixel coordinates to each detection's
+                extra_data['absolute_box'] (off by default)
             
         Returns:
             InferenceResult containing all detections
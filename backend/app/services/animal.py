@@ -7,13 +7,23 @@ RESPONSIBILITY: Business logic, validation, rule enforcement.
 NO direct database access - use Repository.
 """
 
-from typing import Optional
+from collections import Counter
+from typing import AsyncIterator, Optional
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 
 from app.repositories.animal import AnimalRepository
-from app.schemas.animal import AnimalCreate, AnimalUpdate, AnimalResponse, AnimalListResponse
+from app.schemas.animal import (
+    AnimalCreate,
+    AnimalBulkCreate,
+    AnimalUpdate,
+    AnimalResponse,
+    AnimalListResponse,
+)
 from app.models.animal import Animal, AnimalStatus
+from app.core.cache import TTLCache
+from app.core.database import on_commit
 from app.core.exceptions import (
     EntityNotFoundError,
     EntityAlreadyExistsError,
@@ -22,6 +32,41 @@ from app.core.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Detail pages and tag-scanner lookups re-read the same animals: cache the
+# built responses per worker, keyed ("id", pk) / ("tag", tag_id). Writes
+# through this service drop both keys after commit; other writers (other workers, the
+# detection counter) are reflected within one TTL.
+_ANIMAL_CACHE = TTLCache(ttl=30.0)
+
+# Archived animals are read-only (update/delete business rules)
+_ARCHIVED = (AnimalStatus.SOLD, AnimalStatus.DECEASED)
+
+# Query-param string → enum without the ValueError path of AnimalStatus(...)
+_STATUS_BY_VALUE = {s.value: s for s in AnimalStatus}
+
+
+def _parse_status(status: Optional[str]) -> Optional[AnimalStatus]:
+    """Status filter string → AnimalStatus; unknown values are ignored."""
+    if not status:
+        return None
+    status_enum = _STATUS_BY_VALUE.get(status.lower())
+    if status_enum is None:
+        logger.warning("Invalid status filter: %s", status)
+    return status_enum
+
+
+def _cache_response(response: AnimalResponse) -> AnimalResponse:
+    """Cache a response under both lookup keys."""
+    _ANIMAL_CACHE.put(("id", response.id), response)
+    _ANIMAL_CACHE.put(("tag", response.tag_id), response)
+    return response
+
+
+def _forget_animal(animal_id: int, tag_id: str) -> None:
+    """Drop both cache keys of an animal (call after writes)."""
+    _ANIMAL_CACHE.pop(("id", animal_id))
+    _ANIMAL_CACHE.pop(("tag", tag_id))
+
 
 class AnimalService:
     """
@@ -33,7 +78,11 @@ class AnimalService:
     3. Proper status transitions
     
     Args:
-        db: AsyncSession instance (injected)
+        db: AsyncSession instance (injected). One session per request /
+            per task: an AsyncSession owns a single connection, so it must
+            NOT be shared across concurrently running tasks (asyncpg
+            raises "another operation is in progress"). Use get_db() in
+            routes and a fresh AsyncSessionLocal() in background tasks.
     """
     
     def __init__(self, db: AsyncSession):
@@ -64,30 +113,76 @@ class AnimalService:
                 ...
             ))
         """
-        # BUSINESS RULE 1: Check tag_id uniqueness
-        existing = await self.repository.get_by_tag_id(animal_data.tag_id)
+        # BUSINESS RULE 1: tag_id must be unique.
+        # Enforced by the INSERT itself (ON CONFLICT DO NOTHING) — the
+        # happy path is one round-trip; the duplicate is only looked up
+        # on conflict, to report its id.
+        animal = await self.repository.create(animal_data)
         
-        if existing:
+        if animal is None:
+            existing = await self.repository.get_by_tag_id(animal_data.tag_id)
             logger.warning(
-                f"Attempted to create duplicate animal: {animal_data.tag_id}"
+                "Attempted to create duplicate animal: %s",
+                animal_data.tag_id,
             )
             raise EntityAlreadyExistsError(
                 message=f"Animal with tag ID '{animal_data.tag_id}' already exists",
                 details={
                     "tag_id": animal_data.tag_id,
-                    "existing_id": existing.id,
+                    "existing_id": existing.id if existing else None,
                 },
             )
         
-        # Create animal
-        animal = await self.repository.create(animal_data)
-        
         logger.info(
-            f"Animal created successfully: {animal.tag_id} "
-            f"(ID: {animal.id}, Species: {animal.species.value})"
+            "Animal created successfully: %s (ID: %s, Species: %s)",
+            animal.tag_id,
+            animal.id,
+            animal.species.value,
         )
         
-        return AnimalResponse.model_validate(animal)
+        return AnimalResponse.from_orm_trusted(animal)
+    
+    async def create_animals(self, data: AnimalBulkCreate) -> list[AnimalResponse]:
+        """
+        Create many animals in one request (all-or-nothing).
+        
+        Same tag_id uniqueness rule as create_animal(), but the rows go out
+        as one multi-row INSERT instead of one round-trip per animal. Any
+        conflict fails the whole batch (get_db() rolls the transaction back).
+        
+        Args:
+            data: Validated bulk creation data
+            
+        Returns:
+            Created animal responses, in request order
+            
+        Raises:
+            EntityAlreadyExistsError: If a tag_id is repeated in the request
+                or already exists
+        """
+        tag_ids = [item.tag_id for item in data.items]
+        repeated = sorted(t for t, n in Counter(tag_ids).items() if n > 1)
+        if repeated:
+            raise EntityAlreadyExistsError(
+                message="Duplicate tag IDs in request",
+                details={"tag_ids": repeated},
+            )
+        
+        created = await self.repository.create_many(data.items)
+        
+        if len(created) < len(tag_ids):
+            taken = sorted(set(tag_ids) - {a.tag_id for a in created})
+            logger.warning("Attempted to create duplicate animals: %s", taken)
+            raise EntityAlreadyExistsError(
+                message=f"{len(taken)} tag ID(s) already exist",
+                details={"tag_ids": taken},
+            )
+        
+        logger.info("Animals created successfully: %s", len(created))
+        
+        position = {tag_id: i for i, tag_id in enumerate(tag_ids)}
+        created.sort(key=lambda a: position[a.tag_id])
+        return [AnimalResponse.from_orm_trusted(a) for a in created]
     
     async def get_animal(self, animal_id: int) -> AnimalResponse:
         """
@@ -102,16 +197,20 @@ class AnimalService:
         Raises:
             EntityNotFoundError: If animal not found
         """
+        cached = _ANIMAL_CACHE.get(("id", animal_id))
+        if cached is not TTLCache.MISS:
+            return cached
+        
         animal = await self.repository.get_by_id(animal_id)
         
         if not animal:
-            logger.warning(f"Animal not found: ID {animal_id}")
+            logger.warning("Animal not found: ID %s", animal_id)
             raise EntityNotFoundError(
                 message=f"Animal with ID {animal_id} not found",
                 details={"animal_id": animal_id},
             )
         
-        return AnimalResponse.model_validate(animal)
+        return _cache_response(AnimalResponse.from_orm_trusted(animal))
     
     async def get_animals(
         self,
@@ -119,6 +218,7 @@ class AnimalService:
         limit: int = 100,
         species: Optional[str] = None,
         status: Optional[str] = None,
+        after_id: Optional[int] = None,
     ) -> AnimalListResponse:
         """
         Get paginated list of animals with optional filters.
@@ -128,6 +228,8 @@ class AnimalService:
             limit: Maximum records to return (max 100)
             species: Filter by species (optional)
             status: Filter by status (optional)
+            after_id: Keyset cursor from previous page's next_cursor
+                      (optional, takes precedence over skip)
             
         Returns:
             Paginated list response with metadata
@@ -138,41 +240,61 @@ class AnimalService:
         # Cap limit to prevent abuse
         if limit > 100:
             limit = 100
-            logger.warning(f"Limit capped to 100 (requested: {limit})")
+            logger.warning("Limit capped to 100 (requested: %s)", limit)
         
         # Convert status string to enum if provided
-        status_enum = None
-        if status:
-            try:
-                status_enum = AnimalStatus(status.lower())
-            except ValueError:
-                logger.warning(f"Invalid status filter: {status}")
-                # Invalid status - just ignore filter
-                pass
-        
-        # Get animals and total count
-        animals = await self.repository.get_all(
+        # Invalid status - just ignore filter
+        status_enum = _parse_status(status)
+        
+        # Get animals (column rows — no ORM hydration) and total count,
+        # in one round-trip where the repository can
+        animals, total = await self.repository.get_all_with_total(
             skip=skip,
             limit=limit,
             species=species,
             status=status_enum,
-        )
-        
-        total = await self.repository.count(
-            species=species,
-            status=status_enum,
+            after_id=after_id,
         )
         
         # Convert to response schemas
-        items = [AnimalResponse.model_validate(animal) for animal in animals]
+        items = [AnimalResponse.from_orm_trusted(animal) for animal in animals]
         
-        return AnimalListResponse(
+        # Items and counts come from the DB — skip re-validating the wrapper
+        return AnimalListResponse.model_construct(
             items=items,
             total=total,
             skip=skip,
             limit=limit,
+            # Full page → there may be more; hand out the seek cursor
+            next_cursor=animals[-1].id if len(animals) == limit else None,
         )
     
+    async def export_animals(
+        self,
+        species: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> AsyncIterator[AnimalResponse]:
+        """
+        Stream all animals matching the filters (no pagination cap).
+        
+        Backed by a server-side cursor, so memory use is constant
+        regardless of herd size.
+        
+        Args:
+            species: Filter by species (optional)
+            status: Filter by status (optional, invalid values are ignored)
+            
+        Yields:
+            Animal responses ordered by ID
+        """
+        status_enum = _parse_status(status)
+        
+        async for animal in self.repository.iter_all(
+            species=species,
+            status=status_enum,
+        ):
+            yield AnimalResponse.from_orm_trusted(animal)
+    
     async def update_animal(
         self,
         animal_id: int,
@@ -198,41 +320,24 @@ class AnimalService:
             BusinessRuleViolationError: If trying to modify archived animal
             EntityAlreadyExistsError: If new tag_id already exists
         """
-        # Get existing animal
-        animal = await self.repository.get_by_id(animal_id)
-        
-        if not animal:
-            logger.warning(f"Update failed: Animal {animal_id} not found")
-            raise EntityNotFoundError(
-                message=f"Animal with ID {animal_id} not found",
-                details={"animal_id": animal_id},
-            )
-        
-        # BUSINESS RULE 2: Cannot modify archived animals
-        if animal.status in (AnimalStatus.SOLD, AnimalStatus.DECEASED):
-            logger.warning(
-                f"Attempted to update archived animal: "
-                f"ID {animal_id}, Status {animal.status.value}"
-            )
-            raise BusinessRuleViolationError(
-                message=(
-                    f"Cannot modify archived animal "
-                    f"(status: {animal.status.value})"
-                ),
-                details={
-                    "animal_id": animal_id,
-                    "status": animal.status.value,
-                },
-            )
+        # BUSINESS RULE 2 (archived animals are read-only) is enforced by
+        # the UPDATE itself — the happy path is ONE statement. Only a tag
+        # change needs the current row first (RULE 3 + cache invalidation).
+        old_tag = None
+        if update_data.tag_id:
+            animal = await self.repository.get_status_and_tag(animal_id)
+            self._ensure_updatable(animal_id, animal)
+            old_tag = animal.tag_id
         
         # BUSINESS RULE 3: If updating tag_id, check uniqueness
-        if update_data.tag_id and update_data.tag_id != animal.tag_id:
+        if update_data.tag_id and update_data.tag_id != old_tag:
             existing = await self.repository.get_by_tag_id(update_data.tag_id)
             
             if existing and existing.id != animal_id:
                 logger.warning(
-                    f"Tag ID conflict: {update_data.tag_id} "
-                    f"already exists (ID: {existing.id})"
+                    "Tag ID conflict: %s already exists (ID: %s)",
+                    update_data.tag_id,
+                    existing.id,
                 )
                 raise EntityAlreadyExistsError(
                     message=f"Tag ID '{update_data.tag_id}' already exists",
@@ -243,11 +348,31 @@ class AnimalService:
                 )
         
         # Perform update
-        updated_animal = await self.repository.update(animal_id, update_data)
+        updated_animal = await self.repository.update(
+            animal_id, update_data, blocked_statuses=_ARCHIVED
+        )
+        if updated_animal is None:
+            # Missing or archived — diagnose (failure path only)
+            self._ensure_updatable(
+                animal_id, await self.repository.get_status_and_tag(animal_id)
+            )
+            # Archived/deleted between our read and the UPDATE
+            raise EntityNotFoundError(
+                message=f"Animal with ID {animal_id} not found",
+                details={"animal_id": animal_id},
+            )
         
-        logger.info(f"Animal updated successfully: ID {animal_id}")
+        # Drop cached responses once the UPDATE is committed (get_db commits
+        # after the handler returns; dropping earlier lets a concurrent GET
+        # re-cache the old row)
+        new_tag = updated_animal.tag_id
+        on_commit(self.db, lambda: _forget_animal(animal_id, new_tag))
+        if old_tag is not None:
+            on_commit(self.db, lambda: _forget_animal(animal_id, old_tag))
         
-        return AnimalResponse.model_validate(updated_animal)
+        logger.info("Animal updated successfully: ID %s", animal_id)
+        
+        return AnimalResponse.from_orm_trusted(updated_animal)
     
     async def delete_animal(self, animal_id: int) -> None:
         """
@@ -267,47 +392,94 @@ class AnimalService:
             This is a HARD delete. For production, consider implementing
             soft delete for all animals.
         """
-        # Get existing animal
-        animal = await self.repository.get_by_id(animal_id)
+        # BUSINESS RULE is enforced by the DELETE itself — one statement
+        deleted_tag = await self.repository.delete(
+            animal_id, blocked_statuses=_ARCHIVED
+        )
         
+        if deleted_tag is None:
+            # Missing or archived — diagnose (failure path only)
+            self._ensure_deletable(
+                animal_id, await self.repository.get_status_and_tag(animal_id)
+            )
+            # Archived/deleted concurrently — handle it gracefully
+            logger.error("Unexpected: Animal %s not found during delete", animal_id)
+            raise EntityNotFoundError(
+                message=f"Animal with ID {animal_id} not found",
+                details={"animal_id": animal_id},
+            )
+        
+        on_commit(self.db, lambda: _forget_animal(animal_id, deleted_tag))
+        logger.info("Animal deleted successfully: ID %s", animal_id)
+    
+    @staticmethod
+    def _ensure_updatable(animal_id: int, animal: Optional[Row]) -> None:
+        """
+        Raise if an animal (status/tag row) may not be updated.
+        
+        Raises:
+            EntityNotFoundError: If animal not found
+            BusinessRuleViolationError: If animal is archived
+        """
         if not animal:
-            logger.warning(f"Delete failed: Animal {animal_id} not found")
+            logger.warning("Update failed: Animal %s not found", animal_id)
             raise EntityNotFoundError(
                 message=f"Animal with ID {animal_id} not found",
                 details={"animal_id": animal_id},
             )
         
-        # BUSINESS RULE: Cannot delete archived animals
-        if animal.status in (AnimalStatus.SOLD, AnimalStatus.DECEASED):
+        # BUSINESS RULE 2: Cannot modify archived animals
+        if animal.status in _ARCHIVED:
             logger.warning(
-                f"Attempted to delete archived animal: "
-                f"ID {animal_id}, Status {animal.status.value}"
+                "Attempted to update archived animal: ID %s, Status %s",
+                animal_id,
+                animal.status.value,
             )
             raise BusinessRuleViolationError(
                 message=(
-                    f"Cannot delete archived animal "
-                    f"(status: {animal.status.value}). "
-                    f"Archived animals must be preserved for audit trail."
+                    f"Cannot modify archived animal "
+                    f"(status: {animal.status.value})"
                 ),
                 details={
                     "animal_id": animal_id,
                     "status": animal.status.value,
                 },
             )
+    
+    @staticmethod
+    def _ensure_deletable(animal_id: int, animal: Optional[Row]) -> None:
+        """
+        Raise if an animal (status/tag row) may not be deleted.
         
-        # Perform delete
-        deleted = await self.repository.delete(animal_id)
-        
-        if deleted:
-            logger.info(f"Animal deleted successfully: ID {animal_id}")
-        else:
-            # This shouldn't happen (we already checked existence)
-            # but handle it gracefully
-            logger.error(f"Unexpected: Animal {animal_id} not found during delete")
+        Raises:
+            EntityNotFoundError: If animal not found
+            BusinessRuleViolationError: If animal is archived
+        """
+        if not animal:
+            logger.warning("Delete failed: Animal %s not found", animal_id)
             raise EntityNotFoundError(
                 message=f"Animal with ID {animal_id} not found",
                 details={"animal_id": animal_id},
             )
+        
+        # BUSINESS RULE: Cannot delete archived animals
+        if animal.status in _ARCHIVED:
+            logger.warning(
+                "Attempted to delete archived animal: ID %s, Status %s",
+                animal_id,
+                animal.status.value,
+            )
+            raise BusinessRuleViolationError(
+                message=(
+                    f"Cannot delete archived animal "
+                    f"(status: {animal.status.value}). "
+                    f"Archived animals must be preserved for audit trail."
+                ),
+                details={
+                    "animal_id": animal_id,
+                    "status": animal.status.value,
+                },
+            )
     
     async def get_animal_by_tag(self, tag_id: str) -> AnimalResponse:
         """
@@ -316,7 +488,7 @@ class AnimalService:
         Convenience method for looking up by tag instead of database ID.
         
         Args:
-            tag_id: Unique tag identifier
+            tag_id: Unique tag identifier (case-insensitive)
             
         Returns:
             Animal response
@@ -324,13 +496,19 @@ class AnimalService:
         Raises:
             EntityNotFoundError: If animal not found
         """
+        # Path input is raw — normalize like the schema validators do
+        tag_id = tag_id.strip().upper()
+        cached = _ANIMAL_CACHE.get(("tag", tag_id))
+        if cached is not TTLCache.MISS:
+            return cached
+        
         animal = await self.repository.get_by_tag_id(tag_id)
         
         if not animal:
-            logger.warning(f"Animal not found: Tag {tag_id}")
+            logger.warning("Animal not found: Tag %s", tag_id)
             raise EntityNotFoundError(
                 message=f"Animal with tag ID '{tag_id}' not found",
                 details={"tag_id": tag_id},
             )
         
-        return AnimalResponse.model_validate(animal)
\ No newline at end of file
+        return _cache_response(AnimalResponse.from_orm_trusted(animal))
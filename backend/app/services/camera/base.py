@@ -9,23 +9,72 @@ DESIGN PATTERN: Strategy Pattern
 
 from abc import ABC, abstractmethod
 from typing import AsyncGenerator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+import cv2
 import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class CameraFrame:
     """
     Single camera frame with metadata.
     
     Represents one captured frame from any camera source.
+    
+    Sources hand over the decoded image as ``raw_frame`` at its native
+    size; ``frame`` resizes it to ``resolution`` on first access only,
+    so frames nobody looks at never pay for the resize.
+    
+    slots=True: one instance per frame at camera FPS — no per-instance
+    __dict__, so the resized image is cached in its own slot.
     """
-    frame: np.ndarray  # Image data (BGR format)
+    raw_frame: np.ndarray  # Decoded image data (BGR, native size)
     timestamp: datetime
     camera_id: str
     frame_number: int
-    resolution: tuple[int, int]  # (width, height)
+    resolution: tuple[int, int]  # Target (width, height)
+    _frame: np.ndarray | None = field(default=None, init=False, repr=False)
+    
+    @property
+    def frame(self) -> np.ndarray:
+        """Image data (BGR format) at the target resolution."""
+        if self._frame is not None:
+            return self._frame
+        
+        raw = self.raw_frame
+        width, height = self.resolution
+        src_height, src_width = raw.shape[:2]
+        if (src_width, src_height) == (width, height):
+            self._frame = raw
+        else:
+            # INTER_AREA: fastest and cleanest for downscaling
+            interpolation = (
+                cv2.INTER_AREA
+                if src_width * src_height > width * height
+                else cv2.INTER_LINEAR
+            )
+            self._frame = cv2.resize(
+                raw, (width, height), interpolation=interpolation
+            )
+        return self._frame
+    
+    def refill(
+        self,
+        raw_frame: np.ndarray,
+        timestamp: datetime,
+        frame_number: int,
+    ) -> None:
+        """
+        Reuse this object for a new frame from the same camera.
+        
+        For sources that recycle a fixed pool of frames instead of
+        allocating one per capture; drops the cached resize.
+        """
+        self.raw_frame = raw_frame
+        self.timestamp = timestamp
+        self.frame_number = frame_number
+        self._frame = None
     
     @property
     def shape(self) -> tuple[int, int, int]:
@@ -43,7 +92,7 @@ class CameraFrame:
         return self.resolution[1]
 
 
-@dataclass
+@dataclass(slots=True)
 class CameraInfo:
     """Camera metadata and capabilities."""
     camera_id: str
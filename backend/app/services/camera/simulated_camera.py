@@ -12,7 +12,9 @@ FEATURES:
 """
 import cv2
 import asyncio
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import AsyncGenerator
 import numpy as np
@@ -26,6 +28,11 @@ from app.services.camera.base import (
 
 logger = logging.getLogger(__name__)
 
+# Frames handed out per camera before a slot (CameraFrame + pixel buffer)
+# is reused. Power of two → index with a mask. 8 frames @ 30 FPS ≈ 260 ms.
+_RING_SIZE = 8
+_RING_MASK = _RING_SIZE - 1
+
 
 class SimulatedCameraService(CameraServiceInterface):
     """
@@ -48,6 +55,11 @@ class SimulatedCameraService(CameraServiceInterface):
         # Process every 5th frame
         result = await yolo_service.detect(frame.frame)
     ```
+    
+    FRAME LIFETIME: CameraFrame objects and their pixel buffers come from
+    a ring of ``_RING_SIZE`` slots and are overwritten in place — a frame
+    is valid until ``_RING_SIZE`` more frames have been produced. Copy it
+    (``frame.frame.copy()``) if it must live longer.
     """
     
     def __init__(
@@ -71,9 +83,30 @@ class SimulatedCameraService(CameraServiceInterface):
         self._test_images: list[np.ndarray] = []
         self._current_image_index = 0
         self._cap = None  # <--- Videoni ushlab turish uchun
+        # Decode/generation runs off the event loop. One worker: frames stay
+        # in order and VideoCapture is only ever touched by one thread.
+        self._executor: ThreadPoolExecutor | None = None
+        
+        # Frame timestamps: wall clock read once, then monotonic deltas
+        self._t0_wall = datetime.now(timezone.utc)
+        self._t0_mono = time.monotonic_ns()
+        
+        # Random mode: one RNG; frames are drawn into the ring's buffers
+        self._rng = np.random.default_rng()
+        
+        # Ring of reusable frames: CameraFrame objects (created on first
+        # use), target-size buffers (random mode) and native-size decode
+        # buffers (video mode, shaped by the first decoded frame)
+        self._ring: list[CameraFrame | None] = [None] * _RING_SIZE
+        self._ring_bufs = [
+            np.empty((resolution[1], resolution[0], 3), dtype=np.uint8)
+            for _ in range(_RING_SIZE)
+        ]
+        self._video_bufs: list[np.ndarray | None] = [None] * _RING_SIZE
+        self._ring_idx = 0
     
     async def initialize(self) -> None:
-        logger.info(f"Initializing simulated camera: {self._camera_id}")
+        logger.info("Initializing simulated camera: %s", self._camera_id)
         
         if self._mode == "images" and self._test_images_dir:
             await self._load_test_images()
@@ -82,26 +115,40 @@ class SimulatedCameraService(CameraServiceInterface):
         if self._mode == "video" and self._video_path:
             self._cap = cv2.VideoCapture(self._video_path)
             if not self._cap.isOpened():
-                logger.error(f"Video faylni ochib bo'lmadi: {self._video_path}")
+                logger.error("Video faylni ochib bo'lmadi: %s", self._video_path)
                 self._mode = "random"
         # -------------------------------
 
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix=f"camera-{self._camera_id}",
+            )
+        
         self._is_active = True
         self._frame_count = 0
+        self._t0_wall = datetime.now(timezone.utc)
+        self._t0_mono = time.monotonic_ns()
+    
+    def _timestamp(self) -> datetime:
+        """
+        Aware UTC capture time from the monotonic clock.
+        
+        One integer clock read per frame instead of a wall-clock datetime
+        build; timestamps also stay ordered if the system clock is stepped.
+        """
+        elapsed_us = (time.monotonic_ns() - self._t0_mono) // 1000
+        return self._t0_wall + timedelta(microseconds=elapsed_us)
     
     async def _load_test_images(self) -> None:
         """Load test images from directory."""
         if not self._test_images_dir or not self._test_images_dir.exists():
-            logger.warning(
-                f"Test images directory not found: {self._test_images_dir}"
-            )
+            logger.warning("Test images directory not found: %s", self._test_images_dir)
             logger.info("Falling back to random frame generation")
             self._mode = "random"
             return
         
         try:
-            import cv2
-            
             image_extensions = ('.jpg', '.jpeg', '.png', '.bmp')
             image_files = [
                 f for f in self._test_images_dir.iterdir()
@@ -120,90 +167,120 @@ class SimulatedCameraService(CameraServiceInterface):
                     img = cv2.resize(img, self._resolution)
                     self._test_images.append(img)
             
-            logger.info(f"Loaded {len(self._test_images)} test images")
+            logger.info("Loaded %s test images", len(self._test_images))
             
         except Exception as e:
-            logger.error(f"Failed to load test images: {e}")
+            logger.error("Failed to load test images: %s", e)
             logger.info("Falling back to random frame generation")
             self._mode = "random"
     
-    def _generate_random_frame(self) -> np.ndarray:
+    def _generate_random_frame(self, frame: np.ndarray) -> np.ndarray:
         """
         Generate synthetic random frame.
         
         Creates a frame with random noise and some geometric shapes
         to simulate objects.
         
+        Args:
+            frame: Preallocated (H, W, 3) uint8 buffer, written in place
+        
         Returns:
-            Numpy array (BGR format)
+            ``frame`` (BGR format)
         """
-        # Create base frame with random noise
-        frame = np.random.randint(
-            50, 150,
-            size=(self._resolution[1], self._resolution[0], 3),
-            dtype=np.uint8
-        )
+        rng = self._rng
+        
+        # Base frame with random noise (in place, no per-frame allocation)
+        rng.integers(50, 150, size=frame.shape, dtype=np.uint8, out=frame)
         
         # Add some "objects" (rectangles) to simulate animals
-        import cv2
+        num_objects = int(rng.integers(0, 3))
+        if num_objects == 0:
+            return frame
         
-        num_objects = np.random.randint(0, 3)
+        # All random draws for this frame in one call per kind
+        width, height = self._resolution
+        origins = rng.integers(0, (width - 100, height - 100), size=(num_objects, 2))
+        sizes = rng.integers((80, 100), (200, 250), size=(num_objects, 2))
+        colors = rng.integers((80, 60, 40), (120, 100, 80), size=(num_objects, 3))
         
-        for _ in range(num_objects):
-            # Random rectangle (simulated animal)
-            x1 = np.random.randint(0, self._resolution[0] - 100)
-            y1 = np.random.randint(0, self._resolution[1] - 100)
-            x2 = x1 + np.random.randint(80, 200)
-            y2 = y1 + np.random.randint(100, 250)
-            
-            # Draw filled rectangle
-            color = (
-                np.random.randint(80, 120),
-                np.random.randint(60, 100),
-                np.random.randint(40, 80),
-            )
-            cv2.rectangle(frame, (x1, y1), (x2, y2), color, -1)
+        rectangle = cv2.rectangle  # bound once, not per object
+        for (x1, y1), (w, h), color in zip(
+            origins.tolist(), sizes.tolist(), colors.tolist()
+        ):
+            # Draw filled rectangle (simulated animal)
+            rectangle(frame, (x1, y1), (x1 + w, y1 + h), tuple(color), -1)
         
         return frame
     
-    def _get_next_frame_data(self) -> np.ndarray:
+    def _grab_video_frame(self) -> None:
+        """Advance the video one frame without decoding it (loops at EOF)."""
+        if not self._cap.grab():
+            self._cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            self._cap.grab()
+    
+    def _skip_frame(self) -> None:
+        """Advance the source one frame without materializing it."""
         if self._mode == "video" and self._cap:
-            ret, frame = self._cap.read()
+            self._grab_video_frame()
+        elif self._mode == "images" and self._test_images:
+            self._current_image_index = (self._current_image_index + 1) % len(self._test_images)
+        # random mode: nothing to advance
+        self._frame_count += 1
+    
+    def _get_next_frame_data(self, slot: int) -> np.ndarray:
+        if self._mode == "video" and self._cap:
+            # Decode into the slot's buffer (OpenCV reuses it when the
+            # shape matches, i.e. from the second lap of the ring on)
+            ret, frame = self._cap.read(self._video_bufs[slot])
             if not ret:  # Video tugasa, boshidan boshlaymiz (Loop)
                 self._cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-                ret, frame = self._cap.read()
+                ret, frame = self._cap.read(self._video_bufs[slot])
             
             if ret:
-                return cv2.resize(frame, self._resolution)
+                self._video_bufs[slot] = frame
+                # Native size — CameraFrame.frame resizes lazily
+                return frame
         
         if self._mode == "images" and self._test_images:
             frame = self._test_images[self._current_image_index]
             self._current_image_index = (self._current_image_index + 1) % len(self._test_images)
             return frame
         
-        return self._generate_random_frame()
+        return self._generate_random_frame(self._ring_bufs[slot])
     
     async def get_frame(self) -> CameraFrame:
         """
         Get single frame.
         
         Returns:
-            CameraFrame object
+            CameraFrame object (ring slot — see FRAME LIFETIME)
         """
         if not self._is_active:
             raise RuntimeError("Camera not initialized. Call initialize() first.")
         
-        frame_data = self._get_next_frame_data()
+        slot = self._ring_idx & _RING_MASK
+        self._ring_idx += 1
+        
+        # cv2 read / noise generation hold the loop for milliseconds — run
+        # them in the camera's worker thread (OpenCV and numpy release the GIL)
+        frame_data = await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._get_next_frame_data, slot
+        )
         
         self._frame_count += 1
         
-        return CameraFrame(
-            frame=frame_data,
-            timestamp=datetime.utcnow(),
-            camera_id=self._camera_id,
-            frame_number=self._frame_count,
-            resolution=self._resolution,
-        )
+        frame = self._ring[slot]
+        if frame is None:
+            frame = self._ring[slot] = CameraFrame(
+                raw_frame=frame_data,
+                timestamp=self._timestamp(),
+                camera_id=self._camera_id,
+                frame_number=self._frame_count,
+                resolution=self._resolution,
+            )
+        else:
+            frame.refill(frame_data, self._timestamp(), self._frame_count)
+        return frame
     
     async def stream_frames(
         self,
@@ -221,35 +298,51 @@ class SimulatedCameraService(CameraServiceInterface):
         if not self._is_active:
             raise RuntimeError("Camera not initialized. Call initialize() first.")
         
-        logger.info(
-            f"Starting frame stream (fps: {self._fps}, skip: {skip_frames})"
-        )
+        logger.info("Starting frame stream (fps: %s, skip: %s)", self._fps, skip_frames)
         
         frame_delay = 1.0 / self._fps  # Seconds between frames
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
         
         try:
             while self._is_active:
-                # Get frame
-                frame = await self.get_frame()
+                if (self._frame_count + 1) % skip_frames != 0:
+                    # Dropped tick: advance the source without decoding,
+                    # generating or resizing anything (grab() still reads
+                    # the file, so video goes through the worker thread)
+                    if self._mode == "video":
+                        await loop.run_in_executor(self._executor, self._skip_frame)
+                    else:
+                        self._skip_frame()
+                else:
+                    # Kept tick (every Nth frame): materialize and yield
+                    yield await self.get_frame()
                 
-                # Yield only every Nth frame
-                if self._frame_count % skip_frames == 0:
-                    yield frame
-                
-                # Simulate frame rate
-                await asyncio.sleep(frame_delay)
+                # Simulate frame rate: sleep until the next absolute tick,
+                # so production/consumer time does not add to the period
+                next_tick += frame_delay
+                delay = next_tick - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                else:
+                    # Fell behind (slow consumer) — resync instead of bursting
+                    next_tick = loop.time()
                 
         except asyncio.CancelledError:
             logger.info("Frame stream cancelled")
         except Exception as e:
-            logger.error(f"Frame stream error: {e}", exc_info=True)
+            logger.error("Frame stream error: %s", e, exc_info=True)
             raise
     
     async def stop(self) -> None:
         """Stop camera and cleanup."""
-        logger.info(f"Stopping simulated camera: {self._camera_id}")
+        logger.info("Stopping simulated camera: %s", self._camera_id)
         self._is_active = False
         self._frame_count = 0
+        
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
     
     def get_info(self) -> CameraInfo:
         """Get camera metadata."""
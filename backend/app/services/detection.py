@@ -0,0 +1,61 @@
+"""
+Detection log service.
+
+Read-side business logic for stored YOLO detection events.
+
+RESPONSIBILITY: Business logic, validation, rule enforcement.
+NO direct database access - use Repository.
+"""
+
+from datetime import datetime
+from typing import AsyncIterator, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+import logging
+
+from app.repositories.detection import DetectionRepository
+from app.schemas.detection import DetectionRecordResponse
+
+logger = logging.getLogger(__name__)
+
+
+class DetectionService:
+    """
+    Service layer for the detection event log.
+    
+    Args:
+        db: AsyncSession instance (injected)
+    """
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.repository = DetectionRepository(db)
+    
+    async def export_detections(
+        self,
+        camera_id: Optional[str] = None,
+        min_confidence: float = 0.0,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> AsyncIterator[DetectionRecordResponse]:
+        """
+        Stream stored detections matching the filters (no pagination cap).
+        
+        Backed by a server-side cursor, so memory use is constant
+        regardless of how many detections match.
+        
+        Args:
+            camera_id: Filter by camera (optional)
+            min_confidence: Minimum confidence (optional)
+            start: Only detections at or after this time (optional)
+            end: Only detections at or before this time (optional)
+            
+        Yields:
+            Detection records, newest first
+        """
+        async for detection in self.repository.iter_recent(
+            camera_id=camera_id,
+            min_confidence=min_confidence,
+            start=start,
+            end=end,
+        ):
+            yield DetectionRecordResponse.from_orm_trusted(detection)
@@ -25,7 +25,10 @@ await pipeline.start()  # Runs continuously
 """
 
 import asyncio
-from datetime import datetime
+import math
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 import logging
 
@@ -34,15 +37,38 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.services.camera.base import CameraServiceInterface
 from app.services.ai.yolo_service import YoloService
 from app.services.weight_measurement import WeightMeasurementService
+from app.repositories.weight_measurement_writer import get_weight_writer
 from app.services.weight_estimator import WeightEstimator, get_weight_estimator
 from app.services.ai.base import Detection
 from app.schemas.weight_measurement import WeightMeasurementCreate
 from app.api.v1.websocket import ConnectionManager
 from app.config import settings
+from app.core.cache import TTLCache
 from app.core.database import AsyncSessionLocal
+from app.models.animal import AnimalSpecies
 
 logger = logging.getLogger(__name__)
 
+# YOLO class name → species of the auto-created default animal
+_SPECIES_BY_CLASS = {
+    'cow': AnimalSpecies.CATTLE,
+    'cattle': AnimalSpecies.CATTLE,
+    'sheep': AnimalSpecies.SHEEP,
+    'goat': AnimalSpecies.GOAT,
+}
+
+
+@dataclass(slots=True)
+class PipelineStats:
+    """Pipeline counters (bumped per frame; slots → plain attribute stores)."""
+    total_frames: int = 0
+    processed_frames: int = 0
+    detections: int = 0
+    measurements_created: int = 0
+    errors: int = 0
+    # Frames that had to wait for a free in-flight slot (pipeline saturated)
+    throttled_frames: int = 0
+
 
 class DetectionPipeline:
     """
@@ -90,15 +116,23 @@ class DetectionPipeline:
         self._running = False
         self._task: Optional[asyncio.Task] = None
         
+        # class_name → resolved animal id. Every detection resolves the same
+        # animal; a short TTL spares the per-detection SELECT while a
+        # deleted/replaced animal is picked up within seconds.
+        self._animal_ids = TTLCache(ttl=5.0, max_size=64)
+        # Concurrent frames missing the cache resolve it once, not N times
+        self._animal_ids_lock = asyncio.Lock()
+        
         # Performance tracking
-        self._stats = {
-            'total_frames': 0,
-            'processed_frames': 0,
-            'detections': 0,
-            'measurements_created': 0,
-            'errors': 0,
-            'start_time': None,
-        }
+        self._stats = PipelineStats()
+        # Runtime comes from the monotonic clock (immune to wall-clock
+        # jumps); the wall-clock start is kept only for reporting
+        self._start_ns: int = 0
+        self._start_wall: Optional[datetime] = None
+        
+        # Per-frame logging is DEBUG; INFO gets one summary line per second
+        self._last_info_log_ns: int = 0
+        self._last_info_stats: tuple[int, int, int] = (0, 0, 0)
     
     async def start(self) -> None:
         """
@@ -118,7 +152,10 @@ class DetectionPipeline:
         await self.camera.initialize()
         
         self._running = True
-        self._stats['start_time'] = datetime.utcnow()
+        self._start_ns = time.monotonic_ns()
+        self._last_info_log_ns = self._start_ns
+        self._last_info_stats = (0, 0, 0)
+        self._start_wall = datetime.now(timezone.utc)
         
         # Create background task
         self._task = asyncio.create_task(self._run_pipeline())
@@ -157,10 +194,21 @@ class DetectionPipeline:
         Main pipeline loop.
         
         Processes frames continuously with error handling.
+        
+        Up to PIPELINE_MAX_INFLIGHT frames are processed concurrently, so
+        their detect() calls reach YoloService together and run as one
+        batched predict().
+        
+        FRAME LIFETIME: cameras hand out frames from a ring of slots that
+        are overwritten in place (SimulatedCamera: 8). Every pulled frame
+        takes a slot, so the loop must not pull (and drop) frames while
+        the pipeline is saturated — it waits for a free slot first. The camera
+        is pull-based, so the next frame pulled is still a fresh one.
+        PIPELINE_MAX_INFLIGHT must stay below the ring size.
         """
-        logger.info(
-            f"Pipeline loop started (skip_frames: {settings.FRAME_SKIP})"
-        )
+        logger.info("Pipeline loop started (skip_frames: %s)", settings.FRAME_SKIP)
+        
+        inflight: set[asyncio.Task] = set()
         
         try:
             async for frame in self.camera.stream_frames(
@@ -169,42 +217,91 @@ class DetectionPipeline:
                 if not self._running:
                     break
                 
-                self._stats['total_frames'] += 1
+                self._stats.total_frames += 1
                 
                 # Process frame (non-blocking, isolated errors)
-                try:
-                    await self._process_frame(frame)
-                    self._stats['processed_frames'] += 1
-                    
-                except Exception as e:
-                    self._stats['errors'] += 1
-                    logger.error(
-                        f"Frame processing failed: {e}",
-                        exc_info=True
+                task = asyncio.create_task(self._process_frame_safe(frame))
+                inflight.add(task)
+                task.add_done_callback(inflight.discard)
+                
+                # Saturated: wait for a free slot BEFORE pulling the next
+                # frame (an in-flight frame's ring slot must not be reused)
+                if len(inflight) >= settings.PIPELINE_MAX_INFLIGHT:
+                    self._stats.throttled_frames += 1
+                    await asyncio.wait(
+                        inflight, return_when=asyncio.FIRST_COMPLETED
                     )
-                    # Continue with next frame (resilience)
-                    continue
+            
+            # Let frames already in flight finish
+            if inflight:
+                await asyncio.gather(*inflight)
         
         except asyncio.CancelledError:
             logger.info("Pipeline loop cancelled")
+            for task in inflight:
+                task.cancel()
         
         except Exception as e:
-            logger.error(f"Pipeline loop error: {e}", exc_info=True)
+            logger.error("Pipeline loop error: %s", e, exc_info=True)
             self._running = False
     
+    async def _process_frame_safe(self, frame) -> None:
+        """Process one frame; errors are counted and logged, never raised."""
+        try:
+            await self._process_frame(frame)
+            self._stats.processed_frames += 1
+            
+        except Exception as e:
+            self._stats.errors += 1
+            logger.error("Frame processing failed: %s", e, exc_info=True)
+            # Continue with next frame (resilience)
+        
+        self._maybe_log_progress()
+    
+    def _maybe_log_progress(self) -> None:
+        """Emit at most one INFO progress line per second."""
+        now_ns = time.monotonic_ns()
+        elapsed_ns = now_ns - self._last_info_log_ns
+        if elapsed_ns < 1_000_000_000:
+            return
+        
+        current = (
+            self._stats.processed_frames,
+            self._stats.detections,
+            self._stats.measurements_created,
+        )
+        frames, detections, measurements = (
+            c - p for c, p in zip(current, self._last_info_stats)
+        )
+        self._last_info_log_ns = now_ns
+        self._last_info_stats = current
+        
+        if frames and logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Processed %s frame(s), %s detection(s), %s measurement(s) in %.1fs",
+                frames,
+                detections,
+                measurements,
+                elapsed_ns / 1e9,
+            )
+    
     async def _process_frame(self, frame) -> None:
         """
         Process single frame through complete pipeline.
         
         Steps:
         1. YOLO detection
-        2. Weight estimation (for each detection)
+        2. Weight estimation (one vectorized pass per frame)
         3. Database save (idempotent)
         4. WebSocket broadcast
         
         Args:
             frame: CameraFrame object
         """
+        # Ring-buffer frame: read what outlives the first await up front
+        camera_id = frame.camera_id
+        captured_at = frame.timestamp
+        
         # Step 1: YOLO Detection
         result = await self.yolo.detect(
             frame=frame.frame,
@@ -216,123 +313,133 @@ class DetectionPipeline:
             logger.debug("No detections in frame")
             return
         
-        self._stats['detections'] += len(result.detections)
+        self._stats.detections += len(result.detections)
+        
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(
+                "Detected %s animal(s) in %.1fms",
+                len(result.detections),
+                result.inference_time_ms,
+            )
         
-        logger.info(
-            f"Detected {len(result.detections)} animal(s) "
-            f"in {result.inference_time_ms:.1f}ms"
+        # Step 2: Weight estimation — all detections of the frame at once
+        weights, confidences = self.weight_estimator.estimate_batch(
+            result.detections,
+            frame_shape=result.frame_shape,
+            use_conservative=True,
         )
         
-        # Step 2-4: Process each detection
-        tasks = [
-            self._process_detection(detection, frame, result.frame_shape)
-            for detection in result.detections
+        # Step 3-4: Save every estimated detection of the frame together
+        estimated = [
+            (detection, weight_kg, confidence)
+            for detection, weight_kg, confidence in zip(
+                result.detections, weights.tolist(), confidences.tolist()
+            )
+            if not math.isnan(weight_kg)
         ]
+        if debug:
+            if len(estimated) < len(result.detections):
+                logger.debug(
+                    "Skipped %s detection(s) without weight calibration",
+                    len(result.detections) - len(estimated),
+                )
+            for detection, weight_kg, confidence in estimated:
+                logger.debug(
+                    "Weight estimated: %.1fkg (confidence: %.2f) for %s",
+                    weight_kg,
+                    confidence,
+                    detection.class_name,
+                )
         
-        # Run in parallel (non-blocking)
-        await asyncio.gather(*tasks, return_exceptions=True)
-    
-    async def _process_detection(
-        self,
-        detection: Detection,
-        frame,
-        frame_shape: tuple,
-    ) -> None:
-        """
-        Process single detection.
-        
-        Args:
-            detection: YOLO detection object
-            frame: CameraFrame
-            frame_shape: (height, width, channels)
-        """
         try:
-            # Step 2: Weight estimation
-            weight_kg, confidence = self.weight_estimator.estimate(
-                detection=detection,
-                frame_shape=frame_shape,
-                use_conservative=True,
+            await self._save_measurements(
+                estimated, camera_id=camera_id, captured_at=captured_at
             )
-            
-            logger.info(
-                f"Weight estimated: {weight_kg:.1f}kg "
-                f"(confidence: {confidence:.2f}) "
-                f"for {detection.class_name}"
-            )
-            
-            # Step 3: Save to database (idempotent)
-            await self._save_measurement(
-                detection=detection,
-                weight_kg=weight_kg,
-                confidence=confidence,
-                camera_id=frame.camera_id,
-            )
-            
         except Exception as e:
-            logger.error(
-                f"Detection processing failed: {e}",
-                exc_info=True
-            )
+            logger.error("Detection processing failed: %s", e, exc_info=True)
     
-    async def _save_measurement(
+    async def _save_measurements(
         self,
-        detection: Detection,
-        weight_kg: float,
-        confidence: float,
+        estimated: list[tuple[Detection, float, float]],
         camera_id: str,
+        captured_at: datetime,
     ) -> None:
         """
-        Save weight measurement to database.
+        Save the weight measurements of one frame.
+        
+        One session per frame (not per detection): animals are resolved
+        once per class, existence is checked in one query, and all rows
+        go to the buffered writer together — they share one batched
+        INSERT, then get broadcast.
         
         IDEMPOTENT: Safe to retry (upsert logic in future).
         
         Args:
-            detection: YOLO detection
-            weight_kg: Estimated weight
-            confidence: Estimation confidence
+            estimated: (detection, weight_kg, confidence) per detection
             camera_id: Camera identifier
+            captured_at: Frame capture time, shared by all its measurements
         """
+        if not estimated:
+            return
+        
         # Get database session
         async with AsyncSessionLocal() as db:
             try:
                 # Create service
-                service = WeightMeasurementService(db, self.ws_manager)
+                try:
+                    writer = get_weight_writer()
+                except RuntimeError:
+                    writer = None
+                service = WeightMeasurementService(db, self.ws_manager, writer)
                 
                 # CRITICAL: Find or create animal
                 # In MVP, we assume animal_id=1 exists
                 # TODO: Implement animal matching/tracking
-                animal_id = await self._get_or_create_animal(
-                    db,
-                    detection.class_name
-                )
+                animal_ids: dict[str, int] = {}
+                for detection, _, _ in estimated:
+                    if detection.class_name not in animal_ids:
+                        animal_ids[detection.class_name] = (
+                            await self._get_or_create_animal(
+                                db, detection.class_name
+                            )
+                        )
                 
-                # Create measurement
-                measurement_data = WeightMeasurementCreate(
-                    animal_id=animal_id,
-                    timestamp=detection.timestamp,
-                    estimated_weight_kg=weight_kg,
-                    confidence_score=confidence,
-                    camera_id=camera_id,
-                    raw_ai_data={
-                        'yolo_confidence': detection.confidence,
-                        'bounding_box': detection.bounding_box.to_dict(),
-                        'class_id': detection.class_id,
-                        'class_name': detection.class_name,
-                    },
-                )
+                # Create measurements
+                measurements = [
+                    WeightMeasurementCreate(
+                        animal_id=animal_ids[detection.class_name],
+                        timestamp=captured_at,
+                        estimated_weight_kg=weight_kg,
+                        confidence_score=confidence,
+                        camera_id=camera_id,
+                        raw_ai_data={
+                            'yolo_confidence': detection.confidence,
+                            'bounding_box': detection.bounding_box.to_dict(),
+                            'class_id': detection.class_id,
+                            'class_name': detection.class_name,
+                        },
+                    )
+                    for detection, weight_kg, confidence in estimated
+                ]
                 
                 # Save (triggers WebSocket broadcast)
-                await service.create_measurement(measurement_data)
+                await service.create_measurements(measurements)
                 
-                self._stats['measurements_created'] += 1
+                self._stats.measurements_created += len(measurements)
                 
-                logger.info(
-                    f"✓ Measurement saved and broadcasted "
-                    f"(animal_id: {animal_id})"
-                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "✓ %s measurement(s) saved and broadcasted (animal_ids: %s)",
+                        len(measurements),
+                        sorted(set(animal_ids.values())),
+                    )
                 
             except Exception as e:
-                logger.error(f"Database save failed: {e}", exc_info=True)
+                # A cached animal may be gone (e.g. FK violation) — re-resolve
+                for class_name in {d.class_name for d, _, _ in estimated}:
+                    self._animal_ids.pop(class_name)
+                logger.error("Database save failed: %s", e, exc_info=True)
                 raise
     
     async def _get_or_create_animal(
@@ -346,6 +453,8 @@ class DetectionPipeline:
         MVP: Returns first animal or creates default.
         PRODUCTION: Implement animal tracking/matching.
         
+        Served from a 5 s per-class cache; misses go to _resolve_animal.
+        
         Args:
             db: Database session
             class_name: Detected class name
@@ -353,9 +462,28 @@ class DetectionPipeline:
         Returns:
             Animal ID
         """
+        cached = self._animal_ids.get(class_name)
+        if cached is not TTLCache.MISS:
+            return cached
+        
+        async with self._animal_ids_lock:
+            # Another frame may have resolved it while we waited
+            cached = self._animal_ids.get(class_name)
+            if cached is not TTLCache.MISS:
+                return cached
+            
+            animal_id = await self._resolve_animal(db, class_name)
+            self._animal_ids.put(class_name, animal_id)
+            return animal_id
+    
+    async def _resolve_animal(
+        self,
+        db: AsyncSession,
+        class_name: str,
+    ) -> int:
+        """Look up (or create) the animal for a class — uncached."""
         from app.repositories.animal import AnimalRepository
         from app.schemas.animal import AnimalCreate
-        from app.models.animal import AnimalSpecies
         
         repo = AnimalRepository(db)
         
@@ -369,14 +497,7 @@ class DetectionPipeline:
         logger.warning("No animals in database, creating default animal")
         
         # Map class name to species
-        species_map = {
-            'cow': AnimalSpecies.CATTLE,
-            'cattle': AnimalSpecies.CATTLE,
-            'sheep': AnimalSpecies.SHEEP,
-            'goat': AnimalSpecies.GOAT,
-        }
-        
-        species = species_map.get(
+        species = _SPECIES_BY_CLASS.get(
             class_name.lower(),
             AnimalSpecies.CATTLE
         )
@@ -385,46 +506,54 @@ class DetectionPipeline:
             tag_id=f"AUTO-{class_name.upper()}-001",
             species=species,
             gender="unknown",
-            acquisition_date=datetime.utcnow(),
         )
         
         animal = await repo.create(animal_data)
+        if animal is None:
+            # Created concurrently by another frame — use that one
+            animal = await repo.get_by_tag_id(animal_data.tag_id)
+            return animal.id
         await db.commit()
         
-        logger.info(f"Created default animal: {animal.tag_id}")
+        logger.info("Created default animal: %s", animal.tag_id)
         
         return animal.id
     
+    def _runtime_seconds(self) -> float:
+        """Seconds since start() on the monotonic clock."""
+        return (time.monotonic_ns() - self._start_ns) / 1e9
+    
     def _log_stats(self) -> None:
         """Log pipeline statistics."""
-        if self._stats['start_time']:
-            runtime = datetime.utcnow() - self._stats['start_time']
-            runtime_seconds = runtime.total_seconds()
+        if self._start_wall is not None:
+            runtime_seconds = self._runtime_seconds()
+            runtime = timedelta(seconds=runtime_seconds)
             
             fps = (
-                self._stats['processed_frames'] / runtime_seconds
+                self._stats.processed_frames / runtime_seconds
                 if runtime_seconds > 0 else 0
             )
             
             logger.info("=" * 60)
             logger.info("PIPELINE STATISTICS")
             logger.info("=" * 60)
-            logger.info(f"Runtime: {runtime}")
-            logger.info(f"Total frames: {self._stats['total_frames']}")
-            logger.info(f"Processed frames: {self._stats['processed_frames']}")
-            logger.info(f"Processing FPS: {fps:.2f}")
-            logger.info(f"Total detections: {self._stats['detections']}")
-            logger.info(f"Measurements created: {self._stats['measurements_created']}")
-            logger.info(f"Errors: {self._stats['errors']}")
+            logger.info("Runtime: %s", runtime)
+            logger.info("Total frames: %s", self._stats.total_frames)
+            logger.info("Processed frames: %s", self._stats.processed_frames)
+            logger.info("Processing FPS: %.2f", fps)
+            logger.info("Total detections: %s", self._stats.detections)
+            logger.info("Measurements created: %s", self._stats.measurements_created)
+            logger.info("Errors: %s", self._stats.errors)
+            logger.info("Throttled frames: %s", self._stats.throttled_frames)
             logger.info("=" * 60)
     
     def get_stats(self) -> dict:
         """Get pipeline statistics."""
-        stats = self._stats.copy()
+        stats = asdict(self._stats)
+        stats['start_time'] = self._start_wall
         
-        if stats['start_time']:
-            runtime = datetime.utcnow() - stats['start_time']
-            stats['runtime_seconds'] = runtime.total_seconds()
+        if self._start_wall is not None:
+            stats['runtime_seconds'] = self._runtime_seconds()
             stats['fps'] = (
                 stats['processed_frames'] / stats['runtime_seconds']
                 if stats['runtime_seconds'] > 0 else 0
@@ -29,11 +29,12 @@ In production, replace with trained ML model using:
 - Breed-specific models
 """
 
-from datetime import datetime
-from typing import Optional
+from typing import Sequence
 import logging
 
-from app.services.ai.base import Detection, BoundingBox
+import numpy as np
+
+from app.services.ai.base import Detection
 
 logger = logging.getLogger(__name__)
 
@@ -97,6 +98,8 @@ class WeightEstimator:
         """
         Estimate weight from detection.
         
+        Single-detection form of estimate_batch() (same formula).
+        
         Args:
             detection: YOLO detection object
             frame_shape: (height, width, channels)
@@ -109,145 +112,157 @@ class WeightEstimator:
             ValueError: If species not supported
         """
         class_id = detection.class_id
-        
-        # Check if species is supported
-        if class_id not in self.SPECIES_CALIBRATION:
+        if not (0 <= class_id <= _MAX_CLASS_ID and _SUPPORTED[class_id]):
             raise ValueError(
-                f"Weight estimation not supported for class_id {class_id} "
-                f"({detection.class_name})"
+                f"Weight estimation not supported for class_id "
+                f"{class_id} ({detection.class_name})"
             )
         
-        calibration = self.SPECIES_CALIBRATION[class_id]
-        bbox = detection.bounding_box
-        
-        # Calculate bounding box area (normalized)
-        box_area = bbox.width * bbox.height
-        
-        # Estimate weight using calibrated formula
-        weight_kg = self._calculate_weight(
-            box_area=box_area,
-            calibration=calibration,
-            confidence=detection.confidence,
-        )
-        
-        # Apply conservative factor if enabled
-        # (Reduces overestimation bias in 2D vision)
-        if use_conservative:
-            weight_kg *= 0.92  # 8% reduction
-        
-        # Clamp to realistic range
-        weight_kg = max(
-            calibration['min_weight'],
-            min(weight_kg, calibration['max_weight'])
-        )
-        
-        # Calculate estimation confidence
-        # Based on:
-        # 1. YOLO detection confidence
-        # 2. Box size (closer to typical = higher confidence)
-        # 3. Aspect ratio (unrealistic shapes = lower confidence)
-        estimation_confidence = self._calculate_confidence(
-            bbox=bbox,
-            yolo_confidence=detection.confidence,
-            box_area=box_area,
-            typical_area=calibration['typical_box_area'],
+        weights, confidences = self.estimate_batch(
+            [detection], frame_shape, use_conservative
         )
-        
-        self._total_estimates += 1
-        
-        logger.debug(
-            f"Weight estimated: {weight_kg:.1f}kg "
-            f"(confidence: {estimation_confidence:.2f}, "
-            f"box_area: {box_area:.3f})"
-        )
-        
-        return weight_kg, estimation_confidence
+        return float(weights[0]), float(confidences[0])
     
-    def _calculate_weight(
+    def estimate_batch(
         self,
-        box_area: float,
-        calibration: dict,
-        confidence: float,
-    ) -> float:
+        detections: Sequence[Detection],
+        frame_shape: tuple[int, int, int],
+        use_conservative: bool = True,
+    ) -> tuple[np.ndarray, np.ndarray]:
         """
-        Calculate weight using calibrated formula.
+        Estimate weights for all detections of a frame in one vectorized pass.
         
-        FORMULA:
-        weight = base_weight * (box_area / typical_area) * scale_factor
+        Box sizes, confidences and per-species constants become arrays, so
+        the formula runs as a handful of NumPy ufuncs instead of Python
+        float math per box.
         
         Args:
-            box_area: Normalized bounding box area
-            calibration: Species calibration data
-            confidence: YOLO detection confidence
+            detections: YOLO detections (any mix of classes)
+            frame_shape: (height, width, channels)
+            use_conservative: Apply conservative factor (reduces overestimation)
             
         Returns:
-            Estimated weight in kg
+            (weights_kg, confidences) float64 arrays aligned with
+            ``detections``; NaN for classes without calibration
         """
-        # Area ratio (actual vs typical)
-        area_ratio = box_area / calibration['typical_box_area']
+        n = len(detections)
+        widths = np.fromiter(
+            (d.bounding_box.width for d in detections), dtype=np.float64, count=n
+        )
+        heights = np.fromiter(
+            (d.bounding_box.height for d in detections), dtype=np.float64, count=n
+        )
+        yolo_conf = np.fromiter(
+            (d.confidence for d in detections), dtype=np.float64, count=n
+        )
+        class_ids = np.fromiter(
+            (d.class_id for d in detections), dtype=np.intp, count=n
+        )
+        
+        # Per-detection calibration constants, one contiguous column each.
+        # Out-of-range ids read the NaN sentinel slot; NaN propagates to
+        # NaN results for every unsupported class.
+        idx = np.where(
+            (class_ids >= 0) & (class_ids <= _MAX_CLASS_ID),
+            class_ids,
+            _UNSUPPORTED,
+        )
+        # Conservative factor (reduces overestimation bias in 2D vision)
+        # is folded into the base weight column up front
+        base = (_BASE_CONSERVATIVE if use_conservative else _BASE)[idx]
         
-        # Base calculation
-        # Weight scales roughly with area^1.5 (volume approximation)
-        weight = calibration['base_weight'] * (area_ratio ** 1.5)
+        # Area ratio (actual vs typical) — multiply by the precomputed
+        # inverse instead of dividing
+        area_ratio = widths * heights * _INV_TYPICAL[idx]
+        
+        # Weight scales roughly with area^1.5 (volume approximation);
+        # r * sqrt(r) instead of pow(r, 1.5) = exp(1.5 * log(r))
+        # Lower confidence → closer to average weight:
+        #   base * (r^1.5 * cf + (1 - cf)) == base * ((r^1.5 - 1) * cf + 1)
+        # Evaluated in place in one buffer: a frame has only a few boxes,
+        # so per-ufunc dispatch and temporaries are the whole cost
+        confidence_factor = yolo_conf * 0.3
+        confidence_factor += 0.7
+        weight = np.sqrt(area_ratio)
+        weight *= area_ratio
+        weight -= 1.0
+        weight *= confidence_factor
+        weight += 1.0
+        weight *= base
+        
+        # Clamp to realistic range
+        np.clip(weight, _MIN[idx], _MAX[idx], out=weight)
         
-        # Confidence adjustment
-        # Lower confidence → closer to average weight
-        confidence_factor = 0.7 + (0.3 * confidence)
-        weight = (
-            weight * confidence_factor +
-            calibration['base_weight'] * (1 - confidence_factor)
+        confidence = self._calculate_confidence(
+            widths, heights, yolo_conf, area_ratio
         )
         
-        return weight
+        supported = int(np.count_nonzero(~np.isnan(weight)))
+        self._total_estimates += supported
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Weights estimated for %s/%s detections: %s",
+                supported, n, np.round(weight, 1).tolist(),
+            )
+        
+        return weight, confidence
     
+    @staticmethod
     def _calculate_confidence(
-        self,
-        bbox: BoundingBox,
-        yolo_confidence: float,
-        box_area: float,
-        typical_area: float,
-    ) -> float:
+        widths: np.ndarray,
+        heights: np.ndarray,
+        yolo_confidence: np.ndarray,
+        area_ratio: np.ndarray,
+    ) -> np.ndarray:
         """
-        Calculate estimation confidence score.
+        Calculate estimation confidence scores.
         
         Factors:
         1. YOLO confidence (30%)
         2. Area similarity to typical (40%)
         3. Aspect ratio realism (30%)
         
-        Args:
-            bbox: Bounding box
-            yolo_confidence: YOLO detection confidence
-            box_area: Normalized box area
-            typical_area: Expected area for species
-            
         Returns:
-            Confidence score (0.0-1.0)
+            Confidence scores clamped to [0.3, 0.95]
         """
+        # Factors are accumulated in place into two scratch buffers
+        
         # Factor 1: YOLO confidence (30% weight)
-        yolo_factor = yolo_confidence * 0.3
+        score = yolo_confidence * 0.3
         
         # Factor 2: Area similarity (40% weight)
         # Closer to typical area = higher confidence
-        area_diff = abs(box_area - typical_area) / typical_area
-        area_factor = max(0, 1.0 - area_diff) * 0.4
+        # |area - typical| / typical == |area_ratio - 1|
+        # max(0, 1 - |r - 1|) * 0.4
+        tmp = area_ratio - 1.0
+        np.abs(tmp, out=tmp)
+        np.subtract(1.0, tmp, out=tmp)
+        np.maximum(tmp, 0.0, out=tmp)
+        tmp *= 0.4
+        score += tmp
         
         # Factor 3: Aspect ratio realism (30% weight)
-        # Cattle typically: width/height ~ 1.2-1.8
-        # Extreme ratios indicate poor angle or occlusion
-        aspect_ratio = bbox.width / bbox.height if bbox.height > 0 else 0
-        
+        # Cattle typically: width/height ~ 1.2-1.8; extreme ratios indicate
+        # poor angle or occlusion.
+        # max(0, 1 - |aspect - ideal| / ideal) * 0.3
+        # Height floored at 1e-6 instead of a masked divide: a zero-height
+        # box gets a huge (or 0/ε = 0) ratio, and both score 0 here, the
+        # same as the old "ratio 0" rule
         ideal_aspect = 1.4  # Typical cattle side view
-        aspect_diff = abs(aspect_ratio - ideal_aspect) / ideal_aspect
-        aspect_factor = max(0, 1.0 - aspect_diff) * 0.3
+        np.maximum(heights, 1e-6, out=tmp)
+        np.divide(widths, tmp, out=tmp)
+        tmp -= ideal_aspect
+        np.abs(tmp, out=tmp)
+        tmp *= -1.0 / ideal_aspect
+        tmp += 1.0
+        np.maximum(tmp, 0.0, out=tmp)
+        tmp *= 0.3
+        score += tmp
         
-        # Combined confidence
-        total_confidence = yolo_factor + area_factor + aspect_factor
-        
-        # Clamp to [0.3, 0.95]
-        # Never below 0.3 (always some uncertainty in 2D)
-        # Never above 0.95 (no depth data)
-        return max(0.3, min(0.95, total_confidence))
+        # Never below 0.3 (always some uncertainty in 2D),
+        # never above 0.95 (no depth data)
+        return np.clip(score, 0.3, 0.95, out=score)
     
     def get_stats(self) -> dict:
         """Get estimator statistics."""
@@ -275,6 +290,34 @@ class WeightEstimator:
         ]
 
 
+# -----------------------------------------------------------------------------
+# Calibration as columns (struct of arrays) indexed by class_id.
+# SPECIES_CALIBRATION stays the source of truth and the metadata for
+# get_supported_species(); the estimator reads only these arrays.
+# Slot _UNSUPPORTED (one past the last class id) is an all-NaN sentinel.
+# -----------------------------------------------------------------------------
+_MAX_CLASS_ID = max(WeightEstimator.SPECIES_CALIBRATION)
+_UNSUPPORTED = _MAX_CLASS_ID + 1
+
+
+def _calibration_column(key: str) -> np.ndarray:
+    column = np.full(_MAX_CLASS_ID + 2, np.nan, dtype=np.float64)
+    for class_id, calibration in WeightEstimator.SPECIES_CALIBRATION.items():
+        column[class_id] = calibration[key]
+    return column
+
+
+_BASE = _calibration_column('base_weight')
+_MIN = _calibration_column('min_weight')
+_MAX = _calibration_column('max_weight')
+_INV_TYPICAL = 1.0 / _calibration_column('typical_box_area')
+_SUPPORTED = ~np.isnan(_BASE)
+
+# 8% reduction applied when use_conservative=True
+_CONSERVATIVE_FACTOR = 0.92
+_BASE_CONSERVATIVE = _BASE * _CONSERVATIVE_FACTOR
+
+
 # Global singleton instance
 _weight_estimator: WeightEstimator | None = None
 
@@ -5,19 +5,20 @@ Handles business logic for weight measurements and coordinates
 with WebSocket manager for real-time updates.
 """
 
-from typing import Optional, TYPE_CHECKING
-from datetime import datetime, timedelta
+import asyncio
+from typing import Optional, Sequence, TYPE_CHECKING
+from datetime import datetime, timedelta, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 
 from app.repositories.weight_measurement import WeightMeasurementRepository
 from app.repositories.animal import AnimalRepository
+from app.repositories.weight_measurement_writer import WeightMeasurementWriter
 from app.schemas.weight_measurement import (
     WeightMeasurementCreate,
     WeightMeasurementResponse,
     WeightMeasurementListResponse,
     WeightStatsResponse,
-    LiveWeightUpdate,
 )
 from app.core.exceptions import (
     EntityNotFoundError,
@@ -30,6 +31,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Strong refs to in-flight broadcast tasks (the loop only keeps weak ones)
+_BROADCAST_TASKS: set[asyncio.Task] = set()
+
 
 class WeightMeasurementService:
     """
@@ -44,17 +48,21 @@ class WeightMeasurementService:
     Args:
         db: AsyncSession instance
         ws_manager: WebSocket connection manager (optional, for real-time updates)
+        writer: Buffered batch writer (optional; without it every
+            measurement is its own INSERT)
     """
     
     def __init__(
         self,
         db: AsyncSession,
         ws_manager: Optional["ConnectionManager"] = None,
+        writer: Optional[WeightMeasurementWriter] = None,
     ):
         self.db = db
         self.repository = WeightMeasurementRepository(db)
         self.animal_repository = AnimalRepository(db)
         self.ws_manager = ws_manager
+        self.writer = writer
     
     async def create_measurement(
         self,
@@ -78,15 +86,16 @@ class WeightMeasurementService:
             EntityNotFoundError: If animal doesn't exist
             BusinessRuleViolationError: If data quality is too poor
         """
-        # RULE 1: Verify animal exists
-        animal = await self.animal_repository.get_by_id(
-            measurement_data.animal_id
+        # RULE 1: Verify animal exists (cached id → tag_id lookup)
+        tags = await self.animal_repository.get_tag_ids(
+            [measurement_data.animal_id]
         )
+        animal_tag_id = tags.get(measurement_data.animal_id)
         
-        if not animal:
+        if animal_tag_id is None:
             logger.warning(
-                f"Attempted to create measurement for non-existent animal: "
-                f"{measurement_data.animal_id}"
+                "Attempted to create measurement for non-existent animal: %s",
+                measurement_data.animal_id,
             )
             raise EntityNotFoundError(
                 message=f"Animal with ID {measurement_data.animal_id} not found",
@@ -96,26 +105,111 @@ class WeightMeasurementService:
         # RULE 2: Check confidence threshold
         if measurement_data.confidence_score < 0.5:
             logger.warning(
-                f"Low confidence measurement: {measurement_data.confidence_score:.2f} "
-                f"for animal {measurement_data.animal_id}"
+                "Low confidence measurement: %.2f for animal %s",
+                measurement_data.confidence_score,
+                measurement_data.animal_id,
             )
             # We allow it but log warning
             # In production, you might reject measurements below threshold
         
-        # Create measurement
-        measurement = await self.repository.create(measurement_data)
+        # Create measurement (batched with concurrent writes when buffered)
+        if self.writer is not None:
+            measurement = await self.writer.submit(measurement_data)
+        else:
+            measurement = await self.repository.create(measurement_data)
         
         logger.info(
-            f"Measurement created: Animal {animal.tag_id}, "
-            f"Weight {measurement.estimated_weight_kg:.2f}kg, "
-            f"Confidence {measurement.confidence_score:.2f}"
+            "Measurement created: Animal %s, Weight %.2fkg, Confidence %.2f",
+            animal_tag_id,
+            measurement.estimated_weight_kg,
+            measurement.confidence_score,
         )
         
-        # RULE 3: Broadcast to WebSocket clients
-        if self.ws_manager:
-            await self._broadcast_measurement(measurement, animal.tag_id)
+        # RULE 3: Broadcast to WebSocket clients (no task when nobody listens)
+        if self.ws_manager and self.ws_manager.active_connections:
+            self._schedule_broadcast(measurement, animal_tag_id)
         
-        return WeightMeasurementResponse.model_validate(measurement)
+        return WeightMeasurementResponse.from_orm_trusted(measurement)
+    
+    async def create_measurements(
+        self,
+        measurements: Sequence[WeightMeasurementCreate],
+    ) -> list[WeightMeasurementResponse]:
+        """
+        Create several measurements at once (e.g. every detection of a frame).
+        
+        Same rules as create_measurement(), with the animal check done in
+        ONE query for all rows. With a writer, all rows are submitted
+        together and land in the same batched INSERT; broadcasts go out
+        after it commits.
+        
+        Args:
+            measurements: Validated measurement data
+            
+        Returns:
+            Created measurement responses (input order)
+            
+        Raises:
+            EntityNotFoundError: If any referenced animal doesn't exist
+        """
+        if not measurements:
+            return []
+        
+        # RULE 1: Verify animals exist (one cached lookup for the whole batch)
+        tags = await self.animal_repository.get_tag_ids(
+            [m.animal_id for m in measurements]
+        )
+        missing = sorted({m.animal_id for m in measurements} - tags.keys())
+        if missing:
+            logger.warning(
+                "Attempted to create measurements for non-existent animals: %s",
+                missing,
+            )
+            raise EntityNotFoundError(
+                message=f"Animals with IDs {missing} not found",
+                details={"animal_ids": missing},
+            )
+        
+        # RULE 2: Check confidence threshold (warning only)
+        for m in measurements:
+            if m.confidence_score < 0.5:
+                logger.warning(
+                    "Low confidence measurement: %.2f for animal %s",
+                    m.confidence_score,
+                    m.animal_id,
+                )
+        
+        if self.writer is not None:
+            created = await asyncio.gather(
+                *(self.writer.submit(m) for m in measurements)
+            )
+        else:
+            created = [await self.repository.create(m) for m in measurements]
+        
+        logger.debug("Measurements created: %s", len(created))
+        
+        # RULE 3: Broadcast to WebSocket clients (no task when nobody listens)
+        if self.ws_manager and self.ws_manager.active_connections:
+            for measurement in created:
+                self._schedule_broadcast(
+                    measurement, tags[measurement.animal_id]
+                )
+        
+        return [WeightMeasurementResponse.from_orm_trusted(m) for m in created]
+    
+    def _schedule_broadcast(self, measurement, animal_tag_id: str) -> None:
+        """
+        Broadcast in the background — the caller's response does not wait
+        for the fan-out to every connected client.
+        
+        Tasks are started in creation order and the manager's send lock is
+        FIFO, so clients still see measurements in order.
+        """
+        task = asyncio.create_task(
+            self._broadcast_measurement(measurement, animal_tag_id)
+        )
+        _BROADCAST_TASKS.add(task)
+        task.add_done_callback(_BROADCAST_TASKS.discard)
     
     async def _broadcast_measurement(
         self,
@@ -125,29 +219,29 @@ class WeightMeasurementService:
         """
         Broadcast measurement to all connected WebSocket clients.
         
-        Creates lightweight update message optimized for real-time transmission.
+        Payload follows the LiveWeightUpdate contract, built as a plain dict
+        (trusted DB values → no model construction or validation).
         """
         try:
-            update = LiveWeightUpdate(
-                measurement_id=measurement.id,
-                animal_id=measurement.animal_id,
-                animal_tag_id=animal_tag_id,
-                estimated_weight_kg=measurement.estimated_weight_kg,
-                confidence_score=measurement.confidence_score,
-                camera_id=measurement.camera_id,
-                timestamp=measurement.timestamp.isoformat(),
-            )
-            
-            await self.ws_manager.broadcast(update.model_dump())
+            await self.ws_manager.broadcast({
+                "measurement_id": measurement.id,
+                "animal_id": measurement.animal_id,
+                "animal_tag_id": animal_tag_id,
+                "estimated_weight_kg": measurement.estimated_weight_kg,
+                "confidence_score": measurement.confidence_score,
+                "camera_id": measurement.camera_id,
+                "timestamp": measurement.timestamp,
+            })
             
             logger.debug(
-                f"Broadcasted measurement {measurement.id} to "
-                f"{self.ws_manager.active_connections} clients"
+                "Broadcasted measurement %s to %s clients",
+                measurement.id,
+                len(self.ws_manager.active_connections),
             )
             
         except Exception as e:
             # Don't fail the measurement creation if broadcast fails
-            logger.error(f"Failed to broadcast measurement: {e}")
+            logger.error("Failed to broadcast measurement: %s", e)
     
     async def get_measurement(
         self,
@@ -162,7 +256,7 @@ class WeightMeasurementService:
                 details={"measurement_id": measurement_id},
             )
         
-        return WeightMeasurementResponse.model_validate(measurement)
+        return WeightMeasurementResponse.from_orm_trusted(measurement)
     
     async def get_animal_measurements(
         self,
@@ -171,69 +265,85 @@ class WeightMeasurementService:
         limit: int = 100,
         min_confidence: Optional[float] = None,
         days: Optional[int] = None,
+        before: Optional[datetime] = None,
+        before_id: Optional[int] = None,
+        include_total: bool = False,
     ) -> WeightMeasurementListResponse:
         """
         Get measurements for a specific animal.
         
         Args:
             animal_id: Animal primary key
-            skip: Pagination offset
-            limit: Maximum results (capped at 1000)
+            skip: Pagination offset (ignored when `before` is given)
+            limit: Maximum results (1..1000, enforced by the route's Query)
             min_confidence: Filter by minimum confidence
             days: Only get measurements from last N days
+            before: Keyset cursor from previous page's next_cursor
+            before_id: Tiebreaker from previous page's next_cursor_id
+            include_total: Also run the (full-history) COUNT query
             
         Returns:
             Paginated list of measurements
         """
-        # Verify animal exists
-        animal = await self.animal_repository.get_by_id(animal_id)
-        if not animal:
+        # Verify animal exists (cached id → tag_id lookup)
+        if animal_id not in await self.animal_repository.get_tag_ids([animal_id]):
             raise EntityNotFoundError(
                 message=f"Animal with ID {animal_id} not found",
                 details={"animal_id": animal_id},
             )
         
-        # Cap limit to prevent abuse
-        if limit > 1000:
-            limit = 1000
-            logger.warning(f"Limit capped to 1000 (requested: {limit})")
-        
         # Calculate date range
         start_date = None
         end_date = None
         if days:
-            end_date = datetime.utcnow()
+            end_date = datetime.now(timezone.utc)
             start_date = end_date - timedelta(days=days)
         
-        # Get measurements
-        measurements = await self.repository.get_by_animal(
-            animal_id=animal_id,
-            skip=skip,
-            limit=limit,
-            min_confidence=min_confidence,
-            start_date=start_date,
-            end_date=end_date,
-        )
+        # Without a cursor the total rides along as COUNT(*) OVER () in
+        # the page query; with one it would only count the older rows
+        inline_total = include_total and before is None
         
-        # Get total count
-        total = await self.repository.count_by_animal(
-            animal_id=animal_id,
-            min_confidence=min_confidence,
-            start_date=start_date,
-            end_date=end_date,
-        )
-        
-        # Convert to response
-        items = [
-            WeightMeasurementResponse.model_validate(m)
-            for m in measurements
+        # Get measurements (one extra row tells whether a next page exists)
+        rows = [
+            m
+            async for m in self.repository.get_by_animal(
+                animal_id=animal_id,
+                skip=skip,
+                limit=limit + 1,
+                min_confidence=min_confidence,
+                start_date=start_date,
+                end_date=end_date,
+                before=before,
+                before_id=before_id,
+                with_total=inline_total,
+            )
         ]
+        has_more = len(rows) > limit
+        items = [WeightMeasurementResponse.from_orm_trusted(m) for m in rows[:limit]]
+        
+        # Exact count scans the animal's whole filtered history → opt-in
+        total = None
+        if inline_total and rows:
+            total = rows[0].total_count
+        elif inline_total and not skip:
+            total = 0  # Empty first page → nothing matches the filters
+        elif include_total:
+            # Cursor page, or an offset past the end (no row to carry it)
+            total = await self.repository.count_by_animal(
+                animal_id=animal_id,
+                min_confidence=min_confidence,
+                start_date=start_date,
+                end_date=end_date,
+            )
         
         return WeightMeasurementListResponse(
             items=items,
             total=total,
             skip=skip,
             limit=limit,
+            has_more=has_more,
+            next_cursor=items[-1].timestamp if has_more else None,
+            next_cursor_id=items[-1].id if has_more else None,
         )
     
     async def get_animal_weight_stats(
@@ -257,9 +367,8 @@ class WeightMeasurementService:
         Returns:
             Weight statistics including trend
         """
-        # Verify animal exists
-        animal = await self.animal_repository.get_by_id(animal_id)
-        if not animal:
+        # Verify animal exists (cached id → tag_id lookup)
+        if animal_id not in await self.animal_repository.get_tag_ids([animal_id]):
             raise EntityNotFoundError(
                 message=f"Animal with ID {animal_id} not found",
                 details={"animal_id": animal_id},
@@ -272,41 +381,23 @@ class WeightMeasurementService:
             min_confidence=min_confidence,
         )
         
-        # Determine trend
+        # Determine trend: regression slope projected over the period
+        # (robust to single noisy readings); first-vs-last as fallback
+        change = stats["weight_change"]
+        if stats["weight_change_per_day"] is not None:
+            change = stats["weight_change_per_day"] * days
+        
         trend = None
-        if stats["weight_change"] is not None:
-            if stats["weight_change"] > 5:  # More than 5kg increase
+        if change is not None:
+            if change > 5:  # More than 5kg increase
                 trend = "increasing"
-            elif stats["weight_change"] < -5:  # More than 5kg decrease
+            elif change < -5:  # More than 5kg decrease
                 trend = "decreasing"
             else:
                 trend = "stable"
         
-        # Get date range
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
-        
-        # Get first and last measurement dates
-        measurements = await self.repository.get_by_animal(
-            animal_id=animal_id,
-            skip=0,
-            limit=1,
-            min_confidence=min_confidence,
-            start_date=cutoff_date,
-        )
-        
-        last_date = measurements[0].timestamp if measurements else None
-        
-        # Get oldest measurement
-        oldest = await self.repository.get_by_animal(
-            animal_id=animal_id,
-            skip=0,
-            limit=1,
-            min_confidence=min_confidence,
-            start_date=cutoff_date,
-        )
-        first_date = oldest[-1].timestamp if oldest else None
-        
-        # Get latest weight
+        # Current weight: newest measurement overall (cached per animal,
+        # dropped on every write), not limited to the stats window
         latest = await self.repository.get_latest_by_animal(animal_id)
         latest_weight = latest.estimated_weight_kg if latest else None
         
@@ -315,10 +406,12 @@ class WeightMeasurementService:
             total_measurements=stats["total_measurements"],
             average_weight_kg=stats["average_weight"] or 0.0,
             latest_weight_kg=latest_weight,
+            median_weight_kg=stats["median_weight"],
+            weight_change_per_day_kg=stats["weight_change_per_day"],
             weight_trend=trend,
             confidence_average=stats["confidence_average"] or 0.0,
-            first_measurement_date=first_date,
-            last_measurement_date=last_date,
+            first_measurement_date=stats["first_date"],
+            last_measurement_date=stats["last_date"],
         )
     
     async def get_recent_measurements(
@@ -338,12 +431,10 @@ class WeightMeasurementService:
         Returns:
             List of recent measurements
         """
-        measurements = await self.repository.get_recent_global(
-            limit=limit,
-            min_confidence=min_confidence,
-        )
-        
         return [
-            WeightMeasurementResponse.model_validate(m)
-            for m in measurements
+            WeightMeasurementResponse.from_orm_trusted(m)
+            async for m in self.repository.get_recent_global(
+                limit=limit,
+                min_confidence=min_confidence,
+            )
         ]
\ No newline at end of file
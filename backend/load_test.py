@@ -1,34 +1,60 @@
 from locust import HttpUser, task, between
+import itertools
 import random
-from datetime import datetime
+import uuid
+from datetime import datetime, timezone
+
+# Bir bulk so'rovda yaratiladigan hayvonlar soni
+ANIMAL_BATCH = 50
+
+# Tag_id lar: run prefiksi + ketma-ket raqam (random to'qnashuvlarsiz)
+_RUN_PREFIX = uuid.uuid4().hex[:6].upper()
+_tag_numbers = itertools.count(1)
+
 
 class AI_Camera_User(HttpUser):
     # Har bir foydalanuvchi (kamera) so'rov orasida 1-3 sekund kutadi
     wait_time = between(1, 3)
     
+    # Barcha foydalanuvchilar uchun umumiy, oldindan yaratilgan hayvon ID lari
+    animal_pool: list[int] = []
+    
     animal_id = None
     camera_id = None
 
     def on_start(self):
         """
         Har bir virtual foydalanuvchi ishga tushganda 1 marta bajariladi.
-        Biz har bir 'Locust' uchun yangi hayvon yaratib olamiz.
+        Hayvonlar har bir 'Locust' uchun alohida emas, ANIMAL_BATCH tadan
+        bitta bulk so'rov bilan yaratiladi va pooldan olinadi.
         """
         self.camera_id = f"CAM-{random.randint(100, 999)}"
-        unique_tag = f"LOAD-TEST-{random.randint(10000, 99999)}"
         
-        # 1. Hayvon yaratish
-        response = self.client.post("/api/v1/animals/", json={
-            "tag_id": unique_tag,
-            "species": "cattle",
-            "gender": "male",
-            "acquisition_date": datetime.utcnow().isoformat(),
-            "status": "active"
-        })
+        if not AI_Camera_User.animal_pool:
+            self._create_animals()
         
-        if response.status_code == 201:
-            self.animal_id = response.json()["id"]
+        if AI_Camera_User.animal_pool:
+            self.animal_id = AI_Camera_User.animal_pool.pop()
             # print(f"🤖 Kamera {self.camera_id} ishga tushdi (Animal ID: {self.animal_id})")
+
+    def _create_animals(self):
+        """Hayvonlar poolini bitta POST /animals/bulk bilan to'ldirish."""
+        acquisition_date = datetime.now(timezone.utc).isoformat()
+        items = [
+            {
+                "tag_id": f"LOAD-{_RUN_PREFIX}-{next(_tag_numbers):06d}",
+                "species": "cattle",
+                "gender": "male",
+                "acquisition_date": acquisition_date,
+                "status": "active",
+            }
+            for _ in range(ANIMAL_BATCH)
+        ]
+        
+        response = self.client.post("/api/v1/animals/bulk", json={"items": items})
+        
+        if response.status_code == 201:
+            AI_Camera_User.animal_pool.extend(a["id"] for a in response.json())
         else:
             print(f"❌ Hayvon yaratishda xato: {response.text}")
 
@@ -41,7 +67,7 @@ class AI_Camera_User(HttpUser):
             
             payload = {
                 "animal_id": self.animal_id,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
                 "estimated_weight_kg": weight,
                 "confidence_score": confidence,
                 "camera_id": self.camera_id,
@@ -1,12 +1,13 @@
-import requests
-import time
+import asyncio
 import random
-from datetime import datetime
+from datetime import datetime, timezone
+
+import httpx
 
 # Server manzili
 BASE_URL = "http://localhost:8000/api/v1"
 
-def run_simulation():
+async def run_simulation(client: httpx.AsyncClient):
     print("🚀 Simulyatsiya boshlandi...")
 
     # 1. Yangi hayvon yaratish
@@ -14,11 +15,11 @@ def run_simulation():
         "tag_id": f"SIM-COW-{random.randint(1000, 9999)}",
         "species": "cattle",
         "gender": "female",
-        "acquisition_date": datetime.utcnow().isoformat(),
+        "acquisition_date": datetime.now(timezone.utc).isoformat(),
         "status": "active"
     }
     
-    response = requests.post(f"{BASE_URL}/animals/", json=animal_data)
+    response = await client.post(f"{BASE_URL}/animals/", json=animal_data)
     if response.status_code != 201:
         print("❌ Hayvon yaratishda xatolik!")
         return
@@ -38,30 +39,35 @@ def run_simulation():
         
         measurement_data = {
             "animal_id": animal_id,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
             "estimated_weight_kg": round(current_weight, 2),
             "confidence_score": round(random.uniform(0.8, 0.99), 2),
             "camera_id": "CAM-SIM-01",
             "raw_ai_data": {"frame": i}
         }
         
-        resp = requests.post(f"{BASE_URL}/weights/", json=measurement_data)
+        resp = await client.post(f"{BASE_URL}/weights/", json=measurement_data)
         
         if resp.status_code == 201:
             print(f"   [{i}/10] O'lchandi: {measurement_data['estimated_weight_kg']} kg (Status: OK)")
         else:
             print(f"   [{i}/10] Xatolik: {resp.text}")
             
-        time.sleep(0.5) # Yarim sekund kutish
+        await asyncio.sleep(0.5) # Yarim sekund kutish
 
     # 3. Yakuniy statistika
     print("\n📊 Statistika olinmoqda...")
-    stats_resp = requests.get(f"{BASE_URL}/weights/animal/{animal_id}/stats")
+    stats_resp = await client.get(f"{BASE_URL}/weights/animal/{animal_id}/stats")
     print(stats_resp.json())
 
+async def main():
+    # Bitta klient — barcha so'rovlar bitta (keep-alive) ulanishdan o'tadi
+    async with httpx.AsyncClient(timeout=10.0) as client:
+        await run_simulation(client)
+
 if __name__ == "__main__":
     try:
-        run_simulation()
+        asyncio.run(main())
     except Exception as e:
         print(f"Xatolik (Server yoniqmi?): {e}")
-        print("Avval 'pip install requests' qiling")
\ No newline at end of file
+        print("Avval 'pip install httpx' qiling")
\ No newline at end of file
@@ -1,13 +1,16 @@
-import requests
-import time
+import asyncio
 import random
-import json
 from datetime import datetime, timezone
 
+import httpx
+
 # Backend manzili
 API_URL = "http://localhost:8000/api/v1/weights/"
 
-def generate_dummy_data():
+# Bir vaqtda ishlaydigan sun'iy kameralar soni
+CAMERAS = 3
+
+def generate_dummy_data(camera_id: str):
     """Sun'iy sigir ma'lumotlarini yaratish"""
     weight = round(random.uniform(350.0, 600.0), 1)
     confidence = round(random.uniform(0.90, 0.99), 2)
@@ -19,41 +22,45 @@ def generate_dummy_data():
         
         "estimated_weight_kg": weight,
         "confidence_score": confidence,
-        "camera_id": "CAM-01",
+        "camera_id": camera_id,
         
         # --- O'ZGARISH 2: Toshkent vaqtini emas, UTC vaqtini yuboramiz ---
         "timestamp": datetime.now(timezone.utc).isoformat()
     }
 
-def start_simulation():
-    print(f"🚀 Simulyatsiya boshlandi! Manzil: {API_URL}")
+async def camera(client: httpx.AsyncClient, index: int):
+    """Bitta kamera: har 2 sekundda o'lchov yuboradi"""
+    camera_id = f"CAM-{index + 1:02d}"
+    
+    while True:
+        data = generate_dummy_data(camera_id)
+        
+        try:
+            response = await client.post(API_URL, json=data)
+            
+            if response.status_code in [200, 201]:
+                print(f"✅ [{camera_id}] Yuborildi: {data['animal_tag_id']} -> {data['estimated_weight_kg']} kg")
+            else:
+                # Agar animal_id topilmasa (FK error), biz uni yaratishimiz kerak bo'ladi
+                print(f"⚠️ [{camera_id}] Xatolik ({response.status_code}): {response.text}")
+                
+        except httpx.ConnectError:
+            print(f"❌ [{camera_id}] Backendga ulanib bo'lmadi! (Docker ishlayaptimi?)")
+        
+        await asyncio.sleep(2)
+
+async def start_simulation():
+    print(f"🚀 Simulyatsiya boshlandi! Manzil: {API_URL} ({CAMERAS} ta kamera)")
     print("To'xtatish uchun: Ctrl + C")
     print("-" * 50)
 
-    try:
-        while True:
-            data = generate_dummy_data()
-            
-            try:
-                response = requests.post(API_URL, json=data)
-                
-                if response.status_code in [200, 201]:
-                    print(f"✅ Yuborildi: {data['animal_tag_id']} -> {data['estimated_weight_kg']} kg")
-                else:
-                    # Agar animal_id topilmasa (FK error), biz uni yaratishimiz kerak bo'ladi
-                    print(f"⚠️ Xatolik ({response.status_code}): {response.text}")
-                    
-            except requests.exceptions.ConnectionError:
-                print("❌ Backendga ulanib bo'lmadi! (Docker ishlayaptimi?)")
-            
-            time.sleep(2)
-            
-    except KeyboardInterrupt:
-        print("\n🛑 Simulyatsiya to'xtatildi.")
+    # Bitta klient — ulanishlar (keep-alive) barcha kameralar uchun qayta ishlatiladi
+    limits = httpx.Limits(max_keepalive_connections=CAMERAS, max_connections=CAMERAS)
+    async with httpx.AsyncClient(limits=limits, timeout=10.0) as client:
+        await asyncio.gather(*(camera(client, i) for i in range(CAMERAS)))
 
 if __name__ == "__main__":
     try:
-        start_simulation()
-    except ImportError:
-        print("Xatolik: 'requests' kutubxonasi o'rnatilmagan.")
-        print("Iltimos, uni o'rnating: pip install requests")
+        asyncio.run(start_simulation())
+    except KeyboardInterrupt:
+        print("\n🛑 Simulyatsiya to'xtatildi.")